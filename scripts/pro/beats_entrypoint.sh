@@ -4,4 +4,4 @@ echo "--> Waiting for db to be ready"
 ./wait-for-it.sh db:5432
 
 echo "--> Starting beats process"
-celery -A djshop.tasks beat -l info --scheduler django_celery_beat.schedulers:DatabaseScheduler
+celery -A src.config.celery beat -l info --scheduler django_celery_beat.schedulers:DatabaseScheduler
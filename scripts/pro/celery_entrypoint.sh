@@ -3,5 +3,9 @@
 echo "--> Waiting for db to be ready"
 ./wait-for-it.sh db:5432
 
+# The queues to consume, see `CELERY_TASK_ROUTES`, e.g. a dedicated
+# worker for the `media` queue.
+CELERY_QUEUES="${CELERY_QUEUES:-default,cache,media}"
+
 echo "--> Starting celery process"
-celery -A djshop.tasks worker -l info --without-gossip --without-mingle --without-heartbeat
+celery -A src.config.celery worker -Q "$CELERY_QUEUES" -l info --without-gossip --without-mingle --without-heartbeat
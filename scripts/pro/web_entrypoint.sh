@@ -3,13 +3,16 @@
 echo "--> Waiting for db to be ready"
 ./wait-for-it.sh db:5432
 
+# Collect (compress and hash) the static files first, `--clear` would delete
+# the schema file, and the web processes don't start without their manifest.
+echo "--> Collecting static files"
+python -m src.manage collectstatic --clear --noinput
+python -m src.manage build_schema
+
 # Apply database migrations
 echo "Apply database migrations"
-python manage.py makemigration
-python manage.py migrate
-python manage.py collectstatic --clear --noinput
-python manage.py collectstatic --noinput
+python -m src.manage migrate
 
-# Start server
+# Start server, see `src/config/gunicorn.py` for the server profile.
 echo "--> Starting web process"
-gunicorn config.wsgi:application -b 0.0.0.0:8000
+exec gunicorn -c python:src.config.gunicorn
@@ -11,5 +11,5 @@ os.environ.setdefault(
 )
 
 celery = Celery('config')
-celery.config_from_object('django.conf:django', namespace='CELERY')
+celery.config_from_object('django.conf:settings', namespace='CELERY')
 celery.autodiscover_tasks()
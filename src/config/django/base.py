@@ -23,6 +23,10 @@ LOCAL_APPS = [
     'src.djshop.authentication.apps.AuthenticationConfig',
     'src.djshop.media.apps.MediaConfig',
     'src.djshop.inventory.apps.InventoryConfig',
+    'src.djshop.cdn.apps.CdnConfig',
+    'src.djshop.metrics.apps.MetricsConfig',
+    'src.djshop.outbox.apps.OutboxConfig',
+    'src.djshop.maintenance.apps.MaintenanceConfig',
 ]
 
 THIRD_PARTY_APPS = [
@@ -36,6 +40,12 @@ THIRD_PARTY_APPS = [
     'treebeard',
 ]
 
+# Only used in development, left out of the production profile.
+DEVELOPMENT_APPS = [
+    'whitenoise.runserver_nostatic',
+    'django_extensions',
+]
+
 INSTALLED_APPS = [
     'django.contrib.admin',
     'django.contrib.auth',
@@ -51,8 +61,10 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'src.djshop.core.middleware.RequestInstrumentationMiddleware',
+    'src.djshop.core.middleware.PrimaryStickinessMiddleware',
     'corsheaders.middleware.CorsMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'src.djshop.core.middleware.AsyncWhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -94,9 +106,43 @@ DATABASES = {
         'PASSWORD': env('POSTGRES_PASSWORD'),
         'HOST': env('POSTGRES_HOST'),
         'PORT': env('POSTGRES_PORT'),
+        # Keep connections open between requests (and Celery tasks)
+        # instead of paying the connection handshake every time.
+        # https://docs.djangoproject.com/en/4.2/ref/databases/#persistent-connections
+        'CONN_MAX_AGE': env.int('POSTGRES_CONN_MAX_AGE', default=60),
+        'CONN_HEALTH_CHECKS': env.bool('POSTGRES_CONN_HEALTH_CHECKS', default=True),
+        # Server-side cursors don't survive PgBouncer transaction pooling.
+        # https://docs.djangoproject.com/en/4.2/ref/databases/#transaction-pooling-server-side-cursors
+        'DISABLE_SERVER_SIDE_CURSORS': env.bool(
+            'POSTGRES_PGBOUNCER_TRANSACTION_POOLING', default=False
+        ),
+        'OPTIONS': {
+            'connect_timeout': env.int('POSTGRES_CONNECT_TIMEOUT', default=5),
+        },
     }
 }
 
+# Read replicas, used by the read-only (front) selectors.
+# https://docs.djangoproject.com/en/4.2/topics/db/multi-db/
+DATABASE_REPLICAS = []
+
+for replica_number, replica_host in enumerate(
+        env.list('POSTGRES_REPLICA_HOSTS', default=[]), start=1
+):
+    DATABASES[f'replica_{replica_number}'] = {
+        **DATABASES['default'],
+        'HOST': replica_host,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica_{replica_number}')
+
+DATABASE_ROUTERS = ['src.djshop.utils.db.routers.PrimaryReplicaRouter']
+
+# How long a client keeps reading from the primary after a write.
+DATABASE_PRIMARY_STICKINESS_SECONDS = env.int(
+    'DATABASE_PRIMARY_STICKINESS_SECONDS', default=10
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
@@ -139,7 +185,7 @@ STATIC_URL = '/static/'
 
 MEDIA_ROOT = '/vol/web/media/'
 MEDIA_URL = '/media/'
-# STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# The production static files are compressed and hashed, see `production.py`.
 
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
@@ -155,7 +201,7 @@ REST_FRAMEWORK = {
 # Redis
 CACHES = {
     'default': {
-        'BACKEND': 'django_redis.cache.RedisCache',
+        'BACKEND': 'src.djshop.metrics.cache.InstrumentedRedisCache',
         'LOCATION': env("REDIS_LOCATION", default="redis://localhost:6379"),
     }
 }
@@ -167,9 +213,15 @@ APP_DOMAIN = env("APP_DOMAIN", default="http://localhost:8000")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+from src.config.settings.cdn import *  # noqa
 from src.config.settings.celery import *  # noqa
 from src.config.settings.cors import *  # noqa
+from src.config.settings.instrumentation import *  # noqa
 from src.config.settings.jwt import *  # noqa
+from src.config.settings.maintenance import *  # noqa
+from src.config.settings.media import *  # noqa
+from src.config.settings.metrics import *  # noqa
+from src.config.settings.outbox import *  # noqa
 from src.config.settings.sessions import *  # noqa
 from src.config.settings.swagger import *  # noqa
 
@@ -1,12 +1,37 @@
 from src.config.env import env
 
 from .base import *  # noqa
+from .base import DEVELOPMENT_APPS, INSTALLED_APPS
 
 
 DEBUG = False
 
+# Start-up profile, see `python -m src.manage profile_startup`:
+# - the development apps are left out;
+# - the admin modules aren't autodiscovered by `django.setup()`, but by
+#   the URLconf, so the Celery workers and the management commands don't
+#   import them.
+INSTALLED_APPS = [
+    'django.contrib.admin.apps.SimpleAdminConfig' if app == 'django.contrib.admin'
+    else app
+    for app in INSTALLED_APPS if app not in DEVELOPMENT_APPS
+]
+
 SECRET_KEY = env('SECRET_KEY')
 
+# `collectstatic` writes hashed file names (served with an immutable
+# `Cache-Control` by WhiteNoise) and their gzip and brotli versions, so
+# serving a static file is a lookup in memory.
+# http://whitenoise.evans.io/en/stable/django.html#add-compression-and-caching-support
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
 ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=[])
 
 CORS_ALLOW_ALL_ORIGINS = False
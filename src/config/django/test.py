@@ -8,12 +8,17 @@ DEBUG = False
 PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
 
 CELERY_BROKER_BACKEND = "memory"
+CELERY_RESULT_BACKEND = 'cache+memory://'
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
+# There is no relay process, the events are relayed once they are committed.
+OUTBOX_RELAY_ON_COMMIT = True
+
+QUERY_BUDGET_STRICT = True
 
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "src.djshop.metrics.cache.InstrumentedLocMemCache",
     }
 }
 
@@ -21,5 +26,13 @@ DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": "db.sqlite3",
-        }
+        },
+        "replica": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": "db.sqlite3",
+            "TEST": {"MIRROR": "default"},
+        },
     }
+
+# Reads go to the primary, unless a test enables the replica.
+DATABASE_REPLICAS = []
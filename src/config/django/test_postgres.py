@@ -0,0 +1,20 @@
+from .base import DATABASES as POSTGRES_DATABASES
+from .test import *  # noqa
+
+
+# Run the test suite against the PostgreSQL database of the environment
+# (the `db` service of docker-compose.dev.yml), e.g.
+# `pytest -c configs/pytest.ini --ds=src.config.django.test_postgres -n auto`.
+# Each xdist worker gets a clone of a migrated template database.
+
+DATABASES = {
+    "default": {
+        **POSTGRES_DATABASES["default"],
+        "CONN_MAX_AGE": 0,
+    },
+    "replica": {
+        **POSTGRES_DATABASES["default"],
+        "CONN_MAX_AGE": 0,
+        "TEST": {"MIRROR": "default"},
+    },
+}
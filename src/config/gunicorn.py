@@ -0,0 +1,244 @@
+"""
+Gunicorn production server profile.
+
+    gunicorn -c python:src.config.gunicorn
+
+The number of workers and threads is derived from the CPUs and the memory
+available to the container (cgroup limits included), and can be overridden
+with the `GUNICORN_*` environment variables. The application is loaded and
+warmed up in the master process before forking (`preload_app`), so the
+workers share its memory copy-on-write and the first request after a
+deploy doesn't pay the Django start-up.
+
+Set `GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker` to serve the ASGI
+application (and the async views) instead of the WSGI one.
+
+https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import gc
+import math
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from src.config.env import env
+
+
+CGROUP_ROOT = Path('/sys/fs/cgroup')
+
+ASGI_WORKER_CLASSES = ('uvicorn.workers.UvicornWorker',)
+
+
+def read_cgroup_value(*paths: str) -> Optional[str]:
+
+    """
+    Read the first existing cgroup (v2 or v1) file.
+
+    :param paths: The paths of the files, relative to the cgroup root.
+    :return: Optional[str]: The stripped content of the file, None if
+        none exists.
+    """
+
+    for path in paths:
+        try:
+            return (CGROUP_ROOT / path).read_text().strip()
+        except OSError:
+            continue
+
+    return None
+
+
+def get_cpu_count() -> int:
+
+    """
+    Return the number of CPUs the process may use, capped by the CPU quota
+    of its cgroup (e.g. `docker run --cpus`).
+
+    :return: int: The number of available CPUs, at least 1.
+    """
+
+    try:
+        cpu_count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpu_count = os.cpu_count() or 1
+
+    cpu_max = read_cgroup_value('cpu.max')
+    if cpu_max is not None:
+        quota, _, period = cpu_max.partition(' ')
+    else:
+        quota = read_cgroup_value('cpu/cpu.cfs_quota_us') or 'max'
+        period = read_cgroup_value('cpu/cpu.cfs_period_us') or '100000'
+
+    if quota not in ('max', '-1') and int(period) > 0:
+        cpu_count = min(cpu_count, math.ceil(int(quota) / int(period)))
+
+    return max(cpu_count, 1)
+
+
+def get_memory_bytes() -> int:
+
+    """
+    Return the memory the process may use, capped by the memory limit
+    of its cgroup.
+
+    :return: int: The available memory, in bytes.
+    """
+
+    memory_bytes = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+
+    memory_limit = read_cgroup_value(
+        'memory.max', 'memory/memory.limit_in_bytes'
+    )
+    if memory_limit is not None and memory_limit.isdigit():
+        # cgroup v1 reports a huge number instead of no limit.
+        memory_bytes = min(memory_bytes, int(memory_limit))
+
+    return memory_bytes
+
+
+def get_worker_count(
+    *, cpu_count: int, memory_bytes: int, worker_memory_bytes: int,
+    workers_per_cpu: int = 2
+) -> int:
+
+    """
+    Size the worker processes: `workers_per_cpu` per CPU plus one, as long
+    as they fit in memory.
+
+    :param cpu_count: The number of available CPUs.
+    :param memory_bytes: The available memory, in bytes.
+    :param worker_memory_bytes: The memory budget of a worker, in bytes.
+    :param workers_per_cpu: The number of workers per CPU.
+    :return: int: The number of workers, at least 1.
+    """
+
+    cpu_workers = workers_per_cpu * cpu_count + 1
+    memory_workers = memory_bytes // worker_memory_bytes
+
+    return max(min(cpu_workers, memory_workers), 1)
+
+
+def get_thread_count(
+    *, cpu_count: int, workers: int, concurrency_per_cpu: int
+) -> int:
+
+    """
+    Size the threads of each worker, so the workers together handle
+    `concurrency_per_cpu` requests per CPU. Threads share the memory of
+    their worker, so they make up for the workers which don't fit in memory.
+
+    Every thread may hold a database connection, so `workers * threads`
+    must stay below what the database (or PgBouncer) accepts.
+
+    :param cpu_count: The number of available CPUs.
+    :param workers: The number of workers.
+    :param concurrency_per_cpu: The number of concurrent requests per CPU.
+    :return: int: The number of threads of each worker, at least 1.
+    """
+
+    return max(math.ceil(concurrency_per_cpu * cpu_count / workers), 1)
+
+
+# Server socket and application.
+
+bind = env('GUNICORN_BIND', default='0.0.0.0:8000')
+worker_class = env('GUNICORN_WORKER_CLASS', default='gthread')
+wsgi_app = (
+    'src.config.asgi:application' if worker_class in ASGI_WORKER_CLASSES
+    else 'src.config.wsgi:application'
+)
+
+# Worker processes, sized from the CPUs and the memory of the container.
+
+cpu_count = get_cpu_count()
+
+workers = env.int('GUNICORN_WORKERS', default=0) or get_worker_count(
+    cpu_count=cpu_count, memory_bytes=get_memory_bytes(),
+    worker_memory_bytes=env.int('GUNICORN_WORKER_MEMORY_MB', default=256) * 2**20
+)
+# Async workers handle their concurrency in an event loop, not threads.
+threads = env.int('GUNICORN_THREADS', default=0) or (
+    1 if worker_class in ASGI_WORKER_CLASSES else get_thread_count(
+        cpu_count=cpu_count, workers=workers,
+        concurrency_per_cpu=env.int('GUNICORN_CONCURRENCY_PER_CPU', default=4)
+    )
+)
+
+# Load the application once in the master, shared copy-on-write by the workers.
+preload_app = env.bool('GUNICORN_PRELOAD_APP', default=True)
+
+# Restart the workers after a jittered number of requests, to cap the memory
+# growth (leaks, fragmentation) without restarting them all at once.
+max_requests = env.int('GUNICORN_MAX_REQUESTS', default=1000)
+max_requests_jitter = env.int('GUNICORN_MAX_REQUESTS_JITTER', default=100)
+
+# A silent worker is killed after `timeout`, and on a restart or a deploy,
+# the workers get `graceful_timeout` (by default, `timeout` too) to finish
+# their requests before they are killed.
+timeout = env.int('GUNICORN_TIMEOUT', default=30)
+graceful_timeout = env.int('GUNICORN_GRACEFUL_TIMEOUT', default=timeout)
+keepalive = env.int('GUNICORN_KEEPALIVE', default=5)
+
+# The worker heartbeat files, in memory rather than on the (overlay) disk.
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# The requests are already logged by `RequestInstrumentationMiddleware`.
+accesslog = env('GUNICORN_ACCESS_LOG', default=None)
+errorlog = '-'
+loglevel = env('GUNICORN_LOG_LEVEL', default='info')
+
+
+# Server hooks.
+
+def when_ready(server: Any) -> None:
+
+    """
+    Warm the preloaded application up in the master, before the workers
+    are forked, and move its objects out of the garbage collector's reach,
+    so the collections in the workers don't copy the shared memory pages.
+
+    :param server: The gunicorn arbiter.
+    """
+
+    if not server.cfg.preload_app:
+        return
+
+    from src.djshop.core.warmup import warm_up
+
+    warm_up()
+    gc.freeze()
+
+
+def post_worker_init(worker: Any) -> None:
+
+    """
+    Warm the application up in every worker, when it isn't preloaded.
+
+    :param worker: The gunicorn worker.
+    """
+
+    if worker.cfg.preload_app:
+        return
+
+    from src.djshop.core.warmup import warm_up
+
+    warm_up()
+
+
+def child_exit(server: Any, worker: Any) -> None:
+
+    """
+    Remove the Prometheus metrics of an exited worker from the live
+    gauges of the multiprocess mode.
+
+    :param server: The gunicorn arbiter.
+    :param worker: The exited gunicorn worker.
+    """
+
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return
+
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)  # type: ignore[no-untyped-call]
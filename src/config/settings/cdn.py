@@ -0,0 +1,12 @@
+from src.config.env import env
+
+
+# Edge cache (CDN / reverse proxy) purging.
+# The local backend only records the purged surrogate keys, use
+# `src.djshop.cdn.backends.HTTPPurgeBackend` in front of a real edge cache.
+CDN_PURGE_BACKEND = env(
+    'CDN_PURGE_BACKEND', default='src.djshop.cdn.backends.LocalPurgeBackend'
+)
+CDN_PURGE_URL = env('CDN_PURGE_URL', default='')
+CDN_PURGE_TOKEN = env('CDN_PURGE_TOKEN', default='')
+CDN_PURGE_TIMEOUT = env.int('CDN_PURGE_TIMEOUT', default=5)  # seconds
@@ -0,0 +1,11 @@
+from src.config.env import env
+
+
+# Per-request query count, SQL time and N+1 detection,
+# see `src.djshop.core.middleware.RequestInstrumentationMiddleware`.
+REQUEST_INSTRUMENTATION_ENABLED = env.bool(
+    'REQUEST_INSTRUMENTATION_ENABLED', default=True
+)
+
+# Raise instead of logging a warning when a view exceeds its query budget.
+QUERY_BUDGET_STRICT = env.bool('QUERY_BUDGET_STRICT', default=False)
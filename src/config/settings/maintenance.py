@@ -0,0 +1,13 @@
+from src.config.env import env
+
+
+# Number of rows a maintenance job loads and repairs at once, see
+# `src.djshop.maintenance`.
+MAINTENANCE_CHUNK_SIZE = env.int('MAINTENANCE_CHUNK_SIZE', default=1000)
+# Time limits of the nightly maintenance tasks. A task stopped by its soft
+# time limit is sent again, and resumes from its checkpoint, up to
+# `MAINTENANCE_TASK_MAX_RESUMES` times. A task killed by its hard time
+# limit isn't: its next nightly run resumes from the checkpoint.
+MAINTENANCE_TASK_SOFT_TIME_LIMIT = 60 * 30  # seconds
+MAINTENANCE_TASK_TIME_LIMIT = 60 * 35  # seconds
+MAINTENANCE_TASK_MAX_RESUMES = 3
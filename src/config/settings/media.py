@@ -0,0 +1,4 @@
+# Widths of the resized copies of the uploaded images, generated by
+# `src.djshop.media.tasks.create_image_renditions_task`.
+IMAGE_RENDITION_WIDTHS = [320, 640, 1280]
+IMAGE_RENDITION_QUALITY = 85
@@ -0,0 +1,9 @@
+from src.config.env import env
+
+
+# Clients allowed to scrape the internal `/metrics` endpoint. The addresses
+# are matched against `REMOTE_ADDR`, which is the address of the proxy when
+# the app runs behind one on the same host, so by default only scrapers
+# sending the token are allowed.
+METRICS_ALLOWED_IPS = env.list('METRICS_ALLOWED_IPS', default=[])
+METRICS_AUTH_TOKEN = env('METRICS_AUTH_TOKEN', default='')
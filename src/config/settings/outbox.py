@@ -0,0 +1,26 @@
+from src.config.env import env
+
+
+# The Celery task of every outbox topic, see `src.djshop.outbox`.
+OUTBOX_TOPICS = {
+    'cdn.purge': 'src.djshop.cdn.tasks.purge_surrogate_keys_task',
+    'media.renditions': 'src.djshop.media.tasks.create_image_renditions_task',
+}
+
+# Maximum number of events published by one relay iteration.
+OUTBOX_RELAY_BATCH_SIZE = env.int('OUTBOX_RELAY_BATCH_SIZE', default=500)
+# Pause of the relay process once the outbox is drained.
+OUTBOX_RELAY_POLL_INTERVAL = env.float('OUTBOX_RELAY_POLL_INTERVAL', default=1.0)
+# Whether a transaction writing events also sends a message relaying them
+# right away. The relay process publishes them anyway, so it is off by
+# default, to keep the broker out of the request path.
+OUTBOX_RELAY_ON_COMMIT = env.bool('OUTBOX_RELAY_ON_COMMIT', default=False)
+# Number of failed publication attempts after which an event is given up
+# (it stays in the outbox, see its `last_error`).
+OUTBOX_MAX_ATTEMPTS = env.int('OUTBOX_MAX_ATTEMPTS', default=10)
+# Delay before the first retry of an event, doubled after every failed
+# attempt, up to `OUTBOX_RETRY_MAX_DELAY`.
+OUTBOX_RETRY_DELAY = env.float('OUTBOX_RETRY_DELAY', default=5.0)  # seconds
+OUTBOX_RETRY_MAX_DELAY = 60 * 60  # seconds
+# How long the published events are kept.
+OUTBOX_RETENTION = 60 * 60 * 24 * 7  # seconds
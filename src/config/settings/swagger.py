@@ -3,3 +3,9 @@ SPECTACULAR_SETTINGS = {
     'VERSION': '1.0.0',
     'SERVE_INCLUDE_SCHEMA': False,
 }
+
+# The production schema is generated once, by `python -m src.manage build_schema`,
+# into this versioned file of the `STATIC_ROOT`, and served from memory. The
+# schema is only generated on every request in DEBUG.
+SPECTACULAR_SCHEMA_FILE = f'schema/openapi-{SPECTACULAR_SETTINGS["VERSION"]}.json'
+SPECTACULAR_SCHEMA_MAX_AGE = 60 * 60  # seconds
@@ -2,28 +2,42 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import (
-    SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView,
-)
 
+from src.djshop.api.views import schema_view
+from src.djshop.core.views import database_connections_admin_view
+from src.djshop.metrics.views import metrics_view
+from src.djshop.utils.views import lazy_view
+
+
+# The production profile only autodiscovers the admin modules here, so they
+# are loaded by the web processes only, see `src.config.django.production`.
+admin.autodiscover()
 
 urlpatterns = [
-    path(
-        route="schema/",
-        view=SpectacularAPIView.as_view(api_version="v1"),
-        name="schema"
-    ),
+    # The schema is pre-generated, see `src.djshop.api.schema`, and the
+    # documentation pages are imported on their first request.
+    path(route="schema/", view=schema_view, name="schema"),
     path(
         route="",
-        view=SpectacularSwaggerView.as_view(url_name="schema"),
+        view=lazy_view(
+            'drf_spectacular.views.SpectacularSwaggerView', url_name="schema"
+        ),
         name="swagger-ui"
     ),
     path(
         route="redoc/",
-        view=SpectacularRedocView.as_view(url_name="schema"),
+        view=lazy_view(
+            'drf_spectacular.views.SpectacularRedocView', url_name="schema"
+        ),
         name="redoc"
     ),
+    path(
+        route='admin/database-connections/',
+        view=admin.site.admin_view(database_connections_admin_view),
+        name='admin-database-connections'
+    ),
     path(route='admin/', view=admin.site.urls),
+    path(route='metrics/', view=metrics_view, name='metrics'),
     path(route='api/', view=include(('src.djshop.api.urls', 'api'))),
 ]
 
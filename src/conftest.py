@@ -1,13 +1,71 @@
 """
 Conftest for tests
 """
+import os
+import tempfile
+import uuid
 from datetime import datetime
+from pathlib import Path
 from typing import Generator
 
 import pytest
 from django.test import Client
+from django.test.utils import teardown_databases
+from pytest_django import DjangoDbBlocker
 from rest_framework.test import APIClient, APIRequestFactory
 
+from src.djshop.tests.databases import (
+    get_rebuilt_marker_path, setup_template_databases,
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+
+    """
+    Give the test run an id shared by the pytest-xdist controller and its
+    workers, so the controller can clean the run up once the workers are
+    done. xdist generates one only when the controller doesn't pass it.
+    """
+
+    if not hasattr(config, 'workerinput') and \
+            getattr(config.option, 'testrunuid', None) is None:
+        config.option.testrunuid = uuid.uuid4().hex
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+
+    """
+    Remove the template rebuild marker of the test run, once every worker
+    has set up its databases.
+    """
+
+    if hasattr(session.config, 'workerinput'):
+        return
+
+    get_rebuilt_marker_path(
+        cache_dir=get_template_databases_dir(config=session.config),
+        run_id=session.config.option.testrunuid
+    ).unlink(missing_ok=True)
+
+
+def get_template_databases_dir(*, config: pytest.Config) -> Path:
+
+    """
+    Return the directory of the template databases lock and files.
+
+    :param config: The pytest config.
+    :return: Path: The pytest cache directory of the templates, or
+        a temporary directory without the cache plugin.
+    """
+
+    cache = getattr(config, 'cache', None)
+    if cache is not None:
+        return Path(cache.mkdir('template_databases'))
+
+    cache_dir = Path(tempfile.gettempdir()) / 'djshop_template_databases'
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
 
 @pytest.fixture
 def api_client() -> 'APIClient':
@@ -67,6 +125,40 @@ def time_tracker() -> Generator[None, None, None]:
     print(f'\n runtime: {diff.total_seconds()}')
 
 
+@pytest.fixture(scope='session')
+def django_db_setup(
+    request: pytest.FixtureRequest,
+    django_test_environment: None,
+    django_db_blocker: DjangoDbBlocker,
+    django_db_createdb: bool,
+    django_db_modify_db_settings: None,
+) -> Generator[None, None, None]:
+
+    """
+    Override of the pytest-django fixture setting up the test databases.
+
+    The test databases of each pytest-xdist worker are copied from template
+    databases, migrated once and kept in the pytest cache between runs
+    (see `src.djshop.tests.databases`). `--create-db` rebuilds the templates.
+    """
+
+    workerinput = getattr(request.config, 'workerinput', {})
+    verbosity = request.config.option.verbose
+
+    with django_db_blocker.unblock():
+        databases_config = setup_template_databases(
+            cache_dir=get_template_databases_dir(config=request.config),
+            worker_id=os.environ.get('PYTEST_XDIST_WORKER', 'main'),
+            run_id=workerinput.get('testrunuid', request.config.option.testrunuid),
+            rebuild=django_db_createdb, verbosity=verbosity
+        )
+
+    yield
+
+    with django_db_blocker.unblock():
+        teardown_databases(databases_config, verbosity=verbosity)
+
+
 from src.djshop.tests.fixtures.attribute_fixtures import *  # noqa
 from src.djshop.tests.fixtures.category_fixtures import *  # noqa
 from src.djshop.tests.fixtures.media_fixtures import *  # noqa
@@ -0,0 +1,220 @@
+from typing import Any, List, Optional, Type, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import (
+    ObjectDoesNotExist, PermissionDenied, ValidationError as DjangoValidationError,
+)
+from django.http import Http404, HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import patch_cache_control
+from django.views import View
+from rest_framework.exceptions import APIException
+
+from src.djshop.api.conditional import (
+    evaluate_conditional_headers, get_resource_etag, set_resource_validators,
+)
+from src.djshop.api.exception_handlers import hacksoft_proposed_exception_handler
+from src.djshop.api.mixins import QueryBudgetMixin
+from src.djshop.api.renderers import ORJSONRenderer
+from src.djshop.cdn.mixins import CachePolicyMixin
+from src.djshop.common.types import ResourceVersion
+
+
+class AsyncReadAPIView(QueryBudgetMixin, CachePolicyMixin, View):
+
+    """
+    Base of the async read-only API views, served without a thread by
+    an ASGI server.
+
+    DRF views are sync only, so these are plain Django views with
+    `async def` handlers. They keep the behaviour of the DRF read views:
+    orjson rendering, conditional requests, the caching policy and
+    the error format of `hacksoft_proposed_exception_handler`. There is
+    no authentication nor content negotiation, so they only fit public
+    JSON endpoints.
+
+    The rendered bodies are stored in the cache (Redis in production),
+    keyed by their ETag, so a fresh copy is served after the version
+    query only. A changed resource gets a new ETag, so the stale bodies
+    are never served and just expire after `CACHE_TTL`.
+
+    Attributes:
+        renderer_class (Type[ORJSONRenderer]): The renderer of the bodies.
+        body_cache_prefix (Optional[str]): The prefix of the cache keys of
+            the rendered bodies, the bodies aren't cached when None.
+    """
+
+    http_method_names = ['get', 'head', 'options']
+
+    renderer_class: Type[ORJSONRenderer] = ORJSONRenderer
+    body_cache_prefix: Optional[str] = None
+
+    handled_exceptions = (
+        DjangoValidationError, Http404, PermissionDenied, APIException,
+        ObjectDoesNotExist
+    )
+
+    def render(self, *, data: Any, status: int = 200) -> HttpResponse:
+
+        """
+        Render data into a JSON response.
+
+        :param data: The data to be rendered.
+        :param status: The status code of the response.
+        :return: HttpResponse: The rendered response.
+        """
+
+        return HttpResponse(
+            content=self.renderer_class().render(data), status=status,
+            content_type=self.renderer_class.media_type
+        )
+
+    def render_exception(
+            self, *, request: HttpRequest,
+            exc: Union[
+                DjangoValidationError, Http404, PermissionDenied, APIException,
+                ObjectDoesNotExist
+            ]
+    ) -> HttpResponse:
+
+        """
+        Render an exception the same way as the DRF views do.
+
+        :param request: The request object.
+        :param exc: The exception raised while handling the request.
+        :return: HttpResponse: The rendered error response.
+        """
+
+        exception_response = hacksoft_proposed_exception_handler(
+            exc=exc, ctx={'request': request, 'view': self}
+        )
+
+        assert exception_response is not None
+        return self.render(
+            data=exception_response.data, status=exception_response.status_code
+        )
+
+    async def get_versioned_response(
+            self, *, request: HttpRequest, resource_version: ResourceVersion,
+            **kwargs: Any
+    ) -> HttpResponseBase:
+
+        """
+        Answer a conditional request from the resource version, or render
+        the resource (from the cache if possible) with its validators and
+        caching policy.
+
+        :param request: The request object.
+        :param resource_version: The current version of the requested resource.
+        :param kwargs: The keyword arguments of `get_data`.
+        :return: HttpResponseBase: The response object.
+        """
+
+        etag = get_resource_etag(request=request, resource_version=resource_version)
+
+        conditional_response = evaluate_conditional_headers(
+            request=request, etag=etag, resource_version=resource_version
+        )
+        if conditional_response is not None:
+            return self.finalize(
+                request=request, response=conditional_response, surrogate_keys=[]
+            )
+
+        cache_key = None
+        if self.body_cache_prefix is not None:
+            cache_key = ':'.join([self.body_cache_prefix, etag.strip('"')])
+            cached_body = await cache.aget(cache_key)
+
+            if cached_body is not None:
+                content, surrogate_keys = cached_body
+                response = HttpResponse(
+                    content=content, content_type=self.renderer_class.media_type
+                )
+                return self.finalize(
+                    request=request,
+                    response=set_resource_validators(
+                        response=response, etag=etag,
+                        resource_version=resource_version
+                    ),
+                    surrogate_keys=surrogate_keys
+                )
+
+        try:
+            data = await self.get_data(request=request, **kwargs)
+
+        except self.handled_exceptions as exc:
+            return self.render_exception(request=request, exc=exc)
+
+        response = self.render(data=data)
+        surrogate_keys = self.get_data_surrogate_keys(data=data)
+
+        if cache_key is not None:
+            await cache.aset(
+                cache_key, (response.content, surrogate_keys),
+                timeout=settings.CACHE_TTL
+            )
+
+        return self.finalize(
+            request=request,
+            response=set_resource_validators(
+                response=response, etag=etag, resource_version=resource_version
+            ),
+            surrogate_keys=surrogate_keys
+        )
+
+    async def get_data(self, *, request: HttpRequest, **kwargs: Any) -> Any:
+
+        """
+        Fetch the representation of the requested resource.
+
+        :param request: The request object.
+        :param kwargs: The keyword arguments of the view.
+        :return: Any: The data to be rendered.
+        """
+
+        raise NotImplementedError
+
+    def get_data_surrogate_keys(self, *, data: Any) -> List[str]:
+
+        """
+        Return the surrogate keys of the objects in the rendered data.
+
+        :param data: The rendered data.
+        :return: List[str]: The surrogate keys of the response.
+        """
+
+        return []
+
+    def finalize(
+            self, *, request: HttpRequest, response: HttpResponseBase,
+            surrogate_keys: List[str]
+    ) -> HttpResponseBase:
+
+        """
+        Apply the caching policy of `CachePolicyMixin` to the response.
+
+        Without an authentication step, the requests carrying credentials
+        (an `Authorization` header or a session cookie) are the ones
+        marked as private.
+
+        :param request: The request object.
+        :param response: The response object.
+        :param surrogate_keys: The surrogate keys of the response.
+        :return: HttpResponseBase: The response with the caching headers set.
+        """
+
+        if self.cache_max_age is None or request.method not in ('GET', 'HEAD') or \
+                response.status_code not in self.cacheable_status_codes:
+            return response
+
+        if 'Authorization' in request.headers or \
+                settings.SESSION_COOKIE_NAME in request.COOKIES:
+            patch_cache_control(response, private=True)
+            return response
+
+        self.patch_public_cache_policy(
+            response=response, surrogate_keys=surrogate_keys
+        )
+
+        return response
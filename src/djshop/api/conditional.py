@@ -0,0 +1,192 @@
+import hashlib
+from typing import Optional, TypeVar, Union
+
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from src.djshop.common.types import ResourceVersion
+
+
+# The helpers serve the DRF views as well as the plain async views.
+AnyRequest = Union[Request, HttpRequest]
+ResponseType = TypeVar('ResponseType', bound=HttpResponseBase)
+
+
+def get_resource_etag(
+    *, request: AnyRequest, resource_version: ResourceVersion
+) -> str:
+
+    """
+    Build a strong ETag for the representation of a resource.
+
+    The ETag covers the resource version plus everything else the body
+    depends on: the full path (pagination and filter query parameters)
+    and the negotiated media type (JSON for the views without
+    content negotiation).
+
+    :param request: The request object.
+    :param resource_version: The version of the requested resource.
+
+    :return: str: The quoted ETag value.
+    """
+
+    last_modified = resource_version.last_modified
+    etag_key = '|'.join([
+        request.get_full_path(),
+        str(getattr(request, 'accepted_media_type', 'application/json')),
+        resource_version.fingerprint,
+        last_modified.isoformat() if last_modified is not None else '',
+    ])
+
+    return f'"{hashlib.sha1(etag_key.encode()).hexdigest()}"'
+
+
+def set_resource_validators(
+    *, response: ResponseType, etag: str, resource_version: ResourceVersion
+) -> ResponseType:
+
+    """
+    Set the `ETag` and `Last-Modified` headers of a response.
+
+    :param response: The response to be sent to the client.
+    :param etag: The ETag of the representation.
+    :param resource_version: The version of the requested resource.
+
+    :return: ResponseType: The same response with the validator headers set.
+    """
+
+    response['ETag'] = etag
+
+    if resource_version.last_modified is not None:
+        response['Last-Modified'] = http_date(
+            resource_version.last_modified.timestamp()
+        )
+
+    patch_vary_headers(response, ('Accept',))
+
+    return response
+
+
+def evaluate_conditional_headers(
+    *, request: AnyRequest, etag: str, resource_version: ResourceVersion
+) -> Optional[HttpResponseBase]:
+
+    """
+    Evaluate the conditional request headers with Django, for the views
+    rendering plain Django responses.
+
+    :param request: The request object.
+    :param etag: The current ETag of the representation.
+    :param resource_version: The current version of the requested resource.
+
+    :return: Optional[HttpResponseBase]: A `304 Not Modified` (or `412
+        Precondition Failed`) response, otherwise None.
+    """
+
+    last_modified = resource_version.last_modified
+
+    conditional_response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=(
+            int(last_modified.timestamp()) if last_modified is not None else None
+        ),
+    )
+
+    if conditional_response is None:
+        return None
+
+    return set_resource_validators(
+        response=conditional_response, etag=etag,
+        resource_version=resource_version
+    )
+
+
+def get_not_modified_response(
+    *, request: Request, etag: str, resource_version: ResourceVersion
+) -> Optional[Response]:
+
+    """
+    Evaluate the `If-None-Match` and `If-Modified-Since` request headers.
+
+    This is meant to be called before running the selector of a read
+    endpoint, so an unchanged resource costs a single aggregate query.
+
+    :param request: The request object.
+    :param etag: The current ETag of the representation.
+    :param resource_version: The current version of the requested resource.
+
+    :return: Optional[Response]: A `304 Not Modified` response if the client's
+        copy is still fresh, otherwise None.
+    """
+
+    conditional_response = evaluate_conditional_headers(
+        request=request, etag=etag, resource_version=resource_version
+    )
+
+    if conditional_response is None:
+        return None
+
+    not_modified_response = Response(status=conditional_response.status_code)
+
+    return set_resource_validators(
+        response=not_modified_response, etag=etag,
+        resource_version=resource_version
+    )
+
+
+def get_precondition_failed_response(
+    *, request: Request, etag: str, resource_version: ResourceVersion
+) -> Optional[Response]:
+
+    """
+    Evaluate the `If-Match` and `If-Unmodified-Since` request headers
+    of an update.
+
+    The preconditions are only checked for an existing resource, so
+    updating a missing one still fails with `404 Not Found`.
+
+    :param request: The request object.
+    :param etag: The current ETag of the representation.
+    :param resource_version: The current version of the updated resource.
+
+    :return: Optional[Response]: A `412 Precondition Failed` response if the
+        client's copy is stale, otherwise None.
+    """
+
+    if resource_version.version is None:
+        return None
+
+    # For the unsafe methods, Django's evaluation of the conditional
+    # headers fails with `412` instead of `304`.
+    return get_not_modified_response(
+        request=request, etag=etag, resource_version=resource_version
+    )
+
+
+def get_if_match_version(
+    *, request: Request, resource_version: ResourceVersion
+) -> Optional[int]:
+
+    """
+    Return the version the update is conditioned on, once the `If-Match`
+    header was checked by `get_precondition_failed_response`.
+
+    Passing it to the conditional `UPDATE` closes the race between
+    the precondition check and the update.
+
+    :param request: The request object.
+    :param resource_version: The current version of the updated resource.
+
+    :return: Optional[int]: The expected version of the resource,
+        None if the update isn't conditional.
+    """
+
+    if 'If-Match' not in request.headers:
+        return None
+
+    return resource_version.version
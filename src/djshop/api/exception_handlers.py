@@ -5,12 +5,36 @@ from django.core.exceptions import (
 )
 from django.db.utils import IntegrityError
 from django.http import Http404
-from rest_framework import exceptions
+from rest_framework import exceptions, status
 from rest_framework.response import Response
 from rest_framework.serializers import as_serializer_error
 from rest_framework.views import exception_handler
 
-from src.djshop.core.exceptions import ApplicationError
+from src.djshop.core.exceptions import (
+    ApplicationError, ConcurrentTreeChangeError, ConcurrentUpdateError,
+)
+
+
+class PreconditionFailed(exceptions.APIException):
+
+    """
+    Exception for the updates made on a stale version of a resource.
+    """
+
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'The resource has been changed since it was read.'
+    default_code = 'precondition_failed'
+
+
+class Conflict(exceptions.APIException):
+
+    """
+    Exception for the changes colliding with a concurrent change.
+    """
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'The resource was changed concurrently, try again.'
+    default_code = 'conflict'
 
 
 def drf_default_with_modifications_exception_handler(
@@ -37,6 +61,12 @@ def drf_default_with_modifications_exception_handler(
     if isinstance(exc, PermissionDenied):
         exc = exceptions.PermissionDenied()
 
+    if isinstance(exc, ConcurrentUpdateError):
+        exc = PreconditionFailed(exc.message)
+
+    if isinstance(exc, ConcurrentTreeChangeError):
+        exc = Conflict(exc.message)
+
     response = exception_handler(exc, ctx)
 
     # If unexpected error occurs (server error, etc.)
@@ -54,7 +84,8 @@ def drf_default_with_modifications_exception_handler(
 def hacksoft_proposed_exception_handler(
     exc: Union[
         DjangoValidationError, Http404, PermissionDenied, exceptions.APIException,
-        ObjectDoesNotExist, IntegrityError
+        ObjectDoesNotExist, IntegrityError, ConcurrentUpdateError,
+        ConcurrentTreeChangeError
     ],
     ctx: Dict[str, Any]
 ) -> Optional[Response]:
@@ -90,6 +121,14 @@ def hacksoft_proposed_exception_handler(
     if isinstance(exc, PermissionDenied):
         exc = exceptions.PermissionDenied()
 
+    # Handle the updates made on a stale version
+    if isinstance(exc, ConcurrentUpdateError):
+        exc = PreconditionFailed(exc.message)
+
+    # Handle the tree changes colliding with a concurrent change
+    if isinstance(exc, ConcurrentTreeChangeError):
+        exc = Conflict(exc.message)
+
     # Handle an object does not exist errors
     if isinstance(exc, ObjectDoesNotExist):
         exc = exceptions.NotFound(f"Not Found - {exc}")
@@ -0,0 +1,140 @@
+from functools import lru_cache
+from typing import (
+    Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, cast,
+)
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+
+
+# Fields whose `to_representation` is a no-op for the values returned
+# by the database driver, so the row value can be used as it is.
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.FloatField,
+    serializers.IntegerField,
+    serializers.SlugField,
+)
+
+# Fields that can't be computed from a single `.values()` row.
+UNSUPPORTED_FIELDS = (
+    serializers.BaseSerializer,
+    serializers.HiddenField,
+    serializers.ManyRelatedField,
+    serializers.RelatedField,
+    serializers.SerializerMethodField,
+)
+
+ExtractorField = Tuple[str, str, Optional[Callable[[Any], Any]]]
+
+
+class ValuesExtractor:
+
+    """
+    Precompiled, read-only representation of a serializer that works
+    on `QuerySet.values()` rows instead of model instances.
+
+    The serializer fields are introspected once, when the extractor is
+    built, and every row is then converted with a plain loop over
+    `(field name, source, converter)` tuples. The serializer class stays
+    the single source of truth for the output schema, so it can still be
+    used in `extend_schema` for the API documentation.
+
+    Attributes:
+        fields (Tuple[ExtractorField, ...]): The compiled output fields.
+        value_fields (Tuple[str, ...]): The model fields to pass to
+            `QuerySet.values()`.
+    """
+
+    def __init__(
+            self, *, serializer_class: Type[serializers.Serializer[Any]]
+    ) -> None:
+
+        """
+        Compile the readable fields of the given serializer class.
+
+        :param serializer_class: The serializer class used as the schema source.
+
+        :raises ImproperlyConfigured: If the serializer declares a field
+            that can't be computed from a `.values()` row.
+        """
+
+        serializer = serializer_class()
+        compiled_fields: List[ExtractorField] = []
+
+        for field_name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            # The source of a bound field is the name of the model field.
+            source = cast(str, field.source)
+
+            if isinstance(field, UNSUPPORTED_FIELDS) or source == '*' or \
+                    '.' in source:
+                raise ImproperlyConfigured(
+                    f"{serializer_class.__name__}.{field_name} can't be extracted "
+                    f"from a values row, use the serializer instead."
+                )
+
+            converter = None
+            if type(field) not in PASSTHROUGH_FIELDS:
+                converter = field.to_representation
+
+            compiled_fields.append((field_name, source, converter))
+
+        self.fields = tuple(compiled_fields)
+        self.value_fields = tuple(source for _, source, _ in self.fields)
+
+    def extract(self, row: Dict[str, Any]) -> Dict[str, Any]:
+
+        """
+        Convert a single `.values()` row to its output representation.
+
+        :param row: A row returned by `QuerySet.values(*self.value_fields)`.
+
+        :return: Dict[str, Any]: The output representation of the row.
+        """
+
+        data = {}
+
+        for field_name, source, converter in self.fields:
+            value = row[source]
+            if value is not None and converter is not None:
+                value = converter(value)
+
+            data[field_name] = value
+
+        return data
+
+    def extract_many(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+        """
+        Convert many `.values()` rows to their output representation.
+
+        :param rows: The rows returned by `QuerySet.values(*self.value_fields)`.
+
+        :return: List[Dict[str, Any]]: The output representation of the rows.
+        """
+
+        extract = self.extract
+        return [extract(row) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def get_values_extractor(
+    serializer_class: Type[serializers.Serializer[Any]]
+) -> ValuesExtractor:
+
+    """
+    Return the compiled `ValuesExtractor` of a serializer class.
+
+    Extractors are built once per serializer class and cached for
+    the lifetime of the process.
+
+    :param serializer_class: The serializer class used as the schema source.
+
+    :return: ValuesExtractor: The compiled extractor.
+    """
+
+    return ValuesExtractor(serializer_class=serializer_class)
@@ -43,3 +43,25 @@ class ApiAuthMixin:
             JWTAuthentication,
     ]
     permission_classes: PermissionClassesType = (IsAuthenticated, )
+
+
+class QueryBudgetMixin:
+
+    """
+    Per-view query and SQL time budget.
+
+    Requests exceeding a budget are logged by
+    the `RequestInstrumentationMiddleware`, or fail when
+    `QUERY_BUDGET_STRICT` is enabled (e.g. in tests).
+
+    Attributes:
+        query_budget (Optional[int]): The maximum number of queries.
+        duplicate_query_budget (Optional[int]): The maximum number of
+            repeated queries (N+1 detection).
+        sql_time_budget (Optional[float]): The maximum total SQL time,
+            in milliseconds.
+    """
+
+    query_budget: Optional[int] = None
+    duplicate_query_budget: Optional[int] = None
+    sql_time_budget: Optional[float] = None
@@ -1,13 +1,17 @@
 from collections import OrderedDict
-from typing import Any, List, Type, Union
+from typing import Any, Dict, List, Type, Union, cast
 
 from django.db.models import QuerySet
+from django.http import HttpRequest
 from rest_framework.pagination import BasePagination, LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.serializers import BaseSerializer
+from rest_framework.serializers import BaseSerializer, Serializer
 from rest_framework.views import APIView
 
+from src.djshop.api.extractors import get_values_extractor
+from src.djshop.core.instrumentation import record_timing
+
 
 def get_paginated_response(
     *, pagination_class: Type[BasePagination],
@@ -34,13 +38,14 @@ def get_paginated_response(
 
     page = paginator.paginate_queryset(queryset, request, view=view)
 
-    if page is not None:
-        serializer = serializer_class(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+    with record_timing('serializer'):
+        if page is not None:
+            serializer = serializer_class(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
 
-    serializer = serializer_class(queryset, many=True)
+        serializer = serializer_class(queryset, many=True)
 
-    return Response(data=serializer.data)
+        return Response(data=serializer.data)
 
 
 def get_paginated_response_context(
@@ -68,13 +73,101 @@ def get_paginated_response_context(
 
     page = paginator.paginate_queryset(queryset, request, view=view)
 
-    if page is not None:
-        serializer = serializer_class(page, many=True, context={'request': request})
-        return paginator.get_paginated_response(serializer.data)
+    with record_timing('serializer'):
+        if page is not None:
+            serializer = serializer_class(
+                page, many=True, context={'request': request}
+            )
+            return paginator.get_paginated_response(serializer.data)
+
+        serializer = serializer_class(
+            queryset, many=True, context={'request': request}
+        )
+
+        return Response(data=serializer.data)
+
+
+def get_paginated_values_response(
+    *, pagination_class: Type[BasePagination],
+    serializer_class: Type[Serializer[Any]],
+    queryset: QuerySet[Any], request: Request, view: APIView
+) -> Response:
+
+    """
+    Generate paginated response for a given queryset using `.values()` rows
+    instead of model instances.
+
+    The serializer class is only used as the schema source, its fields are
+    compiled once into a `ValuesExtractor`, so no model instance or
+    serializer instance is created per row.
+
+    :param: pagination_class (Type[BasePagination]): Pagination class type
+                            to handle pagination logic.
+    :param: serializer_class (Type[Serializer[Any]]): Serializer class type
+                            describing the output representation.
+    :param: queryset (QuerySet[Any]): QuerySet to be paginated and extracted.
+    :param: request (Request): HTTP request object.
+    :param: view (APIView): APIView instance.
+
+    :return: Response: Paginated response containing extracted data.
+    """
+
+    extractor = get_values_extractor(serializer_class)
+    values_queryset = queryset.values(*extractor.value_fields)
+
+    paginator = pagination_class()
+
+    page = paginator.paginate_queryset(values_queryset, request, view=view)
+
+    with record_timing('serializer'):
+        if page is not None:
+            return paginator.get_paginated_response(extractor.extract_many(page))
+
+        return Response(data=extractor.extract_many(values_queryset))
+
+
+async def aget_paginated_values_data(
+    *, pagination_class: Type['CustomLimitOffsetPagination'],
+    serializer_class: Type[Serializer[Any]],
+    queryset: QuerySet[Any], request: HttpRequest
+) -> Dict[str, Any]:
+
+    """
+    Async version of `get_paginated_values_response`, for the async views.
+
+    The limit and offset are read with the pagination class, the count and
+    the page rows are fetched with the async ORM, and the paginated data
+    is returned instead of a DRF response.
+
+    :param: pagination_class (Type[CustomLimitOffsetPagination]): Pagination
+                            class type to handle pagination logic.
+    :param: serializer_class (Type[Serializer[Any]]): Serializer class type
+                            describing the output representation.
+    :param: queryset (QuerySet[Any]): QuerySet to be paginated and extracted.
+    :param: request (HttpRequest): HTTP request object.
+
+    :return: Dict[str, Any]: Paginated data containing extracted data.
+    """
+
+    extractor = get_values_extractor(serializer_class)
+    values_queryset = queryset.values(*extractor.value_fields)
+
+    paginator = pagination_class()
+    paginator.request = Request(request)
+    paginator.limit = paginator.get_limit(paginator.request)
+    paginator.offset = paginator.get_offset(paginator.request)
+    paginator.count = await values_queryset.acount()
+
+    stop = None if paginator.limit is None else paginator.offset + paginator.limit
 
-    serializer = serializer_class(queryset, many=True, context={'request': request})
+    page: List[Dict[str, Any]] = []
+    if paginator.count and paginator.offset <= paginator.count:
+        page = [row async for row in values_queryset[paginator.offset:stop]]
 
-    return Response(data=serializer.data)
+    with record_timing('serializer'):
+        return dict(paginator.get_paginated_data(
+            cast(List[object], extractor.extract_many(page))
+        ))
 
 
 class CustomLimitOffsetPagination(LimitOffsetPagination):
@@ -0,0 +1,49 @@
+from typing import Any, Mapping, Optional
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+
+    """
+    Renderer which serializes response data to JSON using orjson.
+
+    This is a drop-in replacement for the default `JSONRenderer` on hot
+    read endpoints. orjson encodes the native types (dict, list, str, int,
+    bool, datetime, UUID) in C, and falls back to DRF's `JSONEncoder`
+    for anything else (Decimal, lazy translation strings, querysets...).
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    encoder_class = JSONEncoder
+
+    # `OPT_UTC_Z` keeps UTC datetimes rendered as "...Z", the same
+    # as DRF's `JSONEncoder` does.
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def render(
+            self, data: Any, accepted_media_type: Optional[str] = None,
+            renderer_context: Optional[Mapping[str, Any]] = None
+    ) -> bytes:
+
+        """
+        Render `data` into JSON, returning a bytestring.
+
+        :param data: The data to be rendered.
+        :param accepted_media_type: The accepted media type of the request.
+        :param renderer_context: The context passed in by the view.
+
+        :return: bytes: The JSON encoded data.
+        """
+
+        if data is None:
+            return b''
+
+        return orjson.dumps(
+            data, default=self.encoder_class().default, option=self.options
+        )
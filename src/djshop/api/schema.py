@@ -0,0 +1,131 @@
+"""
+Pre-generated OpenAPI schema.
+
+Generating the schema introspects every view and serializer, so it is done
+once, at release time, into a versioned file of the `STATIC_ROOT`. The web
+processes read that file once and serve it from memory.
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, cast
+
+from django.conf import settings
+
+
+SCHEMA_API_VERSION = 'v1'
+
+
+class SchemaDocument(NamedTuple):
+
+    """
+    The rendered OpenAPI schema.
+
+    Attributes:
+        content (bytes): The schema, rendered as JSON.
+        etag (str): The quoted strong ETag of the content.
+    """
+
+    content: bytes
+    etag: str
+
+
+def get_schema_file() -> Path:
+
+    """
+    Return the path of the pre-generated schema file.
+
+    :return: Path: The versioned schema file, in the `STATIC_ROOT`.
+    """
+
+    return Path(settings.STATIC_ROOT) / settings.SPECTACULAR_SCHEMA_FILE
+
+
+def generate_schema() -> bytes:
+
+    """
+    Generate the OpenAPI schema of the API, as the `spectacular` command
+    does.
+
+    :return: bytes: The schema, rendered as JSON.
+    """
+
+    # The schema machinery is slow to import, and only needed here.
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+    from drf_spectacular.settings import spectacular_settings
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS(
+        api_version=SCHEMA_API_VERSION
+    )
+    schema = generator.get_schema(request=None, public=True)
+
+    return cast(bytes, OpenApiJsonRenderer().render(schema, renderer_context={}))
+
+
+def write_schema_file(*, path: Path) -> SchemaDocument:
+
+    """
+    Generate the schema into a file, atomically, so the web processes never
+    read a partially written schema.
+
+    :param path: The schema file.
+    :return: SchemaDocument: The written schema.
+    """
+
+    content = generate_schema()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f'.{path.name}.tmp')
+    temporary_path.write_bytes(content)
+    os.replace(temporary_path, path)
+
+    return build_schema_document(content=content)
+
+
+def build_schema_document(*, content: bytes) -> SchemaDocument:
+
+    """
+    Build the schema document of a rendered schema.
+
+    :param content: The schema, rendered as JSON.
+    :return: SchemaDocument: The schema and its ETag.
+    """
+
+    return SchemaDocument(
+        content=content, etag=f'"{hashlib.sha1(content).hexdigest()}"'
+    )
+
+
+@lru_cache(maxsize=None)
+def load_schema_document(path: Path) -> SchemaDocument:
+
+    """
+    Load the schema document once per process.
+
+    The schema is generated in memory when its file is missing (e.g. on a
+    platform whose release step doesn't share its file system with the web
+    processes), which is only paid by the first request of a process.
+
+    :param path: The schema file.
+    :return: SchemaDocument: The schema and its ETag.
+    """
+
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
+        content = generate_schema()
+
+    return build_schema_document(content=content)
+
+
+def get_schema_document() -> SchemaDocument:
+
+    """
+    Return the schema document of the current settings.
+
+    :return: SchemaDocument: The schema and its ETag.
+    """
+
+    return load_schema_document(get_schema_file())
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views.decorators.http import require_safe
+
+from src.djshop.api.schema import SCHEMA_API_VERSION, get_schema_document
+from src.djshop.utils.views import lazy_view
+
+
+SCHEMA_CONTENT_TYPE = 'application/vnd.oai.openapi+json'
+
+live_schema_view = lazy_view(
+    'drf_spectacular.views.SpectacularAPIView', api_version=SCHEMA_API_VERSION
+)
+
+
+@require_safe
+def schema_view(request: HttpRequest) -> HttpResponseBase:
+
+    """
+    Serve the OpenAPI schema.
+
+    The pre-generated schema is served from memory, with an ETag, so the
+    Swagger and Redoc pages revalidate it with a `304 Not Modified`. In
+    DEBUG, the schema is generated on every request, so it follows the code.
+
+    :param request: The request object.
+    :return: HttpResponseBase: The schema, or a `304 Not Modified`.
+    """
+
+    if settings.DEBUG:
+        return live_schema_view(request)
+
+    schema_document = get_schema_document()
+    response = get_conditional_response(request, etag=schema_document.etag)
+
+    if response is None:
+        response = HttpResponse(
+            content=schema_document.content, content_type=SCHEMA_CONTENT_TYPE
+        )
+
+    response['ETag'] = schema_document.etag
+    patch_cache_control(
+        response, public=True, max_age=settings.SPECTACULAR_SCHEMA_MAX_AGE
+    )
+
+    return response
@@ -1,28 +1,60 @@
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Type, cast
 
 import django_stubs_ext
 from django.contrib import admin
-from django.db.models import Count
-from treebeard.admin import TreeAdmin
-from treebeard.forms import movenodeform_factory
-
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import PermissionDenied
+from django.db.models import Count, Q
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+from src.djshop.catalog.forms import CategoryAdminForm
 from src.djshop.catalog.models import (
     Attribute, AttributeValue, Category, Image, Option, OptionGroup,
     OptionGroupValues, Product, ProductClass, Recommendations,
 )
+from src.djshop.catalog.selectors.admin.category import get_category_children
+from src.djshop.catalog.services.category import (
+    delete_category_node, move_category_node, purge_category_pages,
+)
+from src.djshop.utils.db.paginators import EstimatedCountPaginator
 
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
     from django.http import HttpRequest
+    from django.urls import URLPattern
     from rest_framework.request import Request
 
 
 django_stubs_ext.monkeypatch()
 
 
+class CategoryChangeList(ChangeList):
+
+    """
+    Category changelist showing only the root categories, unless searching.
+
+    The children are loaded on demand, when a node is expanded
+    (`CategoryAdmin.children_view`).
+    """
+
+    def get_queryset(
+            self, request: 'HttpRequest', *args: Any, **kwargs: Any
+    ) -> 'QuerySet[Category]':
+
+        category_queryset = super().get_queryset(request, *args, **kwargs)
+
+        if not self.query:
+            category_queryset = category_queryset.filter(depth=1)
+
+        return cast('QuerySet[Category]', category_queryset)
+
+
 @admin.register(Category)
-class CategoryAdmin(TreeAdmin):
+class CategoryAdmin(admin.ModelAdmin[Category]):
 
     """
     Admin configuration for the Category model.
@@ -32,20 +64,29 @@ class CategoryAdmin(TreeAdmin):
     category hierarchy and associated properties.
 
     in the Django admin interface. It allows users to:
-        - View a tree structure of categories.
-        - Create, edit, and delete categories.
+        - View a tree structure of categories, expanded node by node.
+        - Create, edit, move and delete categories.
         - Search for categories by their title.
         - Prepopulate the slug field based on the title.
+
+    Only the visible nodes are loaded: the changelist lists the root
+    categories, the children of a node are fetched as JSON a page at a time
+    when it is expanded, and the parent of a category is picked by
+    autocomplete.
     """
 
-    # Use the "movenodeform_factory" to enable tree manipulation in the admin
-    form = movenodeform_factory(Category)
+    # Pick the parent by autocomplete, instead of treebeard's move form
+    form = CategoryAdminForm
+    change_list_template = 'admin/catalog/category/change_list.html'
 
     # Define the list of fields to be displayed in the admin list view
     list_display = [
+        'tree_toggle',  # Display the expand button of the node
         'title',  # Display the title of the category
         'is_public'  # Display the is_public field
     ]
+    list_display_links = ['title']
+    ordering = ['path']
 
     # Enable search functionality based on the title field
     search_fields = ['title__istartswith']
@@ -55,6 +96,199 @@ class CategoryAdmin(TreeAdmin):
         'slug': ['title']
     }
 
+    # Maximum number of children returned by a single children request
+    children_page_size = 100
+    autocomplete_page_size = 20
+
+    def get_changelist(
+            self, request: 'HttpRequest', **kwargs: Any
+    ) -> Type[CategoryChangeList]:
+        return CategoryChangeList
+
+    def get_urls(self) -> List['URLPattern']:
+
+        """
+        Add the children and the parent autocomplete endpoints.
+        """
+
+        return [
+            path(
+                route='<int:category_id>/children/',
+                view=self.admin_site.admin_view(self.children_view),
+                name='catalog_category_children'
+            ),
+            path(
+                route='parent-autocomplete/',
+                view=self.admin_site.admin_view(self.parent_autocomplete_view),
+                name='catalog_category_parent_autocomplete'
+            ),
+            *super().get_urls(),
+        ]
+
+    @admin.display(description='')
+    def tree_toggle(self, category_obj: 'Category') -> str:
+
+        """
+        Render the expand button of a node which has children.
+        """
+
+        if not category_obj.numchild:
+            return ''
+
+        return format_html(
+            '<button type="button" class="category-tree-toggle" '
+            'data-children-url="{}" data-depth="{}">+</button>',
+            reverse('admin:catalog_category_children', args=[category_obj.pk]),
+            category_obj.depth
+        )
+
+    def children_view(
+            self, request: 'HttpRequest', category_id: int
+    ) -> JsonResponse:
+
+        """
+        Return a page of the direct children of a category as JSON.
+
+        The `after` query parameter is the `path` of the last child of
+        the previous page, returned as `next` while there are more children.
+
+        :param request: The request object.
+        :param category_id: The id of the parent category.
+        :return: JsonResponse: The children and the cursor of the next page.
+
+        :raises PermissionDenied: If the user can't view the categories.
+        :raises Http404: If the parent category does not exist.
+        """
+
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        parent_category = get_object_or_404(Category, pk=category_id)
+        children = list(get_category_children(
+            parent_category=parent_category, after_path=request.GET.get('after'),
+            limit=self.children_page_size + 1
+        ))
+        has_next = len(children) > self.children_page_size
+        children = children[:self.children_page_size]
+
+        return JsonResponse({
+            'results': [
+                {
+                    'id': child.pk,
+                    'title': child.title,
+                    'is_public': child.is_public,
+                    'depth': child.depth,
+                    'numchild': child.numchild,
+                    'change_url': reverse(
+                        'admin:catalog_category_change', args=[child.pk]
+                    ),
+                    'children_url': reverse(
+                        'admin:catalog_category_children', args=[child.pk]
+                    ) if child.numchild else None,
+                }
+                for child in children
+            ],
+            'next': children[-1].path if has_next else None,
+        })
+
+    def parent_autocomplete_view(self, request: 'HttpRequest') -> JsonResponse:
+
+        """
+        Search the categories by title for the parent autocomplete widget,
+        in the format of the admin autocomplete (select2).
+
+        :param request: The request object.
+        :return: JsonResponse: A page of matching categories.
+
+        :raises PermissionDenied: If the user can't view the categories.
+        """
+
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        try:
+            page_number = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            page_number = 1
+
+        offset = (page_number - 1) * self.autocomplete_page_size
+        categories = list(
+            Category.objects.filter(
+                title__istartswith=request.GET.get('term', '')
+            ).order_by('path').values_list('pk', 'title', 'depth')[
+                offset:offset + self.autocomplete_page_size + 1
+            ]
+        )
+
+        return JsonResponse({
+            'results': [
+                {'id': str(pk), 'text': f'{"— " * (depth - 1)}{title}'}
+                for pk, title, depth in categories[:self.autocomplete_page_size]
+            ],
+            'pagination': {'more': len(categories) > self.autocomplete_page_size},
+        })
+
+    def save_model(
+            self, request: 'HttpRequest', obj: 'Category', form: Any, change: bool
+    ) -> None:
+
+        """
+        Add the new categories to the tree, and move the existing ones
+        whose parent changed.
+
+        The edge cached pages of the category and of the category list
+        are purged through the outbox, in the admin's transaction.
+        """
+
+        parent = form.cleaned_data.get('parent')
+
+        if not change:
+            if parent is None:
+                Category.add_root(instance=obj)
+            else:
+                parent.add_child(instance=obj)
+            purge_category_pages(category_ids=[obj.pk])
+            return
+
+        obj.save()
+        purge_category_pages(category_ids=[obj.pk])
+
+        if 'parent' in form.changed_data:
+            moved_obj = move_category_node(
+                category_slug=obj.slug,
+                parent_node_slug=parent.slug if parent is not None else None
+            )
+            obj.path, obj.depth = moved_obj.path, moved_obj.depth
+
+    def delete_model(self, request: 'HttpRequest', obj: 'Category') -> None:
+
+        """
+        Delete a category with its descendants, and purge their edge cached
+        pages.
+        """
+
+        delete_category_node(category_slug=obj.slug)
+
+    def delete_queryset(
+            self, request: 'HttpRequest', queryset: 'QuerySet[Category]'
+    ) -> None:
+
+        """
+        Delete the selected categories with their descendants, and purge
+        their edge cached pages.
+        """
+
+        subtrees_filter = Q()
+        for category_path in queryset.values_list('path', flat=True):
+            subtrees_filter |= Q(path__startswith=category_path)
+
+        deleted_category_ids = list(
+            Category.objects.filter(subtrees_filter).values_list('pk', flat=True)
+        )
+
+        super().delete_queryset(request, queryset)
+        purge_category_pages(category_ids=deleted_category_ids)
+
 
 class AttributeInline(admin.TabularInline[Attribute, ProductClass]):
 
@@ -174,16 +408,15 @@ class AttributesCountFilter(admin.SimpleListFilter):
 
         """
         Filters the queryset based on the selected filter option.
-        """
 
-        product_class_queryset = queryset.annotate(
-            attributes_count=Count('attributes')
-        )
+        The queryset is already annotated with `attributes_count`
+        by `ProductClassAdmin.get_queryset`.
+        """
 
         if self.value() == '< 5':
-            return product_class_queryset.filter(attributes_count__lt=5)
+            return queryset.filter(attributes_count__lt=5)
         if self.value() == '> 5':
-            return product_class_queryset.filter(attributes_count__gt=5)
+            return queryset.filter(attributes_count__gt=5)
 
         # Default return statement
         return queryset
@@ -199,6 +432,10 @@ class ProductClassAdmin(admin.ModelAdmin[ProductClass]):
     which define the structure and properties of products. Users can view,
     edit, and perform actions on product classes, as well as access-related
     attributes and options.
+
+    The changelist queryset is annotated once with the attributes count,
+    which is shared by the list columns and `AttributesCountFilter`,
+    so the page is rendered with a constant number of queries.
     """
 
     list_display = (
@@ -216,10 +453,35 @@ class ProductClassAdmin(admin.ModelAdmin[ProductClass]):
     prepopulated_fields = {
         'slug': ['title']
     }
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     # Inlines to display related models directly on the product class admin page
     inlines = [AttributeInline]
 
+    def get_queryset(self, request: 'HttpRequest') -> 'QuerySet[ProductClass]':
+
+        """
+        Annotate the product classes with their number of attributes.
+        """
+
+        return super().get_queryset(request).annotate(
+            attributes_count=Count('attributes')
+        )
+
+    @admin.display(
+        description='has attributes', boolean=True, ordering='attributes_count'
+    )
+    def has_attributes(self, product_class_obj: 'ProductClass') -> bool:
+
+        """
+        Returns whether a product class object has attributes.
+        Used for displaying the attribute existence in the admin list view.
+        """
+
+        return bool(product_class_obj.attributes_count)  # type: ignore[attr-defined]
+
+    @admin.display(description='attributes count', ordering='attributes_count')
     def attributes_count(self, product_class_obj: 'ProductClass') -> int:
 
         """
@@ -227,7 +489,7 @@ class ProductClassAdmin(admin.ModelAdmin[ProductClass]):
         Used for displaying the attribute count in the admin list view.
         """
 
-        return product_class_obj.attributes.count()
+        return int(product_class_obj.attributes_count)  # type: ignore[attr-defined]
 
     @admin.action(description='Enable track stock')
     def enable_track_stock(
@@ -253,12 +515,23 @@ class ProductAttributeInline(admin.TabularInline[AttributeValue, Product]):
     This inline allows users to:
         - View and edit existing attributes associated with a product class.
         - Create new attributes directly on the product class edit page.
-        - Use autocomplete to quickly select existing option groups for
-        new attributes.
+        - Use autocomplete to quickly select existing attributes, and raw ids
+        for the option values, instead of selects listing every row.
     """
 
     model = AttributeValue
     extra = 2
+    autocomplete_fields = ['attribute']
+    raw_id_fields = ['value_option', 'value_multi_option']
+
+    def get_queryset(self, request: 'HttpRequest') -> 'QuerySet[AttributeValue]':
+
+        """
+        Fetch the product and the attribute used by `AttributeValue.__str__`
+        with the attribute values.
+        """
+
+        return super().get_queryset(request).select_related('product', 'attribute')
 
 
 class RecommendationsInline(admin.TabularInline[Recommendations, Product]):
@@ -272,18 +545,55 @@ class RecommendationsInline(admin.TabularInline[Recommendations, Product]):
     model = Recommendations
     fk_name = 'primary'
     extra = 2
+    autocomplete_fields = ['normal']
+
+    def get_queryset(self, request: 'HttpRequest') -> 'QuerySet[Recommendations]':
+
+        """
+        Fetch the products used by `Recommendations.__str__` with
+        the recommendations.
+        """
+
+        return super().get_queryset(request).select_related('primary', 'normal')
 
 
 class ProductImageInline(admin.TabularInline[Image, Product]):
 
     model = Image
     extra = 2
+    autocomplete_fields = ['image']
 
 
 class CategoryInline(admin.TabularInline[Any, Product]):
 
     model = Product.categories.through
     extra = 2
+    autocomplete_fields = ['category']
+
+
+@admin.register(Attribute)
+class AttributeAdmin(admin.ModelAdmin[Attribute]):
+
+    """
+    Admin configuration for the Attribute model.
+
+    Attributes are mostly managed on the product class page
+    (`AttributeInline`); this admin provides the searchable list and
+    the autocomplete endpoint used by the product attribute values.
+    """
+
+    list_display = (
+        'title',
+        'product_class',
+        'type',
+        'required'
+    )
+    list_filter = ('type', 'required')
+    list_select_related = ('product_class',)
+    search_fields = ('title__istartswith',)
+    autocomplete_fields = ('product_class', 'option_group')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Product)
@@ -307,6 +617,9 @@ class ProductAdmin(admin.ModelAdmin[Product]):
     prepopulated_fields = {
         'slug': ['title']
     }
+    autocomplete_fields = ('parent', 'product_class', 'categories')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     inlines = [
         ProductAttributeInline, RecommendationsInline, ProductImageInline,
         CategoryInline
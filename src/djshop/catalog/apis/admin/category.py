@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from django.core.exceptions import (
     ObjectDoesNotExist, ValidationError as DjangoValidationError,
 )
@@ -10,19 +12,27 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from src.djshop.api.conditional import (
+    get_if_match_version, get_not_modified_response,
+    get_precondition_failed_response, get_resource_etag, set_resource_validators,
+)
 from src.djshop.api.exception_handlers import hacksoft_proposed_exception_handler
 from src.djshop.api.pagination import (
     CustomLimitOffsetPagination, get_paginated_response_context,
 )
 from src.djshop.catalog.selectors.admin.category import (
-    get_category_node, get_category_tree,
+    get_category_node, get_category_node_version, get_category_tree,
 )
 from src.djshop.catalog.serializers.admin.category import (
-    CategoryNodeInPutSerializer, CategoryNodeOutPutModelSerializer,
-    CategoryTreeOutPutModelSerializer,
+    CategoryNodeInPutSerializer, CategoryNodeMoveInPutSerializer,
+    CategoryNodeOutPutModelSerializer, CategoryTreeOutPutModelSerializer,
 )
 from src.djshop.catalog.services.category import (
-    create_category_node, delete_category_node, update_category_node,
+    create_category_node, delete_category_node, move_category_node,
+    update_category_node,
+)
+from src.djshop.core.exceptions import (
+    ConcurrentTreeChangeError, ConcurrentUpdateError,
 )
 
 
@@ -133,6 +143,9 @@ class CategoryNodeAPIView(APIView):
         The result is then serialized using
         the `CategoryNodeOutPutModelSerializer` and returned in the response.
 
+        If the client's copy of the category is still fresh, a
+        `304 Not Modified` response is returned before running the selector.
+
         :param request: The request object.
         :param category_slug: (str): The slug of the category.
         :return: Response containing the detailed representation of the category.
@@ -140,6 +153,19 @@ class CategoryNodeAPIView(APIView):
         :raises DoesNotExist: If the category does not exist.
         """
 
+        category_node_version = get_category_node_version(
+            category_slug=category_slug
+        )
+        etag = get_resource_etag(
+            request=request, resource_version=category_node_version
+        )
+
+        not_modified_response = get_not_modified_response(
+            request=request, etag=etag, resource_version=category_node_version
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
         try:
             category_query = get_category_node(category_slug=category_slug)
 
@@ -161,7 +187,11 @@ class CategoryNodeAPIView(APIView):
             instance=category_query
         )
 
-        return Response(output_serializer.data, status=status.HTTP_200_OK)
+        response = Response(output_serializer.data, status=status.HTTP_200_OK)
+
+        return set_resource_validators(
+            response=response, etag=etag, resource_version=category_node_version
+        )
 
     @extend_schema(
         request=CategoryNodeInPutSerializer,
@@ -182,6 +212,10 @@ class CategoryNodeAPIView(APIView):
         The updated category node is serialized using
         the `CategoryNodeOutPutModelSerializer` and returned in the response.
 
+        If the request has an `If-Match` header, the category is only updated
+        if it is still at the version the client read, otherwise a
+        `412 Precondition Failed` response is returned.
+
         :param request: The request object.
         :param category_slug: The slug of the category.
         :return: Response containing the updated representation of the category.
@@ -190,35 +224,11 @@ class CategoryNodeAPIView(APIView):
         input_serializer = self.category_input_serializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
 
-        try:
-            # Extract the validated data from the serializer
-            category_node_data = input_serializer.validated_data
-            updated_category_node = update_category_node(
-                category_slug=category_slug,
-                category_node_data=category_node_data
-            )
-
-        except (
-                DjangoValidationError, Http404, PermissionDenied, APIException,
-                ObjectDoesNotExist, IntegrityError
-        ) as exc:
-
-            exception_response = hacksoft_proposed_exception_handler(
-                exc=exc, ctx={"request": request, "view": self}
-            )
-
-            assert exception_response is not None
-            return Response(
-                data=exception_response.data,
-                status=exception_response.status_code,
-            )
-
-        output_serializer = self.category_output_serializer(
-            updated_category_node, context={'request': request}
+        return self.update(
+            request=request, category_slug=category_slug,
+            category_node_data=input_serializer.validated_data
         )
 
-        return Response(output_serializer.data, status=status.HTTP_202_ACCEPTED)
-
     @extend_schema(
         request=CategoryNodeInPutSerializer,
         responses=CategoryNodeOutPutModelSerializer
@@ -239,6 +249,10 @@ class CategoryNodeAPIView(APIView):
         function, and the updated category node is serialized using
         the `CategoryNodeOutPutModelSerializer` and returned in the response.
 
+        If the request has an `If-Match` header, the category is only updated
+        if it is still at the version the client read, otherwise a
+        `412 Precondition Failed` response is returned.
+
         :param request: The request object.
         :param category_slug: The slug of the category.
         :return: Response containing the updated representation of the category.
@@ -249,18 +263,54 @@ class CategoryNodeAPIView(APIView):
         )
         input_serializer.is_valid(raise_exception=True)
 
-        try:
-            # Extract the validated data from the serializer
-            category_node_data = input_serializer.validated_data
+        return self.update(
+            request=request, category_slug=category_slug,
+            category_node_data=input_serializer.validated_data
+        )
+
+    def update(
+            self, *, request: 'Request', category_slug: str,
+            category_node_data: Dict[str, Any]
+    ) -> 'Response':
+
+        """
+        Update a category with the validated data of a PUT or PATCH request,
+        honouring its `If-Match` precondition.
+
+        The response carries the ETag of the updated category, to be sent
+        back in the `If-Match` header of the next update.
+
+        :param request: The request object.
+        :param category_slug: The slug of the category.
+        :param category_node_data: The validated data of the request.
+        :return: Response containing the updated representation of the category.
+        """
+
+        category_node_version = get_category_node_version(
+            category_slug=category_slug
+        )
+        etag = get_resource_etag(
+            request=request, resource_version=category_node_version
+        )
 
+        precondition_failed_response = get_precondition_failed_response(
+            request=request, etag=etag, resource_version=category_node_version
+        )
+        if precondition_failed_response is not None:
+            return precondition_failed_response
+
+        try:
             updated_category_node = update_category_node(
                 category_slug=category_slug,
-                category_node_data=category_node_data
+                category_node_data=category_node_data,
+                expected_version=get_if_match_version(
+                    request=request, resource_version=category_node_version
+                )
             )
 
         except (
                 DjangoValidationError, Http404, PermissionDenied, APIException,
-                ObjectDoesNotExist, IntegrityError
+                ObjectDoesNotExist, IntegrityError, ConcurrentUpdateError
         ) as exc:
 
             exception_response = hacksoft_proposed_exception_handler(
@@ -277,7 +327,19 @@ class CategoryNodeAPIView(APIView):
             updated_category_node, context={'request': request}
         )
 
-        return Response(output_serializer.data, status=status.HTTP_202_ACCEPTED)
+        response = Response(output_serializer.data, status=status.HTTP_202_ACCEPTED)
+
+        updated_category_node_version = get_category_node_version(
+            category_slug=updated_category_node.slug
+        )
+
+        return set_resource_validators(
+            response=response,
+            etag=get_resource_etag(
+                request=request, resource_version=updated_category_node_version
+            ),
+            resource_version=updated_category_node_version
+        )
 
     @extend_schema(
         responses=CategoryNodeOutPutModelSerializer
@@ -379,3 +441,67 @@ class CategoryNodeCreateAPIView(APIView):
             category_node, context={'request': request}
         )
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+
+
+class CategoryNodeMoveAPIView(APIView):
+
+    """
+    API View for moving a Category node, with its subtree, under another
+    Category node or to the root categories.
+
+    Attributes:
+        category_input_serializer (Serializer): The serializer for input data.
+        category_output_serializer (Serializer): The serializer for output data.
+    """
+
+    category_input_serializer = CategoryNodeMoveInPutSerializer
+    category_output_serializer = CategoryNodeOutPutModelSerializer
+
+    @extend_schema(
+        request=CategoryNodeMoveInPutSerializer,
+        responses=CategoryNodeOutPutModelSerializer
+    )
+    def post(self, request: 'Request', category_slug: str) -> 'Response':
+
+        """
+        Move a category node to the end of the children of the given parent
+        node, or to the end of the root categories if the parent node is null.
+
+        The input data is validated with the `CategoryNodeMoveInPutSerializer`,
+        the node is moved with the `move_category_node` service, and the moved
+        node is serialized with the `CategoryNodeOutPutModelSerializer`.
+
+        :param request: The request object.
+        :param category_slug: The slug of the category to be moved.
+        :return: Response containing the representation of the moved category.
+        """
+
+        input_serializer = self.category_input_serializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+
+        try:
+            moved_category_node = move_category_node(
+                category_slug=category_slug,
+                parent_node_slug=input_serializer.validated_data['parent_node']
+            )
+
+        except (
+                DjangoValidationError, Http404, PermissionDenied, APIException,
+                ObjectDoesNotExist, ConcurrentTreeChangeError
+        ) as exc:
+
+            exception_response = hacksoft_proposed_exception_handler(
+                exc=exc, ctx={"request": request, "view": self}
+            )
+
+            assert exception_response is not None
+            return Response(
+                data=exception_response.data,
+                status=exception_response.status_code,
+            )
+
+        output_serializer = self.category_output_serializer(
+            moved_category_node, context={'request': request}
+        )
+
+        return Response(output_serializer.data, status=status.HTTP_200_OK)
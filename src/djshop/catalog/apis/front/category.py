@@ -1,35 +1,55 @@
+from typing import Any, Dict, List, Optional
+
 from django.core.exceptions import (
     ObjectDoesNotExist, PermissionDenied, ValidationError as DjangoValidationError,
 )
-from django.http import Http404
+from django.http import Http404, HttpRequest
+from django.http.response import HttpResponseBase
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.exceptions import APIException
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from src.djshop.api.async_views import AsyncReadAPIView
+from src.djshop.api.conditional import (
+    get_not_modified_response, get_resource_etag, set_resource_validators,
+)
 from src.djshop.api.exception_handlers import hacksoft_proposed_exception_handler
+from src.djshop.api.mixins import QueryBudgetMixin
 from src.djshop.api.pagination import (
-    CustomLimitOffsetPagination, get_paginated_response_context,
+    CustomLimitOffsetPagination, aget_paginated_values_data,
+    get_paginated_values_response,
 )
+from src.djshop.api.renderers import ORJSONRenderer
+from src.djshop.catalog.models import Category
 from src.djshop.catalog.selectors.front.category import (
-    get_category_node, get_category_tree,
+    aget_category_node, aget_category_node_version, aget_category_tree_version,
+    get_category_node, get_category_node_version, get_category_tree,
+    get_category_tree_version,
 )
 from src.djshop.catalog.serializers.front.category import (
     CategoryOutPutModelSerializer,
 )
+from src.djshop.cdn.keys import (
+    get_list_surrogate_key, get_model_namespace, get_surrogate_keys,
+)
+from src.djshop.cdn.mixins import CachePolicyMixin
+from src.djshop.utils.db.routers import get_read_database_alias
 
 
-class CategoryTreeAPIView(APIView):
+class CategoryTreeAPIView(QueryBudgetMixin, CachePolicyMixin, APIView):
 
     """
     API view for retrieving a list of category.
 
     This view allows clients to retrieve a paginated
     list of category based on the provided filters.
-    The view uses the `CategoryOutPutModelSerializer` to serialize
-    the output representation of categories and
+    The view uses the `CategoryOutPutModelSerializer` as the schema of
+    the output representation of categories, which is extracted from
+    `.values()` rows and rendered with orjson, and
     the `CustomLimitOffsetPagination` class to paginate the results.
 
     Output Serializer:
@@ -39,6 +59,10 @@ class CategoryTreeAPIView(APIView):
     Pagination:
         CustomLimitOffsetPagination: Custom pagination class for a category list.
 
+    Caching:
+        Responses are cacheable by the edge cache and tagged with
+        the `category:list` and `category:<id>` surrogate keys.
+
     Methods:
         get(self, request): Retrieve a paginated list of category based on
         the provided filters.
@@ -46,10 +70,42 @@ class CategoryTreeAPIView(APIView):
     """
 
     output_serializer = CategoryOutPutModelSerializer
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
+    cache_max_age = 60
+    cache_shared_max_age = 60 * 10
+    cache_stale_while_revalidate = 60
+
+    # Version aggregate, page count and page rows.
+    query_budget = 3
+    duplicate_query_budget = 0
 
     class Pagination(CustomLimitOffsetPagination):
         default_limit = 10
 
+    def get_surrogate_keys(
+            self, request: 'Request', response: 'Response'
+    ) -> List[str]:
+
+        """
+        Tag the response with the list key and the keys of the listed
+        categories.
+
+        :param request: The request object.
+        :param response: The response object.
+        :return: The surrogate keys of the response.
+        """
+
+        namespace = get_model_namespace(model=Category)
+        category_ids = [
+            category['id'] for category in (response.data or {}).get('results', [])
+        ]
+
+        return [
+            get_list_surrogate_key(namespace=namespace),
+            *get_surrogate_keys(namespace=namespace, identifiers=category_ids)
+        ]
+
     @extend_schema(
         responses=CategoryOutPutModelSerializer,
     )
@@ -61,15 +117,34 @@ class CategoryTreeAPIView(APIView):
         This method allows clients to retrieve a paginated list of categories
         by sending a GET request to the category list endpoint with optional
         filter parameters. The results are then paginated using
-        the `CustomLimitOffsetPagination` class and serialized using
-        the `CategoryOutPutModelSerializer`.
+        the `CustomLimitOffsetPagination` class and extracted from
+        `.values()` rows with the fields of the `CategoryOutPutModelSerializer`.
+
+        If the client's copy of the list is still fresh (`If-None-Match`),
+        a `304 Not Modified` response is returned before running
+        the selector.
 
         :param request: The request object.
         :return: Paginated response containing the list of categories.
         """
 
+        # The version and the page are read from the same database, so a
+        # page of a lagging replica is never sent with a newer ETag.
+        using = get_read_database_alias()
+
+        category_tree_version = get_category_tree_version(using=using)
+        etag = get_resource_etag(
+            request=request, resource_version=category_tree_version
+        )
+
+        not_modified_response = get_not_modified_response(
+            request=request, etag=etag, resource_version=category_tree_version
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
         try:
-            category_list_queryset = get_category_tree()
+            category_list_queryset = get_category_tree(using=using)
 
         except (
                 DjangoValidationError, Http404, PermissionDenied, APIException
@@ -85,7 +160,7 @@ class CategoryTreeAPIView(APIView):
                 status=exception_response.status_code,
             )
 
-        return get_paginated_response_context(
+        response = get_paginated_values_response(
             pagination_class=self.Pagination,
             serializer_class=self.output_serializer,
             queryset=category_list_queryset,
@@ -93,8 +168,12 @@ class CategoryTreeAPIView(APIView):
             view=self,
         )
 
+        return set_resource_validators(
+            response=response, etag=etag, resource_version=category_tree_version
+        )
+
 
-class CategoryNodeAPIView(APIView):
+class CategoryNodeAPIView(QueryBudgetMixin, CachePolicyMixin, APIView):
 
     """
     API view for retrieving a category node.
@@ -110,9 +189,42 @@ class CategoryNodeAPIView(APIView):
     :Methods:
         get (self, request, movie_slug): Retrieve the detail of a category
         based on the provided category slug.
+
+    Caching:
+        Responses are cacheable by the edge cache and tagged with
+        the `category:<id>` surrogate key.
     """
 
     category_output_serializer = CategoryOutPutModelSerializer
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
+    cache_max_age = 60
+    cache_shared_max_age = 60 * 10
+    cache_stale_while_revalidate = 60
+
+    # Version aggregate and category row.
+    query_budget = 2
+    duplicate_query_budget = 0
+
+    def get_surrogate_keys(
+            self, request: 'Request', response: 'Response'
+    ) -> List[str]:
+
+        """
+        Tag the response with the key of the rendered category.
+
+        :param request: The request object.
+        :param response: The response object.
+        :return: The surrogate keys of the response.
+        """
+
+        if not response.data:
+            return []
+
+        return get_surrogate_keys(
+            namespace=get_model_namespace(model=Category),
+            identifiers=[response.data['id']]
+        )
 
     @extend_schema(
         responses=CategoryOutPutModelSerializer,
@@ -132,6 +244,9 @@ class CategoryNodeAPIView(APIView):
         The result is then serialized using
         the `CategoryOutPutModelSerializer` and returned in the response.
 
+        If the client's copy of the category is still fresh, a
+        `304 Not Modified` response is returned before running the selector.
+
         :param request: The request object.
         :param category_slug: (str): The slug of the category.
         :return: Response containing the detailed representation of the category.
@@ -139,8 +254,26 @@ class CategoryNodeAPIView(APIView):
         :raises DoesNotExist: If the category does not exist.
         """
 
+        # The version and the category are read from the same database.
+        using = get_read_database_alias()
+
+        category_node_version = get_category_node_version(
+            category_slug=category_slug, using=using
+        )
+        etag = get_resource_etag(
+            request=request, resource_version=category_node_version
+        )
+
+        not_modified_response = get_not_modified_response(
+            request=request, etag=etag, resource_version=category_node_version
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
         try:
-            category_query = get_category_node(category_slug=category_slug)
+            category_query = get_category_node(
+                category_slug=category_slug, using=using
+            )
 
         except (
             DjangoValidationError, Http404, PermissionDenied, APIException,
@@ -161,4 +294,168 @@ class CategoryNodeAPIView(APIView):
             instance=category_query
         )
 
-        return Response(output_serializer.data, status=status.HTTP_200_OK)
+        response = Response(output_serializer.data, status=status.HTTP_200_OK)
+
+        return set_resource_validators(
+            response=response, etag=etag, resource_version=category_node_version
+        )
+
+
+class AsyncCategoryTreeAPIView(AsyncReadAPIView):
+
+    """
+    Async version of `CategoryTreeAPIView`, for the ASGI servers.
+
+    The version aggregate, the page count and the page rows are fetched
+    with the async ORM, and the rendered pages are cached by ETag, so
+    a cached page costs the version aggregate only.
+    """
+
+    output_serializer = CategoryOutPutModelSerializer
+
+    cache_max_age = CategoryTreeAPIView.cache_max_age
+    cache_shared_max_age = CategoryTreeAPIView.cache_shared_max_age
+    cache_stale_while_revalidate = CategoryTreeAPIView.cache_stale_while_revalidate
+
+    body_cache_prefix = 'catalog:front:category-list'
+
+    # Version aggregate, page count and page rows.
+    query_budget = 3
+    duplicate_query_budget = 0
+
+    Pagination = CategoryTreeAPIView.Pagination
+
+    async def get(self, request: HttpRequest) -> HttpResponseBase:
+
+        """
+        Retrieves a paginated list of categories.
+
+        :param request: The request object.
+        :return: Response containing the paginated list of categories.
+        """
+
+        # As in `CategoryTreeAPIView.get`, the version and the page are read
+        # from the same database.
+        using = get_read_database_alias()
+
+        return await self.get_versioned_response(
+            request=request,
+            resource_version=await aget_category_tree_version(using=using),
+            using=using
+        )
+
+    async def get_data(
+            self, *, request: HttpRequest, using: Optional[str] = None, **kwargs: Any
+    ) -> Any:
+
+        """
+        Fetch a page of the public categories.
+
+        :param request: The request object.
+        :param using: (Optional[str]): The database alias to read from.
+        :return: Dict[str, Any]: The paginated list of categories.
+        """
+
+        return await aget_paginated_values_data(
+            pagination_class=self.Pagination,
+            serializer_class=self.output_serializer,
+            queryset=get_category_tree(using=using),
+            request=request,
+        )
+
+    def get_data_surrogate_keys(self, *, data: Dict[str, Any]) -> List[str]:
+
+        """
+        Tag the response with the list key and the keys of the listed
+        categories.
+
+        :param data: The paginated list of categories.
+        :return: The surrogate keys of the response.
+        """
+
+        namespace = get_model_namespace(model=Category)
+
+        return [
+            get_list_surrogate_key(namespace=namespace),
+            *get_surrogate_keys(
+                namespace=namespace,
+                identifiers=[category['id'] for category in data['results']]
+            )
+        ]
+
+
+class AsyncCategoryNodeAPIView(AsyncReadAPIView):
+
+    """
+    Async version of `CategoryNodeAPIView`, for the ASGI servers.
+    """
+
+    category_output_serializer = CategoryOutPutModelSerializer
+
+    cache_max_age = CategoryNodeAPIView.cache_max_age
+    cache_shared_max_age = CategoryNodeAPIView.cache_shared_max_age
+    cache_stale_while_revalidate = CategoryNodeAPIView.cache_stale_while_revalidate
+
+    # Version aggregate and category row.
+    query_budget = 2
+    duplicate_query_budget = 0
+
+    async def get(
+            self, request: HttpRequest, category_slug: str
+    ) -> HttpResponseBase:
+
+        """
+        Retrieves the detail of a category based on the provided
+        category slug.
+
+        :param request: The request object.
+        :param category_slug: (str): The slug of the category.
+        :return: Response containing the detailed representation of the category.
+        """
+
+        # As in `CategoryNodeAPIView.get`, the version and the category are
+        # read from the same database.
+        using = get_read_database_alias()
+
+        return await self.get_versioned_response(
+            request=request,
+            resource_version=await aget_category_node_version(
+                category_slug=category_slug, using=using
+            ),
+            category_slug=category_slug, using=using
+        )
+
+    async def get_data(
+            self, *, request: HttpRequest, category_slug: str = '',
+            using: Optional[str] = None, **kwargs: Any
+    ) -> Any:
+
+        """
+        Fetch the detailed representation of a category.
+
+        :param request: The request object.
+        :param category_slug: (str): The slug of the category.
+        :param using: (Optional[str]): The database alias to read from.
+        :return: Dict[str, Any]: The detailed representation of the category.
+
+        :raises DoesNotExist: If the category does not exist.
+        """
+
+        category_obj = await aget_category_node(
+            category_slug=category_slug, using=using
+        )
+
+        return self.category_output_serializer(instance=category_obj).data
+
+    def get_data_surrogate_keys(self, *, data: Dict[str, Any]) -> List[str]:
+
+        """
+        Tag the response with the key of the rendered category.
+
+        :param data: The detailed representation of the category.
+        :return: The surrogate keys of the response.
+        """
+
+        return get_surrogate_keys(
+            namespace=get_model_namespace(model=Category), identifiers=[data['id']]
+        )
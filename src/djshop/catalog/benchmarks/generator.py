@@ -0,0 +1,371 @@
+"""
+Bulk synthetic catalog generator for the catalog benchmarks.
+
+The rows are built in memory and inserted with `bulk_create`, without
+calling `save()` or sending signals, so a catalog of 100k products is
+generated in seconds rather than hours with the test factories.
+"""
+
+import hashlib
+import random
+import uuid
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple
+
+from django.utils.text import slugify
+
+from src.djshop.catalog.models import (
+    Attribute, AttributeValue, Category, Image as ProductImage, Product,
+    ProductClass,
+)
+from src.djshop.catalog.services.category import (
+    get_category_path_step, get_category_path_step_number,
+)
+from src.djshop.media.models import Image
+
+
+class CatalogShape(NamedTuple):
+
+    """
+    The shape of a synthetic catalog.
+
+    Attributes:
+        categories (int): The total number of categories.
+        root_categories (int): The number of root categories.
+        category_branching (int): The number of children of each category.
+        product_classes (int): The number of product classes.
+        attributes_per_class (int): The number of attributes of each class.
+        products (int): The number of products.
+        attribute_values_per_product (int): The number of attribute values
+            of each product, capped to the attributes of its class.
+        image_products (int): The number of products having images.
+        images_per_product (int): The number of images of those products.
+        batch_size (int): The `bulk_create` batch size.
+        seed (int): The seed of the random values.
+    """
+
+    categories: int = 10_000
+    root_categories: int = 10
+    category_branching: int = 10
+    product_classes: int = 20
+    attributes_per_class: int = 50
+    products: int = 100_000
+    attribute_values_per_product: int = 10
+    image_products: int = 20
+    images_per_product: int = 20
+    batch_size: int = 1_000
+    seed: int = 0
+
+
+class CatalogDataset(NamedTuple):
+
+    """
+    The identifiers of a generated synthetic catalog, used by the
+    benchmark scenarios.
+
+    Attributes:
+        prefix (str): The prefix of the generated titles and slugs.
+        category_ids (List[int]): The ids of the categories, in tree order.
+        product_class_ids (List[int]): The ids of the product classes.
+        integer_attribute_ids (List[int]): The ids of the integer attributes.
+        product_ids (List[int]): The ids of the products.
+        image_product_ids (List[int]): The ids of the products having images.
+    """
+
+    prefix: str
+    category_ids: List[int]
+    product_class_ids: List[int]
+    integer_attribute_ids: List[int]
+    product_ids: List[int]
+    image_product_ids: List[int]
+
+
+ATTRIBUTE_TYPES = (
+    Attribute.AttributeTypeChoice.integer,
+    Attribute.AttributeTypeChoice.float,
+    Attribute.AttributeTypeChoice.text,
+)
+
+
+def generate_categories(
+    *, shape: CatalogShape, prefix: str
+) -> List[Category]:
+
+    """
+    Generate the category tree breadth first, building the materialized
+    paths, depths and children counts of treebeard directly.
+
+    The new root nodes are appended after the existing ones, so the
+    generated tree is valid next to an existing catalog.
+
+    :param shape: The shape of the synthetic catalog.
+    :param prefix: The prefix of the generated titles and slugs.
+    :return: List[Category]: The created categories, in tree order.
+    """
+
+    last_root = Category.get_last_root_node()
+    first_root_step = (
+        get_category_path_step_number(path=last_root.path) + 1 if last_root else 1
+    )
+
+    categories: List[Category] = []
+    pending_parents: Deque[Category] = deque()
+
+    def add_category(path: str, depth: int) -> Category:
+        index = len(categories)
+        category = Category(
+            path=path, depth=depth, numchild=0,
+            title=f'{prefix} category {index}',
+            slug=f'{prefix}-category-{index}',
+            is_public=index % 10 != 9,
+        )
+        categories.append(category)
+        pending_parents.append(category)
+        return category
+
+    for root_step in range(first_root_step, first_root_step + shape.root_categories):
+        if len(categories) >= shape.categories:
+            break
+
+        add_category(path=get_category_path_step(step=root_step), depth=1)
+
+    while pending_parents and len(categories) < shape.categories:
+        parent = pending_parents.popleft()
+
+        for child_step in range(1, shape.category_branching + 1):
+            if len(categories) >= shape.categories:
+                break
+
+            add_category(
+                path=parent.path + get_category_path_step(step=child_step),
+                depth=parent.depth + 1
+            )
+            parent.numchild += 1
+
+    return Category.objects.bulk_create(categories, batch_size=shape.batch_size)
+
+
+def generate_product_classes(
+    *, shape: CatalogShape, prefix: str, rng: random.Random
+) -> Dict[int, List[Attribute]]:
+
+    """
+    Generate the product classes and their attributes.
+
+    :param shape: The shape of the synthetic catalog.
+    :param prefix: The prefix of the generated titles and slugs.
+    :param rng: The random generator.
+    :return: Dict[int, List[Attribute]]: The attributes, per product class id.
+    """
+
+    product_classes = ProductClass.objects.bulk_create(
+        [
+            ProductClass(
+                title=f'{prefix} product class {index}',
+                slug=f'{prefix}-product-class-{index}',
+                track_stock=rng.random() < 0.5,
+            )
+            for index in range(shape.product_classes)
+        ],
+        batch_size=shape.batch_size
+    )
+
+    attributes = Attribute.objects.bulk_create(
+        [
+            Attribute(
+                product_class=product_class,
+                title=f'{prefix} attribute {index}',
+                type=ATTRIBUTE_TYPES[index % len(ATTRIBUTE_TYPES)],
+            )
+            for product_class in product_classes
+            for index in range(shape.attributes_per_class)
+        ],
+        batch_size=shape.batch_size
+    )
+
+    # The attributes are created class by class.
+    return {
+        product_class.pk: attributes[
+            index * shape.attributes_per_class:
+            (index + 1) * shape.attributes_per_class
+        ]
+        for index, product_class in enumerate(product_classes)
+    }
+
+
+def get_attribute_value(
+    *, product: Product, attribute: Attribute, rng: random.Random
+) -> AttributeValue:
+
+    """
+    Build a random attribute value of a product, matching the attribute type.
+
+    :param product: The product.
+    :param attribute: The attribute.
+    :param rng: The random generator.
+    :return: AttributeValue: The unsaved attribute value.
+    """
+
+    attribute_value = AttributeValue(product=product, attribute=attribute)
+
+    if attribute.type == Attribute.AttributeTypeChoice.integer:
+        attribute_value.value_integer = rng.randint(0, 1_000)
+    elif attribute.type == Attribute.AttributeTypeChoice.float:
+        attribute_value.value_float = rng.uniform(0, 1_000)
+    else:
+        attribute_value.value_text = f'value {rng.randint(0, 100)}'
+
+    return attribute_value
+
+
+def generate_products(
+    *, shape: CatalogShape, prefix: str, rng: random.Random,
+    categories: List[Category], class_attributes: Dict[int, List[Attribute]]
+) -> List[Product]:
+
+    """
+    Generate the products, batch by batch, with their categories and
+    attribute values.
+
+    :param shape: The shape of the synthetic catalog.
+    :param prefix: The prefix of the generated titles and slugs.
+    :param rng: The random generator.
+    :param categories: The categories to put the products in.
+    :param class_attributes: The attributes, per product class id.
+    :return: List[Product]: The created products.
+    """
+
+    product_class_ids = list(class_attributes)
+    product_categories = Product.categories.through
+    products: List[Product] = []
+
+    for batch_start in range(0, shape.products, shape.batch_size):
+        batch_end = min(batch_start + shape.batch_size, shape.products)
+
+        batch_products = Product.objects.bulk_create([
+            Product(
+                title=f'{prefix} product {index}',
+                slug=slugify(f'{prefix} product {index}'),
+                product_class_id=(
+                    product_class_ids[index % len(product_class_ids)]
+                    if product_class_ids else None
+                ),
+            )
+            for index in range(batch_start, batch_end)
+        ])
+
+        if categories:
+            product_categories.objects.bulk_create([
+                product_categories(
+                    product_id=product.pk, category_id=rng.choice(categories).pk
+                )
+                for product in batch_products
+            ])
+
+        attribute_values: List[AttributeValue] = []
+        for product in batch_products:
+            attributes = (
+                class_attributes[product.product_class_id]
+                if product.product_class_id is not None else []
+            )
+            sample_size = min(shape.attribute_values_per_product, len(attributes))
+
+            attribute_values.extend(
+                get_attribute_value(product=product, attribute=attribute, rng=rng)
+                for attribute in rng.sample(attributes, sample_size)
+            )
+
+        AttributeValue.objects.bulk_create(
+            attribute_values, batch_size=shape.batch_size
+        )
+        products.extend(batch_products)
+
+    return products
+
+
+def generate_images(
+    *, shape: CatalogShape, prefix: str, products: List[Product]
+) -> List[Product]:
+
+    """
+    Generate the images of the first products.
+
+    Only the rows are created: the image files don't exist in the storage.
+
+    :param shape: The shape of the synthetic catalog.
+    :param prefix: The prefix of the generated titles and file names.
+    :param products: The products.
+    :return: List[Product]: The products having images.
+    """
+
+    image_products = products[:shape.image_products]
+    image_count = len(image_products) * shape.images_per_product
+
+    images = Image.objects.bulk_create(
+        [
+            Image(
+                title=f'{prefix} image {index}',
+                image=f'benchmarks/{prefix}-{index}.jpg',
+                width=800, height=800, file_size=100_000,
+                file_hash=hashlib.sha1(f'{prefix}-{index}'.encode()).hexdigest(),
+            )
+            for index in range(image_count)
+        ],
+        batch_size=shape.batch_size
+    )
+
+    ProductImage.objects.bulk_create(
+        [
+            ProductImage(
+                product=product, display_order=display_order,
+                image=images[
+                    product_index * shape.images_per_product + display_order
+                ]
+            )
+            for product_index, product in enumerate(image_products)
+            for display_order in range(shape.images_per_product)
+        ],
+        batch_size=shape.batch_size
+    )
+
+    return image_products
+
+
+def generate_catalog(*, shape: CatalogShape) -> CatalogDataset:
+
+    """
+    Generate a synthetic catalog of the given shape.
+
+    Every generated title and slug starts with a random prefix, so
+    several catalogs can be generated in the same database.
+
+    :param shape: The shape of the synthetic catalog.
+    :return: CatalogDataset: The identifiers of the generated catalog.
+    """
+
+    rng = random.Random(shape.seed)
+    prefix = f'benchmark-{uuid.uuid4().hex[:8]}'
+
+    categories = generate_categories(shape=shape, prefix=prefix)
+    class_attributes = generate_product_classes(shape=shape, prefix=prefix, rng=rng)
+    products = generate_products(
+        shape=shape, prefix=prefix, rng=rng,
+        categories=categories, class_attributes=class_attributes
+    )
+    image_products = generate_images(
+        shape=shape, prefix=prefix, products=products
+    )
+
+    return CatalogDataset(
+        prefix=prefix,
+        category_ids=[category.pk for category in categories],
+        product_class_ids=list(class_attributes),
+        integer_attribute_ids=[
+            attribute.pk
+            for attributes in class_attributes.values()
+            for attribute in attributes
+            if attribute.type == Attribute.AttributeTypeChoice.integer
+        ],
+        product_ids=[product.pk for product in products],
+        image_product_ids=[product.pk for product in image_products],
+    )
@@ -0,0 +1,239 @@
+"""
+Timed scenarios of the catalog benchmarks.
+
+Each scenario runs one operation against a generated synthetic catalog.
+The API scenarios call the views through `APIRequestFactory`, so the
+whole view is measured (selectors, pagination, serialization and
+rendering) without the middleware and the network. The async views
+are awaited in an event loop, to compare them with their sync version.
+"""
+
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from rest_framework.test import APIRequestFactory
+
+from src.djshop.catalog.benchmarks.generator import CatalogDataset
+from src.djshop.catalog.models import Category, Image as ProductImage, Product
+
+
+PAGE_SIZE = 10
+
+Scenario = Callable[[CatalogDataset, int], Any]
+
+
+def call_api_view(*, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+
+    """
+    Call the view of a path and render its response.
+
+    :param path: The path of the API endpoint.
+    :param params: The query parameters.
+    :return: Any: The rendered response.
+    """
+
+    request = APIRequestFactory().get(path, data=params)
+    response = resolve(path).func(request)
+
+    return response.render()
+
+
+@async_to_sync
+async def call_async_view(
+    *, path: str, params: Optional[Dict[str, Any]] = None
+) -> Any:
+
+    """
+    Await the async view of a path.
+
+    :param path: The path of the async endpoint.
+    :param params: The query parameters.
+    :return: Any: The rendered response.
+    """
+
+    request = RequestFactory().get(path, data=params)
+
+    return await resolve(path).func(request)
+
+
+def category_tree_front(dataset: CatalogDataset, iteration: int) -> Any:
+
+    """
+    Render the first page of the public category list.
+    """
+
+    return call_api_view(path=reverse('api:catalog:front-category-list'))
+
+
+def category_tree_front_async(dataset: CatalogDataset, iteration: int) -> Any:
+
+    """
+    Render the first page of the public category list with the async view,
+    to compare it with `category_tree_front`. Every iteration requests
+    another URL, so the page is never served from the page cache.
+    """
+
+    return call_async_view(
+        path=reverse('api:catalog:front-category-list-async'),
+        params={'iteration': iteration}
+    )
+
+
+def category_tree_admin(dataset: CatalogDataset, iteration: int) -> Any:
+
+    """
+    Render the first page of the admin category tree, with the nested
+    children of each root category.
+    """
+
+    return call_api_view(path=reverse('api:catalog:admin-category-tree'))
+
+
+def category_deep_pagination(dataset: CatalogDataset, iteration: int) -> Any:
+
+    """
+    Render the last page of the public category list.
+    """
+
+    public_count = Category.objects.public().count()
+
+    return call_api_view(
+        path=reverse('api:catalog:front-category-list'),
+        params={'limit': PAGE_SIZE, 'offset': max(public_count - PAGE_SIZE, 0)}
+    )
+
+
+def product_attribute_filter(dataset: CatalogDataset, iteration: int) -> Any:
+
+    """
+    Count and fetch the first page of the products filtered by the value
+    of an integer attribute.
+    """
+
+    attribute_id = dataset.integer_attribute_ids[
+        iteration % len(dataset.integer_attribute_ids)
+    ]
+    products = Product.objects.filter(
+        attributevalue__attribute_id=attribute_id,
+        attributevalue__value_integer__gte=500
+    ).order_by('pk')
+
+    return products.count(), list(products[:PAGE_SIZE])
+
+
+def product_image_delete_reorder(dataset: CatalogDataset, iteration: int) -> Any:
+
+    """
+    Delete the first image of a product, which reorders its other images.
+    """
+
+    product_id = dataset.image_product_ids[
+        iteration % len(dataset.image_product_ids)
+    ]
+    product_image = ProductImage.objects.filter(product_id=product_id).first()
+
+    if product_image is not None:
+        product_image.delete()
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    'category_tree_front': category_tree_front,
+    'category_tree_front_async': category_tree_front_async,
+    'category_tree_admin': category_tree_admin,
+    'category_deep_pagination': category_deep_pagination,
+    'product_attribute_filter': product_attribute_filter,
+    'product_image_delete_reorder': product_image_delete_reorder,
+}
+
+
+def run_scenario(
+    *, scenario: Scenario, dataset: CatalogDataset, repeat: int
+) -> Dict[str, Any]:
+
+    """
+    Run a scenario several times, and summarize its timings and queries.
+
+    The first run warms the caches up and isn't measured.
+
+    :param scenario: The scenario to run.
+    :param dataset: The generated synthetic catalog.
+    :param repeat: The number of measured runs.
+    :return: Dict[str, Any]: The timings, in milliseconds, and the number
+        of queries of the slowest run.
+    """
+
+    scenario(dataset, 0)
+
+    timings: List[float] = []
+    query_counts: List[int] = []
+
+    for iteration in range(1, repeat + 1):
+        with CaptureQueriesContext(connection) as captured_queries:
+            start = time.perf_counter()
+            scenario(dataset, iteration)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        query_counts.append(len(captured_queries))
+
+    return {
+        'repeat': repeat,
+        'min': round(min(timings), 3),
+        'median': round(statistics.median(timings), 3),
+        'mean': round(statistics.mean(timings), 3),
+        'max': round(max(timings), 3),
+        'queries': max(query_counts),
+    }
+
+
+def run_scenarios(
+    *, dataset: CatalogDataset, names: List[str], repeat: int
+) -> Dict[str, Dict[str, Any]]:
+
+    """
+    Run the given scenarios.
+
+    :param dataset: The generated synthetic catalog.
+    :param names: The names of the scenarios to run.
+    :param repeat: The number of measured runs of each scenario.
+    :return: Dict[str, Dict[str, Any]]: The results, per scenario name.
+    """
+
+    return {
+        name: run_scenario(scenario=SCENARIOS[name], dataset=dataset, repeat=repeat)
+        for name in names
+    }
+
+
+def compare_results(
+    *, results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]], threshold: float
+) -> Dict[str, float]:
+
+    """
+    Find the scenarios whose median is slower than the baseline by more
+    than the threshold.
+
+    :param results: The results of the current run, per scenario name.
+    :param baseline: The results of the baseline run, per scenario name.
+    :param threshold: The allowed slowdown ratio, e.g. 0.2 for 20%.
+    :return: Dict[str, float]: The slowdown ratio of the regressed scenarios.
+    """
+
+    regressions = {}
+
+    for name, result in results.items():
+        baseline_result = baseline.get(name)
+        if not baseline_result or not baseline_result['median']:
+            continue
+
+        slowdown = result['median'] / baseline_result['median'] - 1
+        if slowdown > threshold:
+            regressions[name] = round(slowdown, 3)
+
+    return regressions
@@ -0,0 +1,115 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import django_stubs_ext
+from django import forms
+from django.contrib import admin
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.urls import reverse
+
+from src.djshop.catalog.models import Category
+
+
+django_stubs_ext.monkeypatch()
+
+
+class CategoryAutocompleteSelect(AutocompleteSelect):
+
+    """
+    Admin autocomplete widget picking a category, backed by
+    `CategoryAdmin.parent_autocomplete_view` instead of a `<select>`
+    rendering every category.
+
+    Only the selected category is rendered with the page, the others
+    are searched by title while typing.
+    """
+
+    url_name = 'admin:catalog_category_parent_autocomplete'
+
+    def __init__(self, attrs: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__(
+            field=Category._meta.pk, admin_site=admin.site, attrs=attrs
+        )
+
+    def get_url(self) -> str:
+        return reverse(self.url_name)
+
+    def optgroups(
+            self, name: str, value: Sequence[str],
+            attrs: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Optional[str], List[Dict[str, Any]], Optional[int]]]:
+
+        """
+        Render the selected category only (the widget's field is the
+        category primary key, not a relation, so Django's implementation
+        can't find the related model).
+        """
+
+        options: List[Dict[str, Any]] = []
+        selected_choices = {
+            str(choice) for choice in value
+            if str(choice) not in self.choices.field.empty_values
+        }
+
+        if not self.is_required:
+            options.append(self.create_option(name, '', '', False, 0))
+
+        for category in self.choices.queryset.filter(pk__in=selected_choices):
+            options.append(self.create_option(
+                name, category.pk, self.choices.field.label_from_instance(category),
+                True, len(options)
+            ))
+
+        return [(None, options, 0)]
+
+
+class CategoryAdminForm(forms.ModelForm[Category]):
+
+    """
+    Admin form of a category, with its parent picked by autocomplete.
+
+    This form replaces treebeard's `movenodeform_factory` form, whose
+    parent `<select>` loads every category with its ancestors.
+    The node is added or moved by `CategoryAdmin.save_model`.
+    """
+
+    parent = forms.ModelChoiceField(
+        queryset=Category.objects.all(), required=False,
+        widget=CategoryAutocompleteSelect(),
+        help_text='Leave empty to make it a root category.'
+    )
+
+    class Meta:
+        model = Category
+        fields = ['title', 'slug', 'description', 'is_public']
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+
+        """
+        Set the current parent of an existing category as the initial parent.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        if self.instance.pk is not None and not self.instance.is_root():
+            self.fields['parent'].initial = self.instance.get_parent()
+
+    def clean_parent(self) -> Optional['Category']:
+
+        """
+        Check that a category isn't moved under itself or its descendants.
+
+        :return: Optional[Category]: The parent category, None for a root.
+
+        :raises forms.ValidationError: If the parent is the category itself
+            or one of its descendants.
+        """
+
+        parent: Optional['Category'] = self.cleaned_data['parent']
+
+        if parent is not None and self.instance.pk is not None and \
+                parent.path.startswith(self.instance.path):
+            raise forms.ValidationError(
+                'A category can\'t be moved under itself or its descendants.'
+            )
+
+        return parent
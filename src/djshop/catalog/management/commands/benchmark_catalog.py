@@ -0,0 +1,150 @@
+"""
+Django command to benchmark the catalog against a synthetic catalog.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.utils import timezone
+
+from src.djshop.catalog.benchmarks.generator import CatalogShape, generate_catalog
+from src.djshop.catalog.benchmarks.scenarios import (
+    SCENARIOS, compare_results, run_scenarios,
+)
+
+
+class Command(BaseCommand):
+    """
+    Django's management command that generates a synthetic catalog of
+    a configurable shape, runs the timed catalog scenarios against it,
+    and stores the results as JSON.
+
+    The synthetic catalog is rolled back at the end of the run, unless
+    `--keep-data` is given.
+
+    Example:
+        python manage.py benchmark_catalog --products 100000 \
+            --output benchmarks/main.json --baseline benchmarks/previous.json
+    """
+
+    help = 'Benchmark the catalog against a synthetic catalog.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+
+        """
+        Add the command's arguments.
+
+        :param parser: The command's argument parser.
+        :return: None
+        """
+
+        for field_name, default in CatalogShape._field_defaults.items():
+            parser.add_argument(
+                f'--{field_name.replace("_", "-")}', type=int, default=default,
+                help=f'Synthetic catalog shape (default: {default}).'
+            )
+
+        parser.add_argument(
+            '--scenario', action='append', choices=list(SCENARIOS), dest='scenarios',
+            help='Scenario to run, may be repeated (default: all of them).'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=10,
+            help='Number of measured runs of each scenario.'
+        )
+        parser.add_argument('--output', type=Path, help='JSON results file.')
+        parser.add_argument(
+            '--baseline', type=Path,
+            help='JSON results file of a previous run to compare with.'
+        )
+        parser.add_argument(
+            '--threshold', type=float, default=0.2,
+            help='Allowed median slowdown against the baseline (default: 0.2).'
+        )
+        parser.add_argument(
+            '--keep-data', action='store_true',
+            help='Commit the synthetic catalog instead of rolling it back.'
+        )
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Run even when DEBUG is disabled.'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+
+        """
+        Command's entry point.
+
+        :param args: Additional command-line arguments
+        :param options: Additional options
+        :return: None
+
+        :raises CommandError: If the command runs outside of DEBUG without
+            `--force`, or if a scenario regressed against the baseline.
+        """
+
+        if not settings.DEBUG and not options['force']:
+            raise CommandError(
+                'The benchmark writes a synthetic catalog, use --force to run '
+                'it with DEBUG disabled.'
+            )
+
+        shape = CatalogShape(**{
+            field_name: options[field_name] for field_name in CatalogShape._fields
+        })
+        scenario_names = options['scenarios'] or list(SCENARIOS)
+
+        with transaction.atomic():
+            start = time.perf_counter()
+            dataset = generate_catalog(shape=shape)
+            generation_time = time.perf_counter() - start
+
+            self.stdout.write(
+                f'Generated the synthetic catalog in {generation_time:.2f}s.'
+            )
+
+            results = run_scenarios(
+                dataset=dataset, names=scenario_names, repeat=options['repeat']
+            )
+
+            if not options['keep_data']:
+                transaction.set_rollback(True)
+
+        for name, result in results.items():
+            self.stdout.write(
+                f'{name}: median {result["median"]}ms, max {result["max"]}ms, '
+                f'{result["queries"]} queries'
+            )
+
+        if options['output']:
+            options['output'].write_text(json.dumps({
+                'created_at': timezone.now().isoformat(),
+                'database': connection.vendor,
+                'shape': shape._asdict(),
+                'generation_time': round(generation_time, 3),
+                'scenarios': results,
+            }, indent=2))
+
+        if options['baseline']:
+            baseline = json.loads(options['baseline'].read_text())
+            regressions = compare_results(
+                results=results, baseline=baseline['scenarios'],
+                threshold=options['threshold']
+            )
+
+            if regressions:
+                raise CommandError(
+                    'Regressed scenarios: ' + ', '.join(
+                        f'{name} (+{slowdown:.0%})'
+                        for name, slowdown in regressions.items()
+                    )
+                )
+
+            self.stdout.write(
+                self.style.SUCCESS('No regression against the baseline.')
+            )
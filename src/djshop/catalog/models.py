@@ -1,11 +1,12 @@
+from functools import partial
 from typing import Any, Optional
 
 from django.db import models
-from django.utils.text import slugify
 from treebeard.mp_tree import MP_Node
 
 from src.djshop.catalog.managers import CategoryQuerySet
 from src.djshop.common.models import BaseModel
+from src.djshop.common.slugs import save_with_unique_slug
 from src.djshop.utils.db.fields import UpperCaseCharField
 
 
@@ -37,15 +38,16 @@ class Category(MP_Node, BaseModel):
     def save(self, *args: Any, **kwargs: Any) -> None:
 
         """
-        Overrides the save method to generate the slug based on the title.
+        Overrides the save method to generate a unique slug based on the title,
+        if the slug is empty (again if a concurrent save takes it first).
 
         :param: args: Variable length argument list.
         :param: kwargs: Arbitrary keyword arguments.
         """
 
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        save_with_unique_slug(
+            instance=self, save=partial(super().save, *args, **kwargs)
+        )
 
     def __str__(self) -> str:
 
@@ -74,15 +76,16 @@ class OptionGroup(BaseModel):
     def save(self, *args: Any, **kwargs: Any) -> None:
 
         """
-        Overrides the save method to generate the slug based on the title.
+        Overrides the save method to generate a unique slug based on the title,
+        if the slug is empty (again if a concurrent save takes it first).
 
         :param: args: Variable length argument list.
         :param: kwargs: Arbitrary keyword arguments.
         """
 
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        save_with_unique_slug(
+            instance=self, save=partial(super().save, *args, **kwargs)
+        )
 
     def __str__(self) -> str:
 
@@ -153,15 +156,16 @@ class Option(BaseModel):
     def save(self, *args: Any, **kwargs: Any) -> None:
 
         """
-        Overrides the save method to generate the slug based on the title.
+        Overrides the save method to generate a unique slug based on the title,
+        if the slug is empty (again if a concurrent save takes it first).
 
         :param: args: Variable length argument list.
         :param: kwargs: Arbitrary keyword arguments.
         """
 
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        save_with_unique_slug(
+            instance=self, save=partial(super().save, *args, **kwargs)
+        )
 
     def __str__(self) -> str:
 
@@ -198,15 +202,16 @@ class ProductClass(BaseModel):
     def save(self, *args: Any, **kwargs: Any) -> None:
 
         """
-        Overrides the save method to generate the slug based on the title.
+        Overrides the save method to generate a unique slug based on the title,
+        if the slug is empty (again if a concurrent save takes it first).
 
         :param: args: Variable length argument list.
         :param: kwargs: Arbitrary keyword arguments.
         """
 
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        save_with_unique_slug(
+            instance=self, save=partial(super().save, *args, **kwargs)
+        )
 
     def __str__(self) -> str:
 
@@ -326,15 +331,16 @@ class Product(BaseModel):
     def save(self, *args: Any, **kwargs: Any) -> None:
 
         """
-        Overrides the save method to generate the slug based on the title.
+        Overrides the save method to generate a unique slug based on the title,
+        if the slug is empty (again if a concurrent save takes it first).
 
         :param: args: Variable length argument list.
         :param: kwargs: Arbitrary keyword arguments.
         """
 
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        save_with_unique_slug(
+            instance=self, save=partial(super().save, *args, **kwargs)
+        )
 
     def __str__(self) -> str:
 
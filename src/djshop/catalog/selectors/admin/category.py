@@ -1,8 +1,9 @@
-from typing import cast
+from typing import Optional, cast
 
 from django.db.models import QuerySet
 
 from src.djshop.catalog.models import Category
+from src.djshop.common.types import ResourceVersion
 
 
 def get_category_tree() -> QuerySet['Category']:
@@ -41,3 +42,73 @@ def get_category_node(*, category_slug: str) -> 'Category':
     get_category_obj = Category.objects.get(slug=category_slug)
 
     return get_category_obj
+
+
+def get_category_node_version(*, category_slug: str) -> ResourceVersion:
+
+    """
+    Retrieve the version of a specific category by its slug.
+
+    Tree operations (adding, deleting or moving children) update `path`,
+    `depth` and `numchild` without touching `updated_at`, so they are part
+    of the fingerprint as well, along with the version checked by
+    the conditional updates. For the same reason, the node is validated
+    with its ETag only: a client revalidating with `If-Modified-Since`
+    alone would keep a stale `numchild`.
+
+    :param category_slug: (str): The slug of the category.
+
+    :return: ResourceVersion: The version of the category, with an empty
+        fingerprint if the category does not exist.
+    """
+
+    category_node_row = Category.objects.filter(slug=category_slug).values_list(
+        'path', 'depth', 'numchild', 'version', 'updated_at'
+    ).first()
+
+    if category_node_row is None:
+        return ResourceVersion(fingerprint='', last_modified=None)
+
+    path, depth, numchild, version, updated_at = category_node_row
+
+    return ResourceVersion(
+        fingerprint=f'{path}:{depth}:{numchild}:{version}:{updated_at.isoformat()}',
+        last_modified=None, version=version
+    )
+
+
+def get_category_children(
+    *, parent_category: Optional['Category'], after_path: Optional[str] = None,
+    limit: int = 100
+) -> QuerySet['Category']:
+
+    """
+    Retrieve a page of the direct children of a category, in tree order.
+
+    The children are looked up with a range on the indexed `path` column
+    (every child path is the parent path followed by one step) and their
+    depth, so the cost depends on the page size, not on the tree size.
+    The pages are keyed by the path of the last child of the previous page.
+
+    :param parent_category: The parent category, None for the root categories.
+    :param after_path: The path of the last child of the previous page.
+    :param limit: The maximum number of children to return.
+
+    :return: QuerySet[Category]: A page of the children of the category.
+    """
+
+    parent_path = parent_category.path if parent_category is not None else ''
+    depth = parent_category.depth + 1 if parent_category is not None else 1
+
+    first_step = Category.alphabet[0] * Category.steplen
+    last_step = Category.alphabet[-1] * Category.steplen
+
+    children = Category.objects.filter(
+        path__range=(parent_path + first_step, parent_path + last_step),
+        depth=depth
+    )
+
+    if after_path is not None:
+        children = children.filter(path__gt=after_path)
+
+    return cast(QuerySet['Category'], children.order_by('path')[:limit])
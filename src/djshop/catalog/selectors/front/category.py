@@ -1,29 +1,38 @@
-from typing import cast
+from datetime import datetime
+from typing import Optional, cast
 
-from django.db.models import QuerySet
+from django.db.models import Count, Max, QuerySet
 
 from src.djshop.catalog.models import Category
+from src.djshop.common.types import ResourceVersion
+from src.djshop.utils.db.routers import get_read_database_alias
 
 
-def get_category_tree() -> QuerySet['Category']:
+def get_category_tree(*, using: Optional[str] = None) -> QuerySet['Category']:
 
     """
     Retrieve a queryset containing all root categories.
 
     This function retrieves a queryset containing all Category
     instances that are at the root level (depth=1).
+    The categories are read from a read replica, if any.
+
+    :param using: (Optional[str]): The database alias to read from, the one
+        the version of the list was read from. None to pick one.
 
     Returns:
         QuerySet[Category]: A queryset containing all root Category instances.
     """
 
-    categories = Category.objects.public()
+    categories = Category.objects.using(using or get_read_database_alias()).public()
 
     # Use cast to explicitly specify the type (helpful for type checkers like mypy)
     return cast(QuerySet['Category'], categories)
 
 
-def get_category_node(*, category_slug: str) -> 'Category':
+def get_category_node(
+    *, category_slug: str, using: Optional[str] = None
+) -> 'Category':
 
     """
     Retrieve detailed information about a specific category by its slug.
@@ -31,12 +40,172 @@ def get_category_node(*, category_slug: str) -> 'Category':
     This function retrieves the detailed representation of a category
     based on its slug. It includes information such as the category's
     title, description and public.
+    The category is read from a read replica, if any.
 
     :param category_slug: (str): The slug of the category to retrieve.
+    :param using: (Optional[str]): The database alias to read from, the one
+        the version of the category was read from. None to pick one.
 
     :return: Category: The detailed representation of the category.
     """
 
-    get_category_obj = Category.objects.public().get(slug=category_slug)
+    get_category_obj = Category.objects.using(
+        using or get_read_database_alias()
+    ).public().get(slug=category_slug)
 
     return cast('Category', get_category_obj)
+
+
+def build_category_tree_version(
+    *, count: int, last_modified: Optional[datetime]
+) -> ResourceVersion:
+
+    """
+    Build the version of the public category list from its aggregate.
+
+    The list is validated with its ETag only. Its latest modification time
+    doesn't change when a category other than the latest modified one is
+    deleted or hidden, so a client revalidating with `If-Modified-Since`
+    alone would keep a stale copy: it is part of the fingerprint instead
+    of being sent as `Last-Modified`.
+
+    :param count: The number of public categories.
+    :param last_modified: Their latest modification time.
+
+    :return: ResourceVersion: The version of the public category list.
+    """
+
+    return ResourceVersion(
+        fingerprint=':'.join([
+            str(count), last_modified.isoformat() if last_modified else ''
+        ]),
+        last_modified=None
+    )
+
+
+def get_category_tree_version(*, using: Optional[str] = None) -> ResourceVersion:
+
+    """
+    Retrieve the version of the public category list.
+
+    The version is derived from the number of public categories and
+    their latest modification time, with a single aggregate query,
+    so it is cheap enough to be checked before running
+    `get_category_tree`.
+
+    :param using: (Optional[str]): The database alias to read from.
+        None to pick one.
+
+    :return: ResourceVersion: The version of the public category list.
+    """
+
+    category_tree_aggregate = Category.objects.using(
+        using or get_read_database_alias()
+    ).public().aggregate(
+        count=Count('id'), last_modified=Max('updated_at')
+    )
+
+    return build_category_tree_version(
+        count=category_tree_aggregate['count'],
+        last_modified=category_tree_aggregate['last_modified']
+    )
+
+
+def get_category_node_version(
+    *, category_slug: str, using: Optional[str] = None
+) -> ResourceVersion:
+
+    """
+    Retrieve the version of a specific public category by its slug.
+
+    :param category_slug: (str): The slug of the category.
+    :param using: (Optional[str]): The database alias to read from.
+        None to pick one.
+
+    :return: ResourceVersion: The version of the category, with an empty
+        fingerprint if the category does not exist.
+    """
+
+    category_node_aggregate = Category.objects.using(
+        using or get_read_database_alias()
+    ).public().filter(slug=category_slug).aggregate(
+        count=Count('id'), last_modified=Max('updated_at')
+    )
+
+    return ResourceVersion(
+        fingerprint=str(category_node_aggregate['count']),
+        last_modified=category_node_aggregate['last_modified']
+    )
+
+
+async def aget_category_node(
+    *, category_slug: str, using: Optional[str] = None
+) -> 'Category':
+
+    """
+    Async version of `get_category_node`, for the async views.
+
+    :param category_slug: (str): The slug of the category to retrieve.
+    :param using: (Optional[str]): The database alias to read from.
+        None to pick one.
+
+    :return: Category: The detailed representation of the category.
+    """
+
+    category_obj = await Category.objects.using(
+        using or get_read_database_alias()
+    ).public().aget(slug=category_slug)
+
+    return cast('Category', category_obj)
+
+
+async def aget_category_tree_version(
+    *, using: Optional[str] = None
+) -> ResourceVersion:
+
+    """
+    Async version of `get_category_tree_version`, for the async views.
+
+    :param using: (Optional[str]): The database alias to read from.
+        None to pick one.
+
+    :return: ResourceVersion: The version of the public category list.
+    """
+
+    category_tree_aggregate = await Category.objects.using(
+        using or get_read_database_alias()
+    ).public().aaggregate(
+        count=Count('id'), last_modified=Max('updated_at')
+    )
+
+    return build_category_tree_version(
+        count=category_tree_aggregate['count'],
+        last_modified=category_tree_aggregate['last_modified']
+    )
+
+
+async def aget_category_node_version(
+    *, category_slug: str, using: Optional[str] = None
+) -> ResourceVersion:
+
+    """
+    Async version of `get_category_node_version`, for the async views.
+
+    :param category_slug: (str): The slug of the category.
+    :param using: (Optional[str]): The database alias to read from.
+        None to pick one.
+
+    :return: ResourceVersion: The version of the category, with an empty
+        fingerprint if the category does not exist.
+    """
+
+    category_node_aggregate = await Category.objects.using(
+        using or get_read_database_alias()
+    ).public().filter(slug=category_slug).aaggregate(
+        count=Count('id'), last_modified=Max('updated_at')
+    )
+
+    return ResourceVersion(
+        fingerprint=str(category_node_aggregate['count']),
+        last_modified=category_node_aggregate['last_modified']
+    )
@@ -131,3 +131,18 @@ class CategoryNodeInPutSerializer(
     description = serializers.CharField(max_length=2048)
     is_public = serializers.BooleanField()
     parent_node = serializers.SlugField(required=False, allow_null=True)
+
+
+class CategoryNodeMoveInPutSerializer(
+    serializers.Serializer['Category']
+):
+
+    """
+    Serializer class for handling input data for moving a Category node.
+
+    Attributes:
+        parent_node (SlugField): The new parent node category of the category,
+            null to move the category to the root categories.
+    """
+
+    parent_node = serializers.SlugField(allow_null=True)
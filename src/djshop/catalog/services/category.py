@@ -1,7 +1,34 @@
-from typing import Dict, cast
+from typing import Dict, List, Optional, cast
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import F, Func, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Concat, Length, Now, Substr
+from treebeard.exceptions import PathOverflow
 
 from src.djshop.catalog.models import Category
+from src.djshop.cdn.keys import (
+    get_list_surrogate_key, get_model_namespace, get_surrogate_keys,
+)
+from src.djshop.cdn.services import purge_surrogate_keys
 from src.djshop.common.services import model_update
+from src.djshop.core.exceptions import ConcurrentTreeChangeError
+
+
+def purge_category_pages(*, category_ids: List[int]) -> None:
+
+    """
+    Purge the edge cached pages of the given categories and of the
+    category list, once the transaction commits.
+
+    :param category_ids: The IDs of the changed categories.
+    """
+
+    namespace = get_model_namespace(model=Category)
+    purge_surrogate_keys(surrogate_keys=[
+        get_list_surrogate_key(namespace=namespace),
+        *get_surrogate_keys(namespace=namespace, identifiers=category_ids)
+    ])
 
 
 def create_category_node(*, category_node_data: Dict[str, str]) -> 'Category':
@@ -17,6 +44,8 @@ def create_category_node(*, category_node_data: Dict[str, str]) -> 'Category':
             This should include the fields for the Category model, and optionally
             a 'parent_node' field with the slug of the parent Category.
 
+    The edge cached category list is purged once the transaction commits.
+
     :returns: Category: The created Category node.
     """
 
@@ -31,11 +60,16 @@ def create_category_node(*, category_node_data: Dict[str, str]) -> 'Category':
             category_parent_node.add_child(**category_node_data)
         )
 
+    purge_surrogate_keys(surrogate_keys=[
+        get_list_surrogate_key(namespace=get_model_namespace(model=Category))
+    ])
+
     return category_obj
 
 
 def update_category_node(
-    *, category_slug: str, category_node_data: Dict[str, str]
+    *, category_slug: str, category_node_data: Dict[str, str],
+    expected_version: Optional[int] = None
 ) -> 'Category':
 
     """
@@ -51,6 +85,15 @@ def update_category_node(
     :param category_node_data: A dictionary containing the updated
     data for the category node.
     It may include 'title', 'description', and 'is_public' fields.
+    :param expected_version: The version the client read the node at,
+    None to update the node at the version it is read at here.
+
+    The node is updated with a conditional `UPDATE` on its version, so
+    a concurrent update raises a `ConcurrentUpdateError` instead of being
+    silently overwritten.
+
+    If the node has changed, the edge cached pages of the node and of
+    the category list are purged once the transaction commits.
 
     :return: The updated Category node instance.
     """
@@ -63,9 +106,13 @@ def update_category_node(
 
     # Perform the update using the model_update function.
     updated_category_node, has_updated = model_update(
-        instance=get_category_node, fields=fields, data=category_node_data
+        instance=get_category_node, fields=fields, data=category_node_data,
+        expected_version=expected_version
     )
 
+    if has_updated:
+        purge_category_pages(category_ids=[updated_category_node.pk])
+
     return updated_category_node
 
 
@@ -78,6 +125,8 @@ def delete_category_node(
 
     This function first retrieves the category object based on the provided
     category_slug and then proceeds to delete the category object.
+    The edge cached pages of the node, its descendants and the category
+    list are purged once the transaction commits.
 
     :raises Movie.DoesNotExist: If no category with the provided category_slug exists
         in the database.
@@ -89,4 +138,233 @@ def delete_category_node(
 
     get_category_node = Category.objects.get(slug=category_slug)
 
+    # The descendants are deleted along with the node.
+    deleted_category_ids = [
+        get_category_node.pk,
+        *get_category_node.get_descendants().values_list('pk', flat=True)
+    ]
+
     get_category_node.delete()
+
+    purge_category_pages(category_ids=deleted_category_ids)
+
+
+def get_category_path_step(*, step: int) -> str:
+
+    """
+    Encode a step number as a step of the materialized path of the
+    category tree, the way treebeard does.
+
+    :param step: The number of the step, starting from 1.
+
+    :raises PathOverflow: If the number doesn't fit in a step.
+
+    :return: str: The step, padded to the step length of the tree.
+    """
+
+    alphabet = Category.alphabet
+    key = ''
+    while step:
+        step, digit = divmod(step, len(alphabet))
+        key = alphabet[digit] + key
+
+    if len(key) > Category.steplen:
+        raise PathOverflow('The path step is out of the alphabet range.')
+
+    return key.rjust(Category.steplen, alphabet[0])
+
+
+def get_category_path_step_number(*, path: str) -> int:
+
+    """
+    Decode the last step of a materialized path of the category tree.
+
+    :param path: The path of a category.
+    :return: int: The number of its last step.
+    """
+
+    alphabet = Category.alphabet
+    step = 0
+    for char in path[-Category.steplen:]:
+        step = step * len(alphabet) + alphabet.index(char)
+
+    return step
+
+
+def get_category_child_path(*, parent_path: str, depth: int) -> str:
+
+    """
+    Build the path of a new last child of a category, locking the current
+    last child until the end of the transaction.
+
+    The lock makes the concurrent moves under the same parent (the root
+    categories included, which have no parent row to lock) wait for each
+    other. The last child is read again once it is locked, as a waiting
+    move only sees the children moved in by the others in a new statement.
+
+    :param parent_path: The path of the parent category, empty for the roots.
+    :param depth: The depth of the new child.
+
+    :raises PathOverflow: If the parent category has no free step left.
+
+    :return: str: The path of the new last child.
+    """
+
+    first_step = Category.alphabet[0] * Category.steplen
+    last_step = Category.alphabet[-1] * Category.steplen
+
+    children = Category.objects.filter(
+        path__range=(parent_path + first_step, parent_path + last_step),
+        depth=depth
+    ).order_by('-path')
+
+    list(children.select_for_update().values_list('pk', flat=True)[:1])
+    last_child_path = children.values_list('path', flat=True).first()
+
+    if last_child_path is None:
+        return parent_path + get_category_path_step(step=1)
+
+    return parent_path + get_category_path_step(
+        step=get_category_path_step_number(path=last_child_path) + 1
+    )
+
+
+@transaction.atomic
+def move_category_node(
+    *, category_slug: str, parent_node_slug: Optional[str]
+) -> 'Category':
+
+    """
+    Move a category node, with its whole subtree, to the end of the children
+    of another category, or to the end of the root categories.
+
+    Unlike treebeard's `move`, which loads and saves the moved nodes, the
+    paths of the subtree are rewritten with a single `UPDATE` replacing
+    their prefix (`new_path || substr(path, n)`), with the depth shifted
+    by the same offset. The new prefix is a free step of the new parent,
+    so the rewritten paths can't collide with the existing ones. Only the
+    `numchild` of the old and new parents changes, by one.
+
+    The moved node, the new parent and its last child are locked for
+    the duration of the transaction, and the edge cached pages of
+    the category list and of the moved node are purged once it commits.
+
+    :param category_slug: The slug of the category node to be moved.
+    :param parent_node_slug: The slug of the new parent category node,
+        None to move the node to the root categories.
+
+    :raises Category.DoesNotExist: If either category doesn't exist.
+    :raises ValidationError: If the new parent is the node itself or one
+        of its descendants.
+    :raises ConcurrentTreeChangeError: If a category added concurrently
+        took the new path of the node.
+
+    :return: Category: The moved category node.
+    """
+
+    category_node = cast(
+        'Category', Category.objects.select_for_update().get(slug=category_slug)
+    )
+
+    parent_path = ''
+    if parent_node_slug is not None:
+        parent_node = Category.objects.select_for_update().get(
+            slug=parent_node_slug
+        )
+        parent_path = parent_node.path
+
+        if parent_path.startswith(category_node.path):
+            raise ValidationError(
+                {'parent_node': "A category can't be moved under itself or "
+                                "one of its descendants."}
+            )
+
+    old_path = category_node.path
+    old_parent_path = old_path[:-Category.steplen]
+
+    if old_parent_path == parent_path:
+        return category_node
+
+    depth = len(parent_path) // Category.steplen + 1
+    new_path = get_category_child_path(parent_path=parent_path, depth=depth)
+
+    # `updated_at` is bumped as the tree order is part of the category list.
+    # `add_root` and `add_child` don't lock the last child, so a node added
+    # concurrently can still take the new path.
+    try:
+        Category.objects.filter(path__startswith=old_path).update(
+            path=Concat(Value(new_path), Substr('path', len(old_path) + 1)),
+            depth=F('depth') + (depth - category_node.depth),
+            updated_at=Now()
+        )
+    except IntegrityError as exc:
+        raise ConcurrentTreeChangeError(
+            message='A category was added to the new parent concurrently.'
+        ) from exc
+
+    # The parents' `numchild` is part of their representation too.
+    if old_parent_path:
+        Category.objects.filter(path=old_parent_path).update(
+            numchild=F('numchild') - 1, updated_at=Now()
+        )
+    if parent_path:
+        Category.objects.filter(path=parent_path).update(
+            numchild=F('numchild') + 1, updated_at=Now()
+        )
+
+    # The edge cached pages of the other moved nodes don't render
+    # their position in the tree.
+    purge_category_pages(category_ids=[category_node.pk])
+
+    category_node.refresh_from_db()
+
+    return category_node
+
+
+def repair_category_nodes(*, category_ids: List[int]) -> List[int]:
+
+    """
+    Repair the `depth` and the `numchild` of the given category nodes,
+    which drift after a failed or a raw tree operation.
+
+    Both are derived from the materialized paths, the source of truth of
+    the tree, with set-based statements: only the drifted nodes are
+    selected and updated, and their edge cached pages are purged.
+
+    :param category_ids: The IDs of the category nodes to be verified.
+    :return: List[int]: The IDs of the repaired category nodes.
+    """
+
+    depth = Length('path') / Category.steplen
+    child_count = Subquery(
+        Category.objects.annotate(path_length=Length('path')).filter(
+            path__startswith=OuterRef('path'),
+            path_length=Length(OuterRef('path')) + Category.steplen,
+        ).order_by().annotate(
+            child_count=Func(F('pk'), function='COUNT')
+        ).values('child_count'),
+        output_field=IntegerField()
+    )
+
+    category_nodes = Category.objects.filter(pk__in=category_ids)
+
+    with transaction.atomic():
+        drifted_depth_ids = list(
+            category_nodes.exclude(depth=depth).values_list('pk', flat=True)
+        )
+        drifted_numchild_ids = list(
+            category_nodes.annotate(child_count=child_count).exclude(
+                numchild=F('child_count')
+            ).values_list('pk', flat=True)
+        )
+
+        Category.objects.filter(pk__in=drifted_depth_ids).update(depth=depth)
+        Category.objects.filter(pk__in=drifted_numchild_ids).update(
+            numchild=child_count
+        )
+
+        repaired_ids = sorted({*drifted_depth_ids, *drifted_numchild_ids})
+        if repaired_ids:
+            purge_category_pages(category_ids=repaired_ids)
+
+    return repaired_ids
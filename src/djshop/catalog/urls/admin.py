@@ -1,7 +1,8 @@
 from django.urls import path
 
 from src.djshop.catalog.apis.admin.category import (
-    CategoryNodeAPIView, CategoryNodeCreateAPIView, CategoryTreeAPIView,
+    CategoryNodeAPIView, CategoryNodeCreateAPIView, CategoryNodeMoveAPIView,
+    CategoryTreeAPIView,
 )
 
 
@@ -12,6 +13,12 @@ urlpatterns = [
             name='admin-category-node'
       ),
 
+      path(
+            route='category/<slug:category_slug>/move/',
+            view=CategoryNodeMoveAPIView.as_view(),
+            name='admin-move-category-node'
+      ),
+
       path(
             route='category/',
             view=CategoryNodeCreateAPIView.as_view(),
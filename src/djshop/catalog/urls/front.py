@@ -1,7 +1,8 @@
 from django.urls import path
 
 from src.djshop.catalog.apis.front.category import (
-    CategoryNodeAPIView, CategoryTreeAPIView,
+    AsyncCategoryNodeAPIView, AsyncCategoryTreeAPIView, CategoryNodeAPIView,
+    CategoryTreeAPIView,
 )
 
 
@@ -16,5 +17,17 @@ urlpatterns = [
             route='category/<slug:category_slug>/',
             view=CategoryNodeAPIView.as_view(),
             name='front-category-node'
+      ),
+
+      path(
+            route='async/categories/',
+            view=AsyncCategoryTreeAPIView.as_view(),
+            name='front-category-list-async'
+      ),
+
+      path(
+            route='async/category/<slug:category_slug>/',
+            view=AsyncCategoryNodeAPIView.as_view(),
+            name='front-category-node-async'
       )
 ]
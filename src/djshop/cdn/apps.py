@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+
+class CdnConfig(AppConfig):
+    name = 'src.djshop.cdn'
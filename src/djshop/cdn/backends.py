@@ -0,0 +1,110 @@
+import urllib.request
+from functools import lru_cache
+from typing import ClassVar, List, Sequence, Type
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class BasePurgeBackend:
+
+    """
+    Base class for the edge cache purge backends.
+
+    A purge backend invalidates every cached page tagged with one
+    of the given surrogate keys.
+    """
+
+    def purge(self, *, surrogate_keys: Sequence[str]) -> None:
+
+        """
+        Purge the cached pages tagged with the given surrogate keys.
+
+        :param surrogate_keys: The surrogate keys to be purged.
+        """
+
+        raise NotImplementedError
+
+
+class LocalPurgeBackend(BasePurgeBackend):
+
+    """
+    Stand-in purge backend which only records the purged keys in memory.
+
+    This is the default backend for local development and tests, where
+    there is no edge cache in front of Django.
+    """
+
+    purged_keys: ClassVar[List[str]] = []
+
+    def purge(self, *, surrogate_keys: Sequence[str]) -> None:
+
+        """
+        Record the purged surrogate keys.
+
+        :param surrogate_keys: The surrogate keys to be purged.
+        """
+
+        self.purged_keys.extend(surrogate_keys)
+
+    @classmethod
+    def reset(cls) -> None:
+
+        """
+        Forget the recorded surrogate keys.
+        """
+
+        cls.purged_keys.clear()
+
+
+class HTTPPurgeBackend(BasePurgeBackend):
+
+    """
+    Purge backend for edge caches with a surrogate-key purge HTTP API
+    (Fastly, Varnish with xkey...).
+
+    All keys are sent in a single `POST` request to `CDN_PURGE_URL`,
+    in a space separated `Surrogate-Key` header.
+    """
+
+    def purge(self, *, surrogate_keys: Sequence[str]) -> None:
+
+        """
+        Send a purge request for the given surrogate keys.
+
+        :param surrogate_keys: The surrogate keys to be purged.
+
+        :raises URLError: If the purge API can't be reached or
+            returns an error status.
+        """
+
+        if not surrogate_keys:
+            return
+
+        purge_request = urllib.request.Request(
+            url=settings.CDN_PURGE_URL, method='POST',
+            headers={'Surrogate-Key': ' '.join(surrogate_keys)}
+        )
+
+        if settings.CDN_PURGE_TOKEN:
+            purge_request.add_header('Fastly-Key', settings.CDN_PURGE_TOKEN)
+
+        with urllib.request.urlopen(
+                purge_request, timeout=settings.CDN_PURGE_TIMEOUT
+        ):
+            pass
+
+
+@lru_cache(maxsize=None)
+def get_purge_backend() -> BasePurgeBackend:
+
+    """
+    Return the purge backend configured by the `CDN_PURGE_BACKEND` setting.
+
+    :return: BasePurgeBackend: The configured purge backend instance.
+    """
+
+    purge_backend_class: Type[BasePurgeBackend] = import_string(
+        settings.CDN_PURGE_BACKEND
+    )
+    return purge_backend_class()
@@ -0,0 +1,72 @@
+from typing import Iterable, List, Type, Union, cast
+
+from django.db.models import Model
+
+
+# Surrogate key tagging every page which lists objects of a namespace,
+# e.g. `category:list`.
+LIST_SURROGATE_KEY_SUFFIX = 'list'
+
+
+def get_model_namespace(*, model: Type[Model]) -> str:
+
+    """
+    Return the namespace of the surrogate keys of a model, its model name,
+    e.g. `category`.
+
+    :param model: The model class.
+
+    :return: str: The namespace of the objects of the model.
+    """
+
+    # A concrete model always has a model name.
+    return cast(str, model._meta.model_name)
+
+
+def get_surrogate_key(*, namespace: str, identifier: Union[int, str]) -> str:
+
+    """
+    Build the surrogate key of a single object, e.g. `category:12`.
+
+    :param namespace: The namespace of the object, usually the model name.
+    :param identifier: The identifier of the object.
+
+    :return: str: The surrogate key of the object.
+    """
+
+    return f'{namespace}:{identifier}'
+
+
+def get_list_surrogate_key(*, namespace: str) -> str:
+
+    """
+    Build the surrogate key of the pages listing a namespace,
+    e.g. `category:list`.
+
+    :param namespace: The namespace of the listed objects.
+
+    :return: str: The surrogate key of the list pages.
+    """
+
+    return get_surrogate_key(
+        namespace=namespace, identifier=LIST_SURROGATE_KEY_SUFFIX
+    )
+
+
+def get_surrogate_keys(
+    *, namespace: str, identifiers: Iterable[Union[int, str]]
+) -> List[str]:
+
+    """
+    Build the surrogate keys of many objects of the same namespace.
+
+    :param namespace: The namespace of the objects.
+    :param identifiers: The identifiers of the objects.
+
+    :return: List[str]: The surrogate keys of the objects.
+    """
+
+    return [
+        get_surrogate_key(namespace=namespace, identifier=identifier)
+        for identifier in identifiers
+    ]
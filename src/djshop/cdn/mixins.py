@@ -0,0 +1,108 @@
+from typing import Any, Dict, List, Optional
+
+from django.http.response import HttpResponseBase
+from django.utils.cache import patch_cache_control
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+class CachePolicyMixin:
+
+    """
+    Declarative HTTP caching policy for read-only API views.
+
+    Views set how long browsers (`cache_max_age`) and shared caches such
+    as a CDN (`cache_shared_max_age`) may keep a response, and how long
+    a stale copy may still be served while it is revalidated in the
+    background. Responses are tagged with the `Surrogate-Key` header,
+    so they can be purged from the edge cache when the data changes.
+
+    Attributes:
+        cache_max_age (Optional[int]): `max-age` in seconds, the policy is
+            disabled when None.
+        cache_shared_max_age (Optional[int]): `s-maxage` in seconds.
+        cache_stale_while_revalidate (Optional[int]): `stale-while-revalidate`
+            in seconds.
+    """
+
+    cache_max_age: Optional[int] = None
+    cache_shared_max_age: Optional[int] = None
+    cache_stale_while_revalidate: Optional[int] = None
+
+    cacheable_status_codes = (200, 304)
+
+    def get_surrogate_keys(
+            self, request: Request, response: Response
+    ) -> List[str]:
+
+        """
+        Return the surrogate keys of the objects rendered in the response.
+
+        :param request: The request object.
+        :param response: The response object.
+
+        :return: List[str]: The surrogate keys of the response.
+        """
+
+        return []
+
+    def finalize_response(
+            self, request: Request, response: Response, *args: Any, **kwargs: Any
+    ) -> Response:
+
+        """
+        Apply the caching policy to successful responses of safe requests.
+
+        Responses of authenticated requests are marked as private, so
+        they are never stored in a shared cache.
+
+        :param request: The request object.
+        :param response: The response object.
+
+        :return: Response: The response with the caching headers set.
+        """
+
+        response = super().finalize_response(  # type: ignore[misc]
+            request, response, *args, **kwargs
+        )
+
+        if self.cache_max_age is None or request.method not in ('GET', 'HEAD') or \
+                response.status_code not in self.cacheable_status_codes:
+            return response
+
+        if request.user is not None and request.user.is_authenticated:
+            patch_cache_control(response, private=True)
+            return response
+
+        self.patch_public_cache_policy(
+            response=response,
+            surrogate_keys=self.get_surrogate_keys(request, response)
+        )
+
+        return response
+
+    def patch_public_cache_policy(
+            self, *, response: HttpResponseBase, surrogate_keys: List[str]
+    ) -> None:
+
+        """
+        Set the caching headers of a response which may be stored by
+        the shared caches.
+
+        :param response: The response object.
+        :param surrogate_keys: The surrogate keys of the response.
+        """
+
+        cache_control: Dict[str, Any] = {
+            'public': True, 'max_age': self.cache_max_age
+        }
+        if self.cache_shared_max_age is not None:
+            cache_control['s_maxage'] = self.cache_shared_max_age
+        if self.cache_stale_while_revalidate is not None:
+            cache_control['stale_while_revalidate'] = \
+                self.cache_stale_while_revalidate
+
+        patch_cache_control(response, **cache_control)
+
+        if surrogate_keys:
+            response['Surrogate-Key'] = ' '.join(surrogate_keys)
@@ -0,0 +1,19 @@
+from typing import Iterable
+
+from src.djshop.outbox.services import publish_event
+
+
+def purge_surrogate_keys(*, surrogate_keys: Iterable[str]) -> None:
+
+    """
+    Dispatch the purge of the given surrogate keys to Celery.
+
+    The purge is written to the outbox in the current transaction, and
+    published once it is committed, so the edge cache can't be refilled
+    with the old data in between. The keys purged by the transactions
+    relayed together are sent together, each only once.
+
+    :param surrogate_keys: The surrogate keys to be purged.
+    """
+
+    publish_event(topic='cdn.purge', identifiers=surrogate_keys)
@@ -0,0 +1,23 @@
+from typing import List
+from urllib.error import URLError
+
+from celery import shared_task
+
+from src.djshop.cdn.backends import get_purge_backend
+from src.djshop.utils.tasks import IdempotentTask
+
+
+@shared_task(
+    base=IdempotentTask, autoretry_for=(URLError,), retry_backoff=True,
+    max_retries=3, ignore_result=True
+)
+def purge_surrogate_keys_task(surrogate_keys: List[str]) -> None:
+
+    """
+    Purge the edge cached pages tagged with the given surrogate keys
+    using the configured purge backend.
+
+    :param surrogate_keys: The surrogate keys to be purged.
+    """
+
+    get_purge_backend().purge(surrogate_keys=surrogate_keys)
@@ -5,10 +5,12 @@ Django command to wait for the database to be available.
 import time
 from typing import Any
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandParser
 from django.db.utils import OperationalError
 from psycopg2 import OperationalError as Psycopg2Error
 
+from src.djshop.utils.db.connections import get_connection_stats
+
 
 class Command(BaseCommand):
     """
@@ -16,6 +18,20 @@ class Command(BaseCommand):
     to be available before proceeding.
     """
 
+    def add_arguments(self, parser: CommandParser) -> None:
+
+        """
+        Add the command's arguments.
+
+        :param parser: The command's argument parser.
+        :return: None
+        """
+
+        parser.add_argument(
+            '--stats', action='store_true',
+            help='Print the connection settings and pool usage once available.'
+        )
+
     def handle(self, *args: Any, **options: Any) -> None:
 
         """
@@ -41,3 +57,23 @@ class Command(BaseCommand):
                 time.sleep(1)
 
         self.stdout.write(self.style.SUCCESS('Database available!'))
+
+        if options['stats']:
+            self.write_connection_stats()
+
+    def write_connection_stats(self) -> None:
+
+        """
+        Write the connection settings and pool usage of the default database.
+
+        :return: None
+        """
+
+        connection_stats = get_connection_stats(alias='default')
+        connection_states = connection_stats.pop('connection_states')
+
+        for stat_name, stat_value in connection_stats.items():
+            self.stdout.write(f'{stat_name}: {stat_value}')
+
+        for connection_state, connection_count in connection_states.items():
+            self.stdout.write(f'connections {connection_state}: {connection_count}')
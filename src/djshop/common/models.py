@@ -39,6 +39,9 @@ class BaseModel(models.Model):
     - updated_at: DateTimeField representing the last update timestamp.
     - updated_by: ForeignKey to BaseUser or None, representing the user
                 who last updated the instance.
+    - version: PositiveIntegerField incremented by every update (through
+                `model_update` or `save`), used for optimistic concurrency
+                control.
 
     Note: This model is abstract and serves as a base for other models.
     """
@@ -57,6 +60,7 @@ class BaseModel(models.Model):
             related_name='+'
         )
     )
+    version = models.PositiveIntegerField(default=1, editable=False)
 
     class Meta:
         abstract = True
@@ -80,6 +84,12 @@ class BaseModel(models.Model):
         """
         Save method overridden to set related names for created and updated fields.
 
+        Saving an existing row increments its version too, so the saves made
+        outside of `model_update` (e.g. by the admin) invalidate the versions
+        read before them. The version is incremented by the database and
+        read back, so saving a stale instance never writes a version another
+        writer already published, nor a lower one.
+
         :params: *args: Variable length argument list.
         :params: **kwargs: Arbitrary keyword arguments.
         """
@@ -99,7 +109,24 @@ class BaseModel(models.Model):
                 setattr(self.updated_by, 'related_name', related_names['updated'])
                 self.updated_by.save()
 
-        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if self._state.adding or (update_fields is not None and not update_fields):
+            super().save(*args, **kwargs)
+            return
+
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'version'}
+
+        version = self.version
+        self.version = F('version') + 1
+
+        try:
+            super().save(*args, **kwargs)
+        except Exception:
+            self.version = version
+            raise
+
+        self.refresh_from_db(fields=['version'])
 
 
 class RandomModel(BaseModel):
@@ -1,13 +1,60 @@
-from typing import Any, Dict, List, Tuple
+import copy
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+from typing import (
+    Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type, TypeVar,
+    cast,
+)
 
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+
+from src.djshop.common.models import BaseModel
 from src.djshop.common.types import DjangoModelType
+from src.djshop.core.exceptions import ConcurrentUpdateError
+
+
+BaseModelType = TypeVar('BaseModelType', bound=BaseModel)
+
+
+def apply_model_changes(
+    *, instance: models.Model, fields: List[str], data: Dict[str, Any]
+) -> List[str]:
+
+    """
+    Set the given data on an instance, and return the fields it changed.
+
+    Fields missing from the data, or with an unchanged value, are left out.
+
+    :param instance: The instance to be changed.
+    :param fields: The fields which may be changed.
+    :param data: The new values of the fields.
+
+    :return: List[str]: The changed fields, in the order of `fields`.
+    """
+
+    changed_fields = []
+
+    for field in fields:
+        # Skip if a field is not present in the actual data
+        if field not in data:
+            continue
+
+        if getattr(instance, field) != data[field]:
+            changed_fields.append(field)
+            setattr(instance, field, data[field])
+
+    return changed_fields
 
 
 def model_update(
     *,
     instance: DjangoModelType,
     fields: List[str],
-    data: Dict[str, Any]
+    data: Dict[str, Any],
+    expected_version: Optional[int] = None
 ) -> Tuple[DjangoModelType, bool]:
 
     """
@@ -23,27 +70,215 @@ def model_update(
 
         return user
 
+    Only the fields which actually changed are saved.
+
+    Instances of `BaseModel` subclasses are updated optimistically: the
+    `UPDATE` only matches the row at the version the instance was read at
+    (or at `expected_version`, e.g. taken from an `If-Match` header), and
+    increments it.
+
+    Uniqueness is left to the database constraints, so the happy path
+    doesn't query for duplicates. The unique checks only run once the
+    database rejected the update, to report the same validation errors
+    as `full_clean()`.
+
+    :raises ConcurrentUpdateError: If the object was changed since
+        the expected version.
+    :raises ValidationError: If the data is invalid or duplicated.
+
     Return value: Tuple with the following elements:
         1. The instance we updated
         2. A boolean value representing whether we performed an update or not.
     """
-    has_updated = False
 
-    for field in fields:
-        # Skip if a field is not present in the actual data
-        if field not in data:
-            continue
+    if isinstance(instance, BaseModel) and expected_version is not None and \
+            instance.version != expected_version:
+        raise ConcurrentUpdateError(
+            message=f'{instance._meta.verbose_name} has been changed.',
+            extra={'version': str(instance.version)}
+        )
 
-        if getattr(instance, field) != data[field]:
-            has_updated = True
-            setattr(instance, field, data[field])
+    changed_fields = apply_model_changes(instance=instance, fields=fields, data=data)
 
     # Perform an update only if any of the fields was actually changed
-    if has_updated:
-        instance.full_clean()
-        # Update only the fields that are meant to be updated.
-        # Django docs reference:
-        # https://docs.djangoproject.com/en/dev/ref/models/instances/#specifying-which-fields-to-save
-        instance.save(update_fields=fields)
-
-    return instance, has_updated
+    if changed_fields:
+        instance.full_clean(validate_unique=False, validate_constraints=False)
+
+        try:
+            with transaction.atomic():
+                if isinstance(instance, BaseModel):
+                    versioned_update(instances=[instance], fields=changed_fields)
+                else:
+                    # Update only the fields that have been changed.
+                    # Django docs reference:
+                    # https://docs.djangoproject.com/en/dev/ref/models/instances/#specifying-which-fields-to-save
+                    instance.save(update_fields=changed_fields)
+
+        except IntegrityError:
+            instance.validate_unique()
+            instance.validate_constraints()
+            raise
+
+    return instance, bool(changed_fields)
+
+
+def model_bulk_update(
+    *,
+    updates: Iterable[Tuple[DjangoModelType, Dict[str, Any]]],
+    fields: List[str],
+    validate: bool = True,
+    batch_size: int = 500
+) -> List[DjangoModelType]:
+
+    """
+    Batched version of `model_update`, for bulk edits and imports.
+
+    The data is diffed against the instances in memory, and the changed
+    instances are grouped by model and by set of changed fields, so every
+    group is saved with one `UPDATE` per batch instead of one per instance.
+    Unchanged instances don't cost any query.
+
+    Instances of `BaseModel` subclasses are updated optimistically, like in
+    `model_update`: a batch fails unless every row is still at the version
+    its instance was read at.
+
+    All the batches run in a single transaction, so the update is either
+    fully applied or not at all. The instances are only changed once
+    the transaction succeeded.
+
+    :param updates: The instances to update, each with its new data.
+    :param fields: The fields which may be updated.
+    :param validate: Whether to validate the changed fields of each instance,
+        the unique checks being left to the database constraints.
+    :param batch_size: The maximum number of instances saved by one query.
+
+    :raises ConcurrentUpdateError: If an object was changed since
+        its instance was read.
+    :raises ValidationError: If the data of an instance is invalid.
+    :raises ValueError: If an object is updated twice.
+
+    :return: List[DjangoModelType]: The instances which have been updated.
+    """
+
+    changed_groups: Dict[
+        Tuple[Type[models.Model], Tuple[str, ...]], List[DjangoModelType]
+    ] = defaultdict(list)
+    changed_instances: List[Tuple[DjangoModelType, DjangoModelType, List[str]]] = []
+    updated_rows: Set[Tuple[Type[models.Model], Any]] = set()
+
+    for instance, data in updates:
+        row = (type(instance), instance.pk)
+        if row in updated_rows:
+            raise ValueError(
+                f'{instance._meta.verbose_name} {instance.pk} is updated twice.'
+            )
+        updated_rows.add(row)
+
+        # The changes are made on a copy, and only applied to the instance
+        # once every batch has been saved.
+        changed_instance = copy.copy(instance)
+        changed_fields = apply_model_changes(
+            instance=changed_instance, fields=fields, data=data
+        )
+
+        if not changed_fields:
+            continue
+
+        if validate:
+            changed_instance.clean_fields(exclude=[
+                field.name for field in instance._meta.fields
+                if field.name not in changed_fields
+            ])
+
+        changed_groups[(type(instance), tuple(changed_fields))].append(
+            changed_instance
+        )
+        changed_instances.append((instance, changed_instance, changed_fields))
+
+    with transaction.atomic():
+        for (model, group_fields), instances in changed_groups.items():
+            for start in range(0, len(instances), batch_size):
+                batch = instances[start:start + batch_size]
+
+                if issubclass(model, BaseModel):
+                    versioned_update(
+                        instances=cast(List[BaseModel], batch),
+                        fields=list(group_fields)
+                    )
+                else:
+                    model._default_manager.bulk_update(batch, group_fields)
+
+    for instance, changed_instance, changed_fields in changed_instances:
+        if isinstance(instance, BaseModel):
+            changed_fields = [*changed_fields, 'version', 'updated_at']
+
+        for field in changed_fields:
+            setattr(instance, field, getattr(changed_instance, field))
+
+    return [instance for instance, _, _ in changed_instances]
+
+
+def versioned_update(
+    *, instances: Sequence[BaseModelType], fields: List[str]
+) -> None:
+
+    """
+    Save the given fields of instances of the same model with a single
+    conditional `UPDATE` on their versions, incrementing the versions and
+    `updated_at`.
+
+    The values of several instances are set with a `CASE` expression,
+    like `QuerySet.bulk_update` does.
+
+    :param instances: The instances to be saved, at the version they
+        were read at.
+    :param fields: The fields to be saved.
+
+    :raises ConcurrentUpdateError: If any row isn't at the version of its
+        instance anymore.
+    :raises ValueError: If several instances are the same row.
+    """
+
+    if len({instance.pk for instance in instances}) != len(instances):
+        raise ValueError('The instances must be distinct rows.')
+
+    model = type(instances[0])
+    updated_at = timezone.now()
+
+    if len(instances) == 1:
+        values = {field: getattr(instances[0], field) for field in fields}
+    else:
+        values = {}
+
+        for field_name in fields:
+            # Only the concrete fields of the model can be updated.
+            field = cast(models.Field[Any, Any], model._meta.get_field(field_name))
+            values[field_name] = Case(
+                *[
+                    When(
+                        pk=instance.pk,
+                        then=Value(
+                            getattr(instance, field.attname), output_field=field
+                        )
+                    )
+                    for instance in instances
+                ],
+                output_field=field
+            )
+
+    updated_rows = model._default_manager.filter(reduce(or_, [
+        Q(pk=instance.pk, version=instance.version) for instance in instances
+    ])).update(
+        **values,
+        version=F('version') + 1,
+        updated_at=updated_at
+    )
+
+    if updated_rows != len(instances):
+        raise ConcurrentUpdateError(
+            message=f'{model._meta.verbose_name} has been changed.'
+        )
+
+    for instance in instances:
+        instance.version += 1
+        instance.updated_at = updated_at
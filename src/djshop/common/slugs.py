@@ -0,0 +1,173 @@
+from functools import reduce
+from operator import or_
+from typing import Callable, Dict, List, Sequence, Set, Type
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+from django.utils.text import slugify
+
+
+# Room kept at the end of a slug for the `-<n>` suffix disambiguating it.
+MAX_SUFFIX_LENGTH = 10
+
+# Number of times a generated slug is saved, when concurrent saves keep
+# taking it first.
+MAX_SLUG_SAVE_ATTEMPTS = 3
+
+
+def get_base_slug(
+    *, title: str, allow_unicode: bool, max_length: int, fallback: str
+) -> str:
+
+    """
+    Slugify a title, truncated so a disambiguating suffix always fits
+    in the slug field.
+
+    :param title: The title to be slugified.
+    :param allow_unicode: Whether to keep the non ASCII letters, matching
+        the `allow_unicode` option of the slug field.
+    :param max_length: The maximum length of the slug field.
+    :param fallback: The slug of the titles without any letter or digit.
+
+    :return: str: The base slug of the title.
+    """
+
+    base_slug = slugify(title, allow_unicode=allow_unicode) or fallback
+
+    return base_slug[:max_length - MAX_SUFFIX_LENGTH].strip('-') or fallback
+
+
+def generate_unique_slugs(
+    *, model: Type[models.Model], titles: Sequence[str], slug_field: str = 'slug'
+) -> List[str]:
+
+    """
+    Generate unique slugs for a batch of titles of the same model.
+
+    The existing slugs which may conflict with the batch are fetched with
+    a single prefix query, and the duplicates (in the database or within
+    the batch) are disambiguated in memory with `-2`, `-3`... suffixes.
+
+    :param model: The model the slugs are generated for.
+    :param titles: The titles to be slugified, in order.
+    :param slug_field: The name of the unique slug field of the model.
+
+    :return: List[str]: The unique slugs of the titles, in the same order.
+    """
+
+    field = model._meta.get_field(slug_field)
+    assert isinstance(field, models.SlugField)
+    assert field.max_length is not None
+
+    base_slugs = [
+        get_base_slug(
+            title=title, allow_unicode=getattr(field, 'allow_unicode', False),
+            max_length=field.max_length, fallback=model._meta.model_name or 'item'
+        )
+        for title in titles
+    ]
+
+    if not base_slugs:
+        return []
+
+    taken_slugs: Set[str] = set(
+        model._default_manager.filter(reduce(or_, [
+            Q(**{f'{slug_field}__startswith': base_slug})
+            for base_slug in set(base_slugs)
+        ])).values_list(slug_field, flat=True)
+    )
+
+    next_suffixes: Dict[str, int] = {}
+    unique_slugs = []
+
+    for base_slug in base_slugs:
+        slug = base_slug
+        suffix = next_suffixes.get(base_slug, 2)
+
+        while slug in taken_slugs:
+            slug = f'{base_slug}-{suffix}'
+            suffix += 1
+
+        next_suffixes[base_slug] = suffix
+        taken_slugs.add(slug)
+        unique_slugs.append(slug)
+
+    return unique_slugs
+
+
+def assign_unique_slugs(
+    *, instances: Sequence[models.Model], source_field: str = 'title',
+    slug_field: str = 'slug'
+) -> None:
+
+    """
+    Set a unique slug, generated from their title, on the instances of
+    the same model which don't have one yet, e.g. before a `bulk_create`.
+
+    :param instances: The instances to be slugified.
+    :param source_field: The name of the field the slugs are generated from.
+    :param slug_field: The name of the unique slug field of the model.
+    """
+
+    slugless_instances = [
+        instance for instance in instances if not getattr(instance, slug_field)
+    ]
+
+    if not slugless_instances:
+        return
+
+    unique_slugs = generate_unique_slugs(
+        model=type(slugless_instances[0]),
+        titles=[getattr(instance, source_field) for instance in slugless_instances],
+        slug_field=slug_field
+    )
+
+    for instance, slug in zip(slugless_instances, unique_slugs):
+        setattr(instance, slug_field, slug)
+
+
+def save_with_unique_slug(
+    *, instance: models.Model, save: Callable[[], None],
+    source_field: str = 'title', slug_field: str = 'slug'
+) -> None:
+
+    """
+    Save an instance, with a unique slug generated from its title if it
+    doesn't have one yet.
+
+    Another save can take the generated slug between its generation and
+    the insert. The save is then retried with the next free suffix.
+
+    :param instance: The instance to be saved.
+    :param save: The save method of the instance, called without arguments.
+    :param source_field: The name of the field the slug is generated from.
+    :param slug_field: The name of the unique slug field of the model.
+
+    :raises IntegrityError: If the save fails for another reason than
+        a taken slug, or the slug keeps being taken.
+    """
+
+    if getattr(instance, slug_field):
+        save()
+        return
+
+    for attempt in range(1, MAX_SLUG_SAVE_ATTEMPTS + 1):
+        assign_unique_slugs(
+            instances=[instance], source_field=source_field, slug_field=slug_field
+        )
+
+        try:
+            with transaction.atomic():
+                save()
+            return
+
+        except IntegrityError:
+            slug = getattr(instance, slug_field)
+            is_slug_taken = type(instance)._default_manager.filter(
+                **{slug_field: slug}
+            ).exists()
+
+            if not is_slug_taken or attempt == MAX_SLUG_SAVE_ATTEMPTS:
+                raise
+
+            setattr(instance, slug_field, '')
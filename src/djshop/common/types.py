@@ -1,4 +1,5 @@
-from typing import TypeVar
+from datetime import datetime
+from typing import NamedTuple, Optional, TypeVar
 
 from django.db import models
 
@@ -7,3 +8,24 @@ from django.db import models
 # Reference:
 # https://mypy.readthedocs.io/en/stable/kinds_of_types.html#the-type-of-class-objects
 DjangoModelType = TypeVar('DjangoModelType', bound=models.Model)
+
+
+class ResourceVersion(NamedTuple):
+
+    """
+    Cheap validator of a resource or a collection, used for
+    HTTP conditional requests.
+
+    Attributes:
+        fingerprint (str): A value that changes whenever the representation
+            of the resource changes (e.g. the number of rows in a collection).
+        last_modified (Optional[datetime]): The last modification time
+            of the resource, None if it has none or isn't a reliable
+            validator (e.g. for a collection, whose deletions it misses).
+        version (Optional[int]): The version of a single versioned resource,
+            checked by the conditional updates.
+    """
+
+    fingerprint: str
+    last_modified: Optional[datetime]
+    version: Optional[int] = None
@@ -3,3 +3,24 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = 'src.djshop.core'
+
+    def ready(self) -> None:
+
+        """
+        Load the Celery app once Django settings are configured, so
+        `shared_task`s are bound to it (and to the `CELERY_*` settings)
+        in web processes as well as in workers, and register the system
+        checks.
+
+        The static files manifest check is a deployment check
+        (`check --deploy`): the workers and the management commands, like
+        `migrate`, don't need the static files. The web processes check it
+        on their warm-up.
+        """
+
+        from django.core import checks
+
+        from src.config.celery import celery  # noqa: F401
+        from src.djshop.core.checks import check_static_manifest
+
+        checks.register(deploy=True)(check_static_manifest)
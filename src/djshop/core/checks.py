@@ -0,0 +1,41 @@
+from typing import Any, List, Optional, Sequence
+
+from django.apps import AppConfig
+from django.conf import STATICFILES_STORAGE_ALIAS
+from django.contrib.staticfiles.storage import ManifestFilesMixin
+from django.core.checks import CheckMessage, Error
+from django.core.files.storage import storages
+
+
+def check_static_manifest(
+    app_configs: Optional[Sequence[AppConfig]], **kwargs: Any
+) -> List[CheckMessage]:
+
+    """
+    Check that the static files manifest exists, when the static files
+    storage serves hashed file names.
+
+    Without it, every `{% static %}` tag of a request raises, so the
+    processes shouldn't start before `collectstatic` has run.
+
+    :param app_configs: The application configs to check, unused.
+    :param kwargs: Additional keyword arguments of the checks.
+    :return: List[CheckMessage]: An error if the manifest is missing.
+    """
+
+    storage = storages[STATICFILES_STORAGE_ALIAS]
+
+    if not isinstance(storage, ManifestFilesMixin):
+        return []
+
+    if storage.manifest_storage.exists(storage.manifest_name):
+        return []
+
+    return [
+        Error(
+            f'The static files manifest {storage.manifest_name!r} is missing '
+            f'from the STATIC_ROOT.',
+            hint='Run `python -m src.manage collectstatic` first.',
+            id='core.E001',
+        )
+    ]
@@ -38,3 +38,35 @@ class DuplicateImageException(Exception):
     """
 
     pass
+
+
+class QueryBudgetExceeded(ApplicationError):
+
+    """
+    Exception raised, in strict mode, when a request exceeds
+    the query budget declared on its view.
+    """
+
+    pass
+
+
+class ConcurrentUpdateError(ApplicationError):
+
+    """
+    Exception raised when an optimistic update doesn't match any row,
+    because the object was changed (or deleted) since the version
+    it was read at.
+    """
+
+    pass
+
+
+class ConcurrentTreeChangeError(ApplicationError):
+
+    """
+    Exception raised when a tree operation collides with a concurrent
+    change of the same part of the tree, e.g. two nodes getting the same
+    materialized path.
+    """
+
+    pass
@@ -0,0 +1,214 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+from django.db import connections
+
+
+# Collapse the placeholders of `IN (...)` lists, so the same query with
+# a different number of parameters gets the same fingerprint.
+IN_PLACEHOLDERS_RE = re.compile(r'IN \((?:%s, )*%s\)')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def get_query_fingerprint(sql: str) -> str:
+
+    """
+    Normalize a SQL statement into a fingerprint.
+
+    Parameters are already passed separately from the statement, so only
+    the whitespace and the `IN` list placeholders need to be normalized.
+
+    :param sql: The SQL statement, with its parameter placeholders.
+    :return: str: The fingerprint of the statement.
+    """
+
+    sql = WHITESPACE_RE.sub(' ', sql).strip()
+    return IN_PLACEHOLDERS_RE.sub('IN (...)', sql)
+
+
+class RequestMetrics:
+
+    """
+    Metrics collected while handling a single request.
+
+    Attributes:
+        query_count (int): The number of SQL queries executed.
+        query_time (float): The total SQL time, in milliseconds.
+        query_fingerprints (Counter[str]): The number of executions
+            of each query fingerprint.
+        timings (Dict[str, float]): Named timings (e.g. `serializer`),
+            in milliseconds.
+        view_class (Optional[type]): The class of the view handling
+            the request, if it is a class based view.
+    """
+
+    def __init__(self) -> None:
+        self.view_class: Optional[type] = None
+        self.query_count = 0
+        self.query_time = 0.0
+        self.query_fingerprints: Counter[str] = Counter()
+        self.timings: Dict[str, float] = {}
+
+    @property
+    def duplicate_query_count(self) -> int:
+
+        """
+        The number of queries which repeat an already executed fingerprint,
+        a typical symptom of an N+1 problem.
+        """
+
+        return sum(count - 1 for count in self.query_fingerprints.values())
+
+    def get_duplicate_queries(self, limit: int = 5) -> List[Tuple[str, int]]:
+
+        """
+        Return the most repeated query fingerprints.
+
+        :param limit: The maximum number of fingerprints to return.
+        :return: List[Tuple[str, int]]: The fingerprints and their counts.
+        """
+
+        return [
+            (fingerprint, count)
+            for fingerprint, count in self.query_fingerprints.most_common(limit)
+            if count > 1
+        ]
+
+    def add_timing(self, name: str, duration: float) -> None:
+
+        """
+        Add a duration, in milliseconds, to a named timing.
+
+        :param name: The name of the timing.
+        :param duration: The duration in milliseconds.
+        """
+
+        self.timings[name] = self.timings.get(name, 0.0) + duration
+
+    def as_dict(self) -> Dict[str, Any]:
+
+        """
+        Return the metrics as a dictionary, e.g. for structured logging.
+
+        :return: Dict[str, Any]: The metrics.
+        """
+
+        return {
+            'query_count': self.query_count,
+            'query_time': round(self.query_time, 3),
+            'duplicate_query_count': self.duplicate_query_count,
+            **{
+                f'{name}_time': round(duration, 3)
+                for name, duration in self.timings.items()
+            },
+        }
+
+
+_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    'request_metrics', default=None
+)
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+
+    """
+    Return the metrics of the request being handled, if it is instrumented.
+
+    :return: Optional[RequestMetrics]: The metrics of the current request.
+    """
+
+    return _request_metrics.get()
+
+
+@contextmanager
+def collect_request_metrics() -> Generator[RequestMetrics, None, None]:
+
+    """
+    Context manager collecting the metrics of the code it wraps.
+
+    :return: RequestMetrics: The metrics being collected.
+    """
+
+    request_metrics = RequestMetrics()
+    token = _request_metrics.set(request_metrics)
+
+    try:
+        yield request_metrics
+    finally:
+        _request_metrics.reset(token)
+
+
+@contextmanager
+def record_timing(name: str) -> Generator[None, None, None]:
+
+    """
+    Context manager adding the time spent in the wrapped code to a named
+    timing of the current request, e.g. `with record_timing('serializer'):`.
+
+    It does nothing outside an instrumented request.
+
+    :param name: The name of the timing.
+    """
+
+    request_metrics = get_request_metrics()
+
+    if request_metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        request_metrics.add_timing(name, (time.perf_counter() - start) * 1000)
+
+
+def query_recorder(
+    execute: Callable[..., Any], sql: str, params: Any, many: bool,
+    context: Dict[str, Any]
+) -> Any:
+
+    """
+    Database `execute_wrapper` recording the count, the duration and
+    the fingerprint of every query into the metrics of the current request.
+
+    https://docs.djangoproject.com/en/4.2/topics/db/instrumentation/
+    """
+
+    request_metrics = get_request_metrics()
+
+    if request_metrics is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        request_metrics.query_time += (time.perf_counter() - start) * 1000
+        request_metrics.query_count += 1
+        request_metrics.query_fingerprints[get_query_fingerprint(sql)] += 1
+
+
+def install_query_recorders() -> None:
+
+    """
+    Install the `query_recorder` on the database connections of
+    the current thread, once.
+
+    The recorder stays installed, as it does nothing outside an
+    instrumented request. This way the queries of an async request are
+    recorded too: they run in the thread of its `sync_to_async` calls,
+    which the request's context (and its metrics) is copied to.
+    """
+
+    for alias in connections:
+        execute_wrappers = connections[alias].execute_wrappers
+
+        if query_recorder not in execute_wrappers:
+            execute_wrappers.append(query_recorder)
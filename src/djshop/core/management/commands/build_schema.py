@@ -0,0 +1,58 @@
+"""
+Django command to pre-generate the OpenAPI schema.
+"""
+
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from src.djshop.api.schema import get_schema_file, write_schema_file
+
+
+class Command(BaseCommand):
+    """
+    Django's management command that generates the OpenAPI schema into its
+    versioned file, which the web processes serve from memory.
+
+    It is part of the release step, after `collectstatic --clear`, which
+    would delete the file otherwise.
+
+    Example:
+        python -m src.manage build_schema
+    """
+
+    help = 'Generate the OpenAPI schema into its versioned static file.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+
+        """
+        Add the command's arguments.
+
+        :param parser: The command's argument parser.
+        :return: None
+        """
+
+        parser.add_argument(
+            '--file', type=Path,
+            help='Schema file (default: `SPECTACULAR_SCHEMA_FILE` in the '
+                 '`STATIC_ROOT`).'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+
+        """
+        Command's entry point.
+
+        :param args: Additional command-line arguments
+        :param options: Additional options
+        :return: None
+        """
+
+        path = options['file'] or get_schema_file()
+        schema_document = write_schema_file(path=path)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Schema written to {path} '
+            f'({len(schema_document.content)} bytes, ETag {schema_document.etag}).'
+        ))
@@ -0,0 +1,136 @@
+"""
+Django command to profile the start-up of the Django processes.
+"""
+
+import json
+import statistics
+from pathlib import Path
+from typing import Any, Dict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from src.djshop.core.startup import (
+    BOOT_TARGETS, get_package_import_times, profile_boot,
+)
+
+
+class Command(BaseCommand):
+    """
+    Django's management command that boots a process type in fresh
+    interpreters, and reports its boot time and the import time of
+    the slowest packages and modules.
+
+    Several settings modules may be given, to compare their boot times
+    with the first one.
+
+    Example:
+        python -m src.manage profile_startup --target setup \
+            --django-settings src.config.django.base \
+            --django-settings src.config.django.production
+    """
+
+    help = 'Profile the start-up time of the Django processes.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+
+        """
+        Add the command's arguments.
+
+        :param parser: The command's argument parser.
+        :return: None
+        """
+
+        parser.add_argument(
+            '--django-settings', action='append', dest='settings_modules',
+            help='Settings module to profile, may be repeated '
+                 '(default: the current one).'
+        )
+        parser.add_argument(
+            '--target', choices=list(BOOT_TARGETS), default='wsgi',
+            help='Process type to boot (default: wsgi).'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help='Number of boots, the median boot time is reported.'
+        )
+        parser.add_argument(
+            '--limit', type=int, default=15,
+            help='Number of slowest packages and modules to report.'
+        )
+        parser.add_argument('--output', type=Path, help='JSON results file.')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+
+        """
+        Command's entry point.
+
+        :param args: Additional command-line arguments
+        :param options: Additional options
+        :return: None
+        """
+
+        settings_modules = options['settings_modules'] or [settings.SETTINGS_MODULE]
+        limit = options['limit']
+        results: Dict[str, Dict[str, Any]] = {}
+
+        for settings_module in settings_modules:
+            boot_profiles = [
+                profile_boot(
+                    settings_module=settings_module, target=options['target']
+                )
+                for _ in range(options['repeat'])
+            ]
+            imports = boot_profiles[-1].imports
+            boot_time = statistics.median(
+                boot_profile.boot_time for boot_profile in boot_profiles
+            )
+
+            slowest_modules = sorted(
+                imports, key=lambda import_timing: import_timing.cumulative_time,
+                reverse=True
+            )[:limit]
+            package_import_times = dict(
+                list(get_package_import_times(imports).items())[:limit]
+            )
+
+            results[settings_module] = {
+                'boot_time': round(boot_time, 3),
+                'modules': len(imports),
+                'packages': package_import_times,
+                'slowest_modules': {
+                    import_timing.module: import_timing.cumulative_time
+                    for import_timing in slowest_modules
+                },
+            }
+
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f'{settings_module} ({options["target"]}): {boot_time:.1f}ms, '
+                f'{len(imports)} modules imported'
+            ))
+            self.stdout.write('Slowest packages (self import time):')
+            for package, import_time in package_import_times.items():
+                self.stdout.write(f'  {import_time:9.1f}ms  {package}')
+            self.stdout.write('Slowest modules (cumulative import time):')
+            for import_timing in slowest_modules:
+                self.stdout.write(
+                    f'  {import_timing.cumulative_time:9.1f}ms  '
+                    f'{import_timing.module}'
+                )
+
+        reference_module, *compared_modules = settings_modules
+        reference_boot_time = results[reference_module]['boot_time']
+
+        for settings_module in compared_modules:
+            speedup = reference_boot_time / results[settings_module]['boot_time']
+            self.stdout.write(
+                f'{settings_module} boots {speedup:.2f}x as fast as '
+                f'{reference_module}.'
+            )
+
+        if options['output']:
+            options['output'].write_text(json.dumps({
+                'target': options['target'],
+                'repeat': options['repeat'],
+                'results': results,
+            }, indent=2))
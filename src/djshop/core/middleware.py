@@ -0,0 +1,397 @@
+import logging
+import time
+from typing import (
+    Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union, cast,
+)
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from rest_framework.permissions import SAFE_METHODS
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from src.djshop.core.exceptions import QueryBudgetExceeded
+from src.djshop.core.instrumentation import (
+    RequestMetrics, collect_request_metrics, get_request_metrics,
+    install_query_recorders,
+)
+from src.djshop.metrics.registry import observe_http_request
+from src.djshop.utils.db.routers import pin_primary
+
+
+logger = logging.getLogger(__name__)
+
+
+PRIMARY_PINNED_UNTIL_COOKIE = 'primary_pinned_until'
+PRIMARY_PINNED_UNTIL_HEADER = 'X-Primary-Pinned-Until'
+
+GetResponse = Callable[[HttpRequest], Any]
+MiddlewareResponse = Union[HttpResponse, Awaitable[HttpResponse]]
+
+
+class SyncAndAsyncMiddleware:
+
+    """
+    Base of the middlewares supporting both the sync (WSGI) and the async
+    (ASGI) request handling, so an async view served by an ASGI server
+    doesn't go through a thread for every middleware.
+
+    Subclasses implement the sync `handle` and the async `ahandle` methods,
+    the one matching the mode of the next handler is called.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: GetResponse) -> None:
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(self.get_response)
+
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> MiddlewareResponse:
+        if self.async_mode:
+            return self.ahandle(request)
+
+        return self.handle(request)
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+
+class PrimaryStickinessMiddleware(SyncAndAsyncMiddleware):
+
+    """
+    Read-your-writes consistency on top of read replicas.
+
+    After a successful write, the response tells the client until when
+    its reads must go to the primary, in the `primary_pinned_until` cookie
+    and in the `X-Primary-Pinned-Until` header (for clients without
+    cookies, which send it back as a request header). While that time
+    hasn't passed, the reads of the client's requests are pinned to
+    the primary, so replication lag never shows them stale data.
+    """
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+
+        """
+        Pin the reads of the request to the primary if needed, and pin
+        the following requests of the client after a write.
+
+        :param request: The request object.
+        :return: HttpResponse: The response object.
+        """
+
+        with pin_primary(self.is_pinned(request)):
+            response = self.get_response(request)
+
+        return self.pin_after_write(request=request, response=response)
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+
+        """
+        Async version of `handle`.
+
+        :param request: The request object.
+        :return: HttpResponse: The response object.
+        """
+
+        with pin_primary(self.is_pinned(request)):
+            response = await self.get_response(request)
+
+        return self.pin_after_write(request=request, response=response)
+
+    @staticmethod
+    def pin_after_write(
+            *, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
+
+        """
+        Pin the following requests of the client to the primary after
+        a successful write.
+
+        :param request: The request object.
+        :param response: The response object.
+        :return: HttpResponse: The response object.
+        """
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            stickiness_seconds = settings.DATABASE_PRIMARY_STICKINESS_SECONDS
+            pinned_until = str(int(time.time()) + stickiness_seconds)
+
+            response.set_cookie(
+                key=PRIMARY_PINNED_UNTIL_COOKIE, value=pinned_until,
+                max_age=stickiness_seconds, httponly=True, samesite='Lax'
+            )
+            response[PRIMARY_PINNED_UNTIL_HEADER] = pinned_until
+
+        return response
+
+    @staticmethod
+    def is_pinned(request: HttpRequest) -> bool:
+
+        """
+        Check whether the client has written recently.
+
+        :param request: The request object.
+        :return: bool: True if the reads of the request must go to the primary.
+        """
+
+        pinned_until = request.headers.get(PRIMARY_PINNED_UNTIL_HEADER) or \
+            request.COOKIES.get(PRIMARY_PINNED_UNTIL_COOKIE)
+
+        if not pinned_until:
+            return False
+
+        try:
+            return int(pinned_until) > time.time()
+        except ValueError:
+            return False
+
+
+class RequestInstrumentationMiddleware(SyncAndAsyncMiddleware):
+
+    """
+    Lightweight, production safe, per-request instrumentation.
+
+    Every query of the request goes through a database `execute_wrapper`
+    recording the query count, the total SQL time and the query fingerprints
+    (repeated fingerprints reveal N+1 problems). The metrics are sent to
+    the client in the `Server-Timing` header, logged as structured data,
+    exported to Prometheus per URL name, and checked against the budgets
+    declared on the view (`QueryBudgetMixin`).
+    """
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+
+        """
+        Handle the request while collecting its metrics.
+
+        :param request: The request object.
+        :return: HttpResponse: The response object.
+
+        :raises QueryBudgetExceeded: If the request exceeds the budget of
+            its view and `QUERY_BUDGET_STRICT` is enabled.
+        """
+
+        if not settings.REQUEST_INSTRUMENTATION_ENABLED:
+            return cast(HttpResponse, self.get_response(request))
+
+        start = time.perf_counter()
+        install_query_recorders()
+
+        with collect_request_metrics() as request_metrics:
+            response = self.get_response(request)
+
+        return self.report(
+            request=request, response=response, request_metrics=request_metrics,
+            total_time=(time.perf_counter() - start) * 1000
+        )
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+
+        """
+        Async version of `handle`. The recorders are installed in the thread
+        running the `sync_to_async` calls of the request, where its queries
+        are executed.
+
+        :param request: The request object.
+        :return: HttpResponse: The response object.
+        """
+
+        if not settings.REQUEST_INSTRUMENTATION_ENABLED:
+            return cast(HttpResponse, await self.get_response(request))
+
+        start = time.perf_counter()
+        await sync_to_async(install_query_recorders)()
+
+        with collect_request_metrics() as request_metrics:
+            response = await self.get_response(request)
+
+        return self.report(
+            request=request, response=response, request_metrics=request_metrics,
+            total_time=(time.perf_counter() - start) * 1000
+        )
+
+    def report(
+            self, *, request: HttpRequest, response: HttpResponse,
+            request_metrics: RequestMetrics, total_time: float
+    ) -> HttpResponse:
+
+        """
+        Export, log and check the metrics of a handled request.
+
+        :param request: The request object.
+        :param response: The response object.
+        :param request_metrics: The metrics of the request.
+        :param total_time: The total time spent in Django, in milliseconds.
+        :return: HttpResponse: The response, with the `Server-Timing` header.
+        """
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        observe_http_request(
+            method=request.method or '',
+            url_name=getattr(resolver_match, 'url_name', None) or 'unresolved',
+            status=response.status_code, duration=total_time / 1000,
+            query_count=request_metrics.query_count
+        )
+
+        response['Server-Timing'] = self.get_server_timing(
+            request_metrics=request_metrics, total_time=total_time
+        )
+
+        logger.info(
+            '%s %s %s', request.method, request.path, response.status_code,
+            extra={'request_metrics': {
+                **request_metrics.as_dict(), 'total_time': round(total_time, 3)
+            }}
+        )
+
+        self.check_query_budget(request_metrics=request_metrics)
+
+        return response
+
+    def process_view(
+            self, request: HttpRequest, view_func: Callable[..., Any],
+            view_args: Tuple[Any, ...], view_kwargs: Dict[str, Any]
+    ) -> Optional[HttpResponse]:
+
+        """
+        Remember the class of the view handling the request, to read
+        its budgets.
+        """
+
+        request_metrics = get_request_metrics()
+
+        if request_metrics is not None:
+            # DRF views expose their class as `cls`, Django views
+            # as `view_class`.
+            request_metrics.view_class = getattr(view_func, 'cls', None) or \
+                getattr(view_func, 'view_class', None)
+
+        return None
+
+    @staticmethod
+    def get_server_timing(
+            *, request_metrics: RequestMetrics, total_time: float
+    ) -> str:
+
+        """
+        Format the metrics as a `Server-Timing` header value.
+
+        :param request_metrics: The metrics of the request.
+        :param total_time: The total time spent in Django, in milliseconds.
+        :return: str: The `Server-Timing` header value.
+        """
+
+        server_timing = [
+            f'db;dur={request_metrics.query_time:.3f};'
+            f'desc="{request_metrics.query_count} queries"',
+            *[
+                f'{name};dur={duration:.3f}'
+                for name, duration in request_metrics.timings.items()
+            ],
+            f'total;dur={total_time:.3f}',
+        ]
+
+        return ', '.join(server_timing)
+
+    @staticmethod
+    def check_query_budget(*, request_metrics: RequestMetrics) -> None:
+
+        """
+        Check the metrics of the request against the budgets of its view.
+
+        :param request_metrics: The metrics of the request.
+
+        :raises QueryBudgetExceeded: If a budget is exceeded and
+            `QUERY_BUDGET_STRICT` is enabled, otherwise a warning is logged.
+        """
+
+        view_class = request_metrics.view_class
+        if view_class is None:
+            return
+
+        exceeded_budgets: List[str] = []
+
+        query_budget = getattr(view_class, 'query_budget', None)
+        if query_budget is not None and request_metrics.query_count > query_budget:
+            exceeded_budgets.append(
+                f'{request_metrics.query_count} queries (budget {query_budget})'
+            )
+
+        duplicate_query_budget = getattr(view_class, 'duplicate_query_budget', None)
+        if duplicate_query_budget is not None and \
+                request_metrics.duplicate_query_count > duplicate_query_budget:
+            exceeded_budgets.append(
+                f'{request_metrics.duplicate_query_count} duplicate queries '
+                f'(budget {duplicate_query_budget})'
+            )
+
+        sql_time_budget = getattr(view_class, 'sql_time_budget', None)
+        if sql_time_budget is not None and \
+                request_metrics.query_time > sql_time_budget:
+            exceeded_budgets.append(
+                f'{request_metrics.query_time:.3f}ms of SQL '
+                f'(budget {sql_time_budget}ms)'
+            )
+
+        if not exceeded_budgets:
+            return
+
+        message = f'{view_class.__name__} exceeded its query budget: ' + \
+            ', '.join(exceeded_budgets)
+        duplicate_queries = {
+            fingerprint: str(count)
+            for fingerprint, count in request_metrics.get_duplicate_queries()
+        }
+
+        if settings.QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message=message, extra=duplicate_queries)
+
+        logger.warning(message, extra={'duplicate_queries': duplicate_queries})
+
+
+class AsyncWhiteNoiseMiddleware(
+    SyncAndAsyncMiddleware, WhiteNoiseMiddleware  # type: ignore[misc]
+):
+
+    """
+    WhiteNoise middleware which can run in the async request handling too.
+
+    WhiteNoise only supports the sync mode, which would make every ASGI
+    request go through a thread. Looking up a static file is an in-memory
+    lookup (unless the files are refreshed, in development), so it is done
+    in both modes.
+    """
+
+    def __init__(self, get_response: GetResponse) -> None:
+        WhiteNoiseMiddleware.__init__(self, get_response)
+        SyncAndAsyncMiddleware.__init__(self, get_response)
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+        return cast(HttpResponse, WhiteNoiseMiddleware.__call__(self, request))
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+
+        """
+        Serve the static file of the request, if any, otherwise pass
+        the request to the next handler.
+
+        :param request: The request object.
+        :return: HttpResponse: The response object.
+        """
+
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+
+        if static_file is not None:
+            return cast(HttpResponse, self.serve(static_file, request))
+
+        return cast(HttpResponse, await self.get_response(request))
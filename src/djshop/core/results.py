@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django_celery_results.models import GroupResult, TaskResult
+
+
+def delete_expired_task_results(*, batch_size: int) -> int:
+
+    """
+    Delete the task and group results stored in the database for longer
+    than `CELERY_RESULT_EXPIRES`.
+
+    They are left by the `django-db` result backend, and are deleted in
+    chunks of primary keys, so no statement locks the whole table.
+
+    :param batch_size: The maximum number of rows deleted by one statement.
+    :return: int: The number of deleted results.
+    """
+
+    expired_before = timezone.now() - timedelta(
+        seconds=settings.CELERY_RESULT_EXPIRES
+    )
+    deleted_count = 0
+
+    for result_model in (TaskResult, GroupResult):
+        expired_results = result_model.objects.filter(date_done__lt=expired_before)
+
+        while True:
+            result_ids = list(
+                expired_results.values_list('pk', flat=True)[:batch_size]
+            )
+            if not result_ids:
+                break
+
+            batch_deleted_count, _ = result_model.objects.filter(
+                pk__in=result_ids
+            ).delete()
+            deleted_count += batch_deleted_count
+
+    return deleted_count
@@ -0,0 +1,161 @@
+"""
+Start-up profiling of the Django processes.
+
+Every profile boots a fresh interpreter with `python -X importtime`, so
+nothing is already imported, and times the boot of a process type:
+
+- `setup`: `django.setup()`, the boot of the management commands and
+  the Celery workers;
+- `wsgi` / `asgi`: the boot of a web worker, which loads the application
+  and warms it up (`src.djshop.core.warmup.warm_up`).
+
+https://docs.python.org/3/using/cmdline.html#cmdoption-X
+"""
+
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from src.config.env import BASE_DIR
+
+
+BOOT_TARGETS: Dict[str, str] = {
+    'setup': 'import django; django.setup()',
+    'wsgi': (
+        'from src.config.wsgi import application; '
+        'from src.djshop.core.warmup import warm_up; warm_up()'
+    ),
+    'asgi': (
+        'from src.config.asgi import application; '
+        'from src.djshop.core.warmup import warm_up; warm_up()'
+    ),
+}
+
+BOOT_SCRIPT = '''
+import time
+start = time.perf_counter()
+{target}
+print(time.perf_counter() - start)
+'''
+
+IMPORT_TIME_LINE = re.compile(
+    r'^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| (?P<module>.+)$'
+)
+
+
+class ImportTiming(NamedTuple):
+
+    """
+    The import time of a module.
+
+    Attributes:
+        module (str): The dotted path of the module.
+        self_time (float): The time spent importing the module itself,
+            in milliseconds.
+        cumulative_time (float): The time spent importing the module and
+            the modules it imported first, in milliseconds.
+        depth (int): The nesting level of the import, 0 for the modules
+            imported by the boot itself.
+    """
+
+    module: str
+    self_time: float
+    cumulative_time: float
+    depth: int
+
+
+class BootProfile(NamedTuple):
+
+    """
+    The profile of a process boot.
+
+    Attributes:
+        boot_time (float): The wall time of the boot, in milliseconds,
+            without the interpreter start-up.
+        imports (List[ImportTiming]): The import times, in import order.
+    """
+
+    boot_time: float
+    imports: List[ImportTiming]
+
+
+def parse_import_times(output: str) -> List[ImportTiming]:
+
+    """
+    Parse the report of `python -X importtime`.
+
+    :param output: The standard error of the profiled process.
+    :return: List[ImportTiming]: The import times, in import order.
+    """
+
+    import_timings = []
+
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+
+        module = match['module']
+        import_timings.append(ImportTiming(
+            module=module.strip(),
+            self_time=int(match['self']) / 1000,
+            cumulative_time=int(match['cumulative']) / 1000,
+            depth=(len(module) - len(module.lstrip())) // 2,
+        ))
+
+    return import_timings
+
+
+def get_package_import_times(imports: List[ImportTiming]) -> Dict[str, float]:
+
+    """
+    Sum the self import times per top-level package.
+
+    :param imports: The import times of a boot.
+    :return: Dict[str, float]: The import time of every package, in
+        milliseconds, slowest first.
+    """
+
+    package_import_times: Dict[str, float] = defaultdict(float)
+
+    for import_timing in imports:
+        package_import_times[import_timing.module.split('.')[0]] += \
+            import_timing.self_time
+
+    return {
+        package: round(import_time, 3)
+        for package, import_time in sorted(
+            package_import_times.items(), key=lambda item: item[1], reverse=True
+        )
+    }
+
+
+def profile_boot(*, settings_module: str, target: str) -> BootProfile:
+
+    """
+    Boot a process type in a fresh interpreter, and profile its imports.
+
+    :param settings_module: The Django settings module of the process.
+    :param target: The process type, a key of `BOOT_TARGETS`.
+    :return: BootProfile: The profile of the boot.
+
+    :raises subprocess.CalledProcessError: If the boot fails.
+    """
+
+    completed_process = subprocess.run(
+        [
+            sys.executable, '-X', 'importtime', '-c',
+            BOOT_SCRIPT.format(target=BOOT_TARGETS[target])
+        ],
+        cwd=str(BASE_DIR),
+        env={**os.environ, 'DJANGO_SETTINGS_MODULE': settings_module},
+        capture_output=True, text=True, check=True
+    )
+
+    return BootProfile(
+        boot_time=float(completed_process.stdout.splitlines()[-1]) * 1000,
+        imports=parse_import_times(completed_process.stderr),
+    )
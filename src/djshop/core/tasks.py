@@ -0,0 +1,14 @@
+from celery import shared_task
+from django.conf import settings
+
+from src.djshop.core.results import delete_expired_task_results
+
+
+@shared_task
+def delete_expired_task_results_task() -> None:
+
+    """
+    Delete the expired task results stored in the database.
+    """
+
+    delete_expired_task_results(batch_size=settings.CELERY_RESULT_PURGE_BATCH_SIZE)
@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.contrib import admin
+from django.http import HttpRequest
+from django.template.response import TemplateResponse
+
+from src.djshop.utils.db.connections import get_connection_stats
+
+
+def database_connections_admin_view(request: HttpRequest) -> TemplateResponse:
+
+    """
+    Admin page showing the connection settings and pool usage
+    of every configured database.
+
+    :param request: The request object.
+    :return: TemplateResponse: The rendered admin page.
+    """
+
+    context = {
+        **admin.site.each_context(request),
+        'title': 'Database connections',
+        'connection_stats_list': [
+            get_connection_stats(alias=alias) for alias in settings.DATABASES
+        ],
+    }
+
+    return TemplateResponse(
+        request=request, template='admin/core/database_connections.html',
+        context=context
+    )
@@ -0,0 +1,48 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.urls import get_resolver
+from django.utils import translation
+
+from src.djshop.core.checks import check_static_manifest
+
+
+def warm_up() -> None:
+
+    """
+    Load what Django otherwise loads lazily, on the first request of every
+    worker process.
+
+    This is meant to run in the gunicorn master before the workers are
+    forked, so it's done once and shared copy-on-write:
+
+    - the URLconf is imported, which imports every view, serializer and
+      selector module, and its patterns are compiled;
+    - the relation trees of the models' `_meta` are built;
+    - the translation catalog of the default language is loaded;
+    - the static files manifest is loaded, and checked, so a web process
+      without it fails to start instead of failing every page.
+
+    The database and cache connections opened meanwhile are closed, so no
+    socket is shared between the forked workers.
+    """
+
+    # Populating the root resolver also populates the included ones.
+    get_resolver()._populate()
+
+    for model in apps.get_models():
+        model._meta.get_fields()
+
+    with translation.override(settings.LANGUAGE_CODE):
+        translation.gettext('')
+
+    errors = check_static_manifest(None)
+    if errors:
+        raise ImproperlyConfigured(errors[0].msg)
+
+    connections.close_all()
+
+    for cache in caches.all(initialized_only=True):
+        cache.close()
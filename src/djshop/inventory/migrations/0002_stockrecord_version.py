@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 13:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stockrecord',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
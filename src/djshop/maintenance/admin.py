@@ -0,0 +1,32 @@
+from typing import TYPE_CHECKING, Optional
+
+import django_stubs_ext
+from django.contrib import admin
+
+from src.djshop.maintenance.models import JobCheckpoint
+
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+
+django_stubs_ext.monkeypatch()
+
+
+@admin.register(JobCheckpoint)
+class JobCheckpointAdmin(admin.ModelAdmin[JobCheckpoint]):
+
+    """
+    Admin of the maintenance job checkpoints, to follow the running jobs.
+    Deleting a checkpoint makes its job start over.
+    """
+
+    list_display = ('job', 'last_id', 'updated_at')
+
+    def has_add_permission(self, request: 'HttpRequest') -> bool:
+        return False
+
+    def has_change_permission(
+        self, request: 'HttpRequest', obj: Optional[JobCheckpoint] = None
+    ) -> bool:
+        return False
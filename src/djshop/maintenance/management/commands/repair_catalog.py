@@ -0,0 +1,89 @@
+"""
+Django command to run the catalog consistency and repair jobs.
+"""
+
+import os
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from src.djshop.maintenance.services import (
+    CATEGORY_TREE_JOB, IMAGE_HASHES_JOB, ORPHANED_IMAGES_JOB, rehash_image_files,
+    repair_category_tree, report_orphaned_images, reset_job_checkpoint,
+)
+
+
+JOBS = [CATEGORY_TREE_JOB, ORPHANED_IMAGES_JOB, IMAGE_HASHES_JOB]
+
+
+class Command(BaseCommand):
+    """
+    Django's management command that repairs the category tree, reports
+    the orphaned images and updates the stale image file hashes.
+
+    Every job resumes from its checkpoint, unless `--restart` is given.
+
+    Example:
+        python -m src.manage repair_catalog image-hashes --processes 4
+    """
+
+    help = 'Verify and repair the catalog and the media.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+
+        """
+        Add the command's arguments.
+
+        :param parser: The command's argument parser.
+        :return: None
+        """
+
+        parser.add_argument(
+            'jobs', nargs='*', choices=JOBS, default=JOBS,
+            help='The jobs to be run, all by default.'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=settings.MAINTENANCE_CHUNK_SIZE,
+            help='Number of rows processed at once.'
+        )
+        parser.add_argument(
+            '--processes', type=int, default=os.cpu_count() or 1,
+            help='Number of processes hashing the image files.'
+        )
+        parser.add_argument(
+            '--restart', action='store_true',
+            help='Ignore the checkpoints of the jobs, and start over.'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+
+        """
+        Command's entry point.
+
+        :param args: Additional command-line arguments
+        :param options: Additional options
+        :return: None
+        """
+
+        chunk_size = options['chunk_size']
+
+        for job in options['jobs']:
+            if options['restart']:
+                reset_job_checkpoint(job=job)
+
+            self.stdout.write(f'Running the {job} job...')
+
+            if job == CATEGORY_TREE_JOB:
+                count = repair_category_tree(chunk_size=chunk_size)
+                message = f'{count} category nodes repaired.'
+            elif job == ORPHANED_IMAGES_JOB:
+                count = report_orphaned_images(chunk_size=chunk_size)
+                message = f'{count} orphaned images found.'
+            else:
+                count = rehash_image_files(
+                    chunk_size=chunk_size, processes=options['processes']
+                )
+                message = f'{count} image hashes updated.'
+
+            self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-19 14:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.CharField(max_length=64, unique=True)),
+                ('last_id', models.BigIntegerField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Job Checkpoint',
+                'verbose_name_plural': 'Job Checkpoints',
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import models
+
+
+class JobCheckpoint(models.Model):
+
+    """
+    Model representing the progress of a maintenance job, so an interrupted
+    run resumes where it stopped instead of starting over.
+
+    The jobs walk their table in primary key order, see
+    `src.djshop.maintenance.services.iterate_id_chunks`, and the checkpoint
+    is deleted once a run completes.
+
+    Attributes:
+        job (str): The name of the job.
+        last_id (int): The primary key of the last processed row.
+        updated_at (datetime): The timestamp of the last processed chunk.
+    """
+
+    job = models.CharField(max_length=64, unique=True)
+    last_id = models.BigIntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Job Checkpoint"
+        verbose_name_plural = "Job Checkpoints"
+
+    def __str__(self) -> str:
+
+        """
+        Returns a human-readable string representation of the checkpoint.
+
+        :returns: str: The job and its last processed primary key.
+        """
+
+        return f'{self.job} @ {self.last_id}'
@@ -0,0 +1,178 @@
+"""
+Nightly consistency and repair jobs of the catalog and the media.
+
+The jobs walk their table in primary key order, a chunk of rows at a time
+(keyset pagination), so they run in bounded memory and never hold a lock
+on the whole table. The last processed primary key is checkpointed after
+every chunk, so an interrupted run resumes where it stopped.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Any, Iterator, List
+
+from src.djshop.catalog.models import Category
+from src.djshop.catalog.services.category import repair_category_nodes
+from src.djshop.maintenance.models import JobCheckpoint
+from src.djshop.media.models import Image
+from src.djshop.media.services import find_orphaned_images, rehash_images
+from src.djshop.media.tasks import rehash_images_task
+from src.djshop.utils.tasks import send_batches
+
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+
+logger = logging.getLogger(__name__)
+
+CATEGORY_TREE_JOB = 'category-tree'
+ORPHANED_IMAGES_JOB = 'orphaned-images'
+IMAGE_HASHES_JOB = 'image-hashes'
+# The dispatch of the images to the rehash task, checkpointed apart from
+# `rehash_image_files`, so neither skips the images of the other.
+IMAGE_REHASH_DISPATCH_JOB = 'image-rehash-dispatch'
+
+
+def iterate_id_chunks(
+    *, job: str, queryset: 'QuerySet[Any]', chunk_size: int
+) -> Iterator[List[int]]:
+
+    """
+    Yield the primary keys of a queryset in ascending chunks, starting
+    after the checkpoint of a job.
+
+    The checkpoint is moved past a chunk once the next one is requested,
+    i.e. once the chunk is processed, and deleted once the queryset is
+    exhausted, so the next run starts over.
+
+    :param job: The name of the job.
+    :param queryset: The rows to be processed.
+    :param chunk_size: The maximum number of primary keys of a chunk.
+    :return: Iterator[List[int]]: The chunks of primary keys.
+    """
+
+    checkpoint = JobCheckpoint.objects.filter(job=job).first()
+    ids_queryset = queryset.order_by('pk').values_list('pk', flat=True)
+
+    if checkpoint is not None:
+        logger.info('Resuming the %s job after #%s.', job, checkpoint.last_id)
+        ids_queryset = ids_queryset.filter(pk__gt=checkpoint.last_id)
+
+    while True:
+        ids = list(ids_queryset[:chunk_size])
+        if not ids:
+            break
+
+        yield ids
+
+        JobCheckpoint.objects.update_or_create(
+            job=job, defaults={'last_id': ids[-1]}
+        )
+        ids_queryset = ids_queryset.filter(pk__gt=ids[-1])
+
+    JobCheckpoint.objects.filter(job=job).delete()
+
+
+def reset_job_checkpoint(*, job: str) -> None:
+
+    """
+    Delete the checkpoint of a job, so its next run starts over.
+
+    :param job: The name of the job.
+    """
+
+    JobCheckpoint.objects.filter(job=job).delete()
+
+
+def repair_category_tree(*, chunk_size: int) -> int:
+
+    """
+    Repair the `depth` and the `numchild` of every category node.
+
+    :param chunk_size: The number of nodes verified at once.
+    :return: int: The number of repaired nodes.
+    """
+
+    repaired_count = 0
+
+    for category_ids in iterate_id_chunks(
+        job=CATEGORY_TREE_JOB, queryset=Category.objects.all(),
+        chunk_size=chunk_size
+    ):
+        repaired_ids = repair_category_nodes(category_ids=category_ids)
+
+        if repaired_ids:
+            logger.warning('Repaired the category nodes %s.', repaired_ids)
+        repaired_count += len(repaired_ids)
+
+    return repaired_count
+
+
+def report_orphaned_images(*, chunk_size: int) -> int:
+
+    """
+    Report the images that no product references.
+
+    They are only logged, as an image may be uploaded before the product
+    referencing it is saved.
+
+    :param chunk_size: The number of images verified at once.
+    :return: int: The number of orphaned images.
+    """
+
+    orphaned_count = 0
+
+    for image_ids in iterate_id_chunks(
+        job=ORPHANED_IMAGES_JOB, queryset=Image.objects.all(),
+        chunk_size=chunk_size
+    ):
+        orphaned_ids = find_orphaned_images(image_ids=image_ids)
+
+        if orphaned_ids:
+            logger.warning('Found the orphaned images %s.', orphaned_ids)
+        orphaned_count += len(orphaned_ids)
+
+    return orphaned_count
+
+
+def rehash_image_files(*, chunk_size: int, processes: int) -> int:
+
+    """
+    Update the stale file hashes and sizes of every image, the files of
+    a chunk being hashed by a pool of worker processes.
+
+    :param chunk_size: The number of images hashed at once.
+    :param processes: The number of worker processes.
+    :return: int: The number of updated images.
+    """
+
+    updated_count = 0
+
+    for image_ids in iterate_id_chunks(
+        job=IMAGE_HASHES_JOB, queryset=Image.objects.all(), chunk_size=chunk_size
+    ):
+        updated_count += len(rehash_images(image_ids=image_ids, processes=processes))
+
+    return updated_count
+
+
+def dispatch_image_rehash(*, chunk_size: int) -> int:
+
+    """
+    Send every image to the rehash task, which updates the stale file
+    hashes and sizes, so the files are hashed by the media workers.
+
+    :param chunk_size: The number of images sent at once.
+    :return: int: The number of sent images.
+    """
+
+    sent_count = 0
+
+    for image_ids in iterate_id_chunks(
+        job=IMAGE_REHASH_DISPATCH_JOB, queryset=Image.objects.all(),
+        chunk_size=chunk_size
+    ):
+        send_batches(task=rehash_images_task, identifiers=image_ids)
+        sent_count += len(image_ids)
+
+    return sent_count
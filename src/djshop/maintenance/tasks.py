@@ -0,0 +1,73 @@
+from typing import Any
+
+from celery import Task, shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+
+from src.djshop.maintenance.services import (
+    dispatch_image_rehash, repair_category_tree, report_orphaned_images,
+)
+
+
+class ResumableJobTask(Task):  # type: ignore[misc]
+
+    """
+    Base class of the maintenance tasks, which run a checkpointed job.
+
+    A task stopped by its soft time limit is sent again, and resumes its
+    job from the checkpoint, up to `MAINTENANCE_TASK_MAX_RESUMES` times.
+    """
+
+    soft_time_limit = settings.MAINTENANCE_TASK_SOFT_TIME_LIMIT
+    time_limit = settings.MAINTENANCE_TASK_TIME_LIMIT
+    max_retries = settings.MAINTENANCE_TASK_MAX_RESUMES
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+
+        """
+        Run the task, and send it again if it is stopped by its soft time
+        limit.
+
+        :param args: The positional arguments of the task.
+        :param kwargs: The keyword arguments of the task.
+        :return: Any: The result of the task.
+
+        :raises SoftTimeLimitExceeded: If the task is stopped more than
+            `max_retries` times.
+        """
+
+        try:
+            return super().__call__(*args, **kwargs)
+        except SoftTimeLimitExceeded as exc:
+            raise self.retry(exc=exc, countdown=0)
+
+
+@shared_task(base=ResumableJobTask)
+def repair_category_tree_task() -> None:
+
+    """
+    Repair the `depth` and the `numchild` of every category node.
+    """
+
+    repair_category_tree(chunk_size=settings.MAINTENANCE_CHUNK_SIZE)
+
+
+@shared_task(base=ResumableJobTask)
+def report_orphaned_images_task() -> None:
+
+    """
+    Report the images that no product references.
+    """
+
+    report_orphaned_images(chunk_size=settings.MAINTENANCE_CHUNK_SIZE)
+
+
+@shared_task(base=ResumableJobTask)
+def dispatch_image_rehash_task() -> None:
+
+    """
+    Send every image to the rehash task of the media workers, which run
+    in parallel, as a Celery worker process can't have child processes.
+    """
+
+    dispatch_image_rehash(chunk_size=settings.MAINTENANCE_CHUNK_SIZE)
@@ -7,6 +7,8 @@ from django.db import models
 
 from src.djshop.common.models import BaseModel
 from src.djshop.core.exceptions import DuplicateImageException
+from src.djshop.metrics.registry import image_processing_timer
+from src.djshop.outbox.services import publish_event
 
 
 def image_file_path(instance: Any, filename: str) -> str:
@@ -70,8 +72,9 @@ class Image(BaseModel):
             self.file_size = self.image.size
 
             hasher = hashlib.sha1()
-            for chunk in self.image.file.chunks():
-                hasher.update(chunk)
+            with image_processing_timer('hash'):
+                for chunk in self.image.file.chunks():
+                    hasher.update(chunk)
 
             self.file_hash = hasher.hexdigest()
 
@@ -117,7 +120,8 @@ class Image(BaseModel):
         Save the image.
 
         This method overrides the save() method to calculate the hash and size
-        of the image file before saving the instance.
+        of the image file before saving the instance. Its renditions are
+        created by a task, published through the outbox.
 
         :param args: Additional positional arguments.
         :param kwargs: Additional keyword arguments.
@@ -126,6 +130,8 @@ class Image(BaseModel):
         self.calculate_hash_and_size_for_file()
         super().save(*args, **kwargs)
 
+        publish_event(topic='media.renditions', identifiers=[self.pk])
+
     def __str__(self) -> str:
 
         """
@@ -0,0 +1,169 @@
+import hashlib
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import List, Optional, Tuple
+
+import django
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image as PILImage  # type: ignore
+
+from src.djshop.common.services import model_bulk_update
+from src.djshop.media.models import Image
+from src.djshop.metrics.registry import image_processing_timer
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_image_rendition_name(*, image_name: str, width: int) -> str:
+
+    """
+    Build the storage name of the rendition of an image.
+
+    :param image_name: The storage name of the original image.
+    :param width: The width of the rendition.
+    :return: str: The storage name of the rendition.
+    """
+
+    return os.path.join('renditions', str(width), os.path.basename(image_name))
+
+
+def create_image_renditions(*, image: Image) -> List[str]:
+
+    """
+    Create the missing renditions of an image, at the
+    `IMAGE_RENDITION_WIDTHS` narrower than the image.
+
+    The existing renditions are kept, so creating them again is a no-op.
+
+    :param image: The image.
+    :return: List[str]: The storage names of the created renditions.
+    """
+
+    storage = image.image.storage
+    rendition_widths = [
+        width for width in settings.IMAGE_RENDITION_WIDTHS
+        if width < image.width and not storage.exists(
+            get_image_rendition_name(image_name=image.image.name, width=width)
+        )
+    ]
+
+    if not rendition_widths:
+        return []
+
+    rendition_names = []
+
+    with image.image.open('rb') as image_file, PILImage.open(image_file) as source:
+        for width in rendition_widths:
+            with image_processing_timer('rendition'):
+                rendition = source.copy()
+                rendition.thumbnail((width, image.height))
+
+                rendition_file = BytesIO()
+                rendition.save(
+                    rendition_file, format=source.format,
+                    quality=settings.IMAGE_RENDITION_QUALITY
+                )
+
+            rendition_names.append(storage.save(
+                get_image_rendition_name(image_name=image.image.name, width=width),
+                ContentFile(rendition_file.getvalue())
+            ))
+
+    return rendition_names
+
+
+def find_orphaned_images(*, image_ids: List[int]) -> List[int]:
+
+    """
+    Find the images, among the given ones, that no product references.
+
+    :param image_ids: The IDs of the images to be verified.
+    :return: List[int]: The IDs of the orphaned images.
+    """
+
+    return list(
+        Image.objects.filter(pk__in=image_ids, products__isnull=True)
+        .order_by('pk').values_list('pk', flat=True)
+    )
+
+
+def get_image_file_hash(image_name: str) -> Optional[Tuple[str, int]]:
+
+    """
+    Hash an image file, like `Image.calculate_hash_and_size_for_file`.
+
+    Runs in the worker processes of `rehash_images`, so it only takes
+    the storage name of the file.
+
+    :param image_name: The storage name of the image file.
+    :return: Optional[Tuple[str, int]]: The SHA-1 hash and the size of the
+        file, None if the file is missing.
+    """
+
+    storage = Image._meta.get_field('image').storage
+    hasher = hashlib.sha1()
+    file_size = 0
+
+    try:
+        with storage.open(image_name, 'rb') as image_file:
+            with image_processing_timer('hash'):
+                for chunk in image_file.chunks():
+                    hasher.update(chunk)
+                    file_size += len(chunk)
+    except FileNotFoundError:
+        return None
+
+    return hasher.hexdigest(), file_size
+
+
+def rehash_images(*, image_ids: List[int], processes: int = 1) -> List[int]:
+
+    """
+    Hash the files of the given images again, and update the stale
+    `file_hash` and `file_size` of the images.
+
+    The files are read and hashed by a pool of worker processes, as
+    hashing is CPU bound. The images whose file is missing are skipped.
+
+    :param image_ids: The IDs of the images to be verified.
+    :param processes: The number of worker processes, 1 to hash the files
+        in the current process.
+    :return: List[int]: The IDs of the updated images.
+    """
+
+    images = list(
+        Image.objects.filter(pk__in=image_ids).order_by('pk')
+        .only('pk', 'version', 'image', 'file_hash', 'file_size')
+    )
+    image_names = [image.image.name for image in images]
+
+    if processes > 1:
+        # The worker processes may be spawned rather than forked, so they
+        # set up Django themselves.
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=django.setup
+        ) as executor:
+            file_hashes = list(executor.map(get_image_file_hash, image_names))
+    else:
+        file_hashes = [get_image_file_hash(image_name) for image_name in image_names]
+
+    updates = []
+
+    for image, file_hash in zip(images, file_hashes):
+        if file_hash is None:
+            logger.warning('The file of the image #%s is missing.', image.pk)
+            continue
+
+        updates.append(
+            (image, {'file_hash': file_hash[0], 'file_size': file_hash[1]})
+        )
+
+    updated_images = model_bulk_update(
+        updates=updates, fields=['file_hash', 'file_size'], validate=False
+    )
+
+    return [image.pk for image in updated_images]
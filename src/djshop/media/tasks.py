@@ -0,0 +1,32 @@
+from typing import List
+
+from celery import shared_task
+
+from src.djshop.media.models import Image
+from src.djshop.media.services import create_image_renditions, rehash_images
+from src.djshop.utils.tasks import IdempotentTask
+
+
+@shared_task(base=IdempotentTask, ignore_result=True)
+def create_image_renditions_task(image_ids: List[int]) -> None:
+
+    """
+    Create the missing renditions of the given images.
+
+    :param image_ids: The IDs of the images, the deleted ones are skipped.
+    """
+
+    for image in Image.objects.filter(pk__in=image_ids).iterator():
+        create_image_renditions(image=image)
+
+
+@shared_task(base=IdempotentTask, ignore_result=True)
+def rehash_images_task(image_ids: List[int]) -> None:
+
+    """
+    Update the stale file hashes and sizes of the given images.
+
+    :param image_ids: The IDs of the images, the deleted ones are skipped.
+    """
+
+    rehash_images(image_ids=image_ids)
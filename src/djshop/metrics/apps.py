@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class MetricsConfig(AppConfig):
+    name = 'src.djshop.metrics'
+
+    def ready(self) -> None:
+
+        """
+        Connect the Celery signal handlers recording the task metrics.
+        """
+
+        from src.djshop.metrics import signals  # noqa: F401
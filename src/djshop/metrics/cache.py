@@ -0,0 +1,53 @@
+from typing import Any, Optional
+
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+
+from src.djshop.metrics.registry import CACHE_REQUESTS
+
+
+_MISSING = object()
+
+
+class CacheMetricsMixin:
+
+    """
+    Cache backend mixin counting the hits and misses of `get`, labelled
+    with the cache alias, to compute the cache hit ratio.
+    """
+
+    cache_alias = 'default'
+
+    def get(
+            self, key: Any, default: Optional[Any] = None,
+            version: Optional[int] = None, **kwargs: Any
+    ) -> Any:
+
+        """
+        Look the key up, and count the lookup as a hit or a miss.
+        """
+
+        value = super().get(  # type: ignore[misc]
+            key, default=_MISSING, version=version, **kwargs
+        )
+
+        if value is _MISSING:
+            CACHE_REQUESTS.labels(cache=self.cache_alias, result='miss').inc()
+            return default
+
+        CACHE_REQUESTS.labels(cache=self.cache_alias, result='hit').inc()
+        return value
+
+
+class InstrumentedRedisCache(CacheMetricsMixin, RedisCache):  # type: ignore[misc]
+
+    """
+    django-redis cache backend with hit and miss metrics.
+    """
+
+
+class InstrumentedLocMemCache(CacheMetricsMixin, LocMemCache):
+
+    """
+    Local memory cache backend with hit and miss metrics.
+    """
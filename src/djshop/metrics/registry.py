@@ -0,0 +1,124 @@
+"""
+Prometheus metrics of the web, database, cache, Celery and image
+processing layers.
+
+When the `PROMETHEUS_MULTIPROC_DIR` environment variable is set (gunicorn
+and Celery prefork workers), prometheus_client stores the values in
+memory-mapped files of that directory, and the `/metrics` endpoint
+aggregates the files of every worker process.
+https://prometheus.github.io/client_python/multiprocess/
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Generator
+
+from prometheus_client import (
+    REGISTRY, CollectorRegistry, Counter, Histogram, multiprocess,
+)
+
+
+HTTP_REQUEST_DURATION = Histogram(
+    name='djshop_http_request_duration_seconds',
+    documentation='HTTP request latency, per URL name.',
+    labelnames=('method', 'url_name', 'status'),
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    name='djshop_db_queries_per_request',
+    documentation='Number of database queries per HTTP request, per URL name.',
+    labelnames=('url_name',),
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100, 200, 500, float('inf')),
+)
+
+CACHE_REQUESTS = Counter(
+    name='djshop_cache_requests_total',
+    documentation='Cache lookups, per cache alias and result (hit or miss).',
+    labelnames=('cache', 'result'),
+)
+
+CELERY_TASK_DURATION = Histogram(
+    name='djshop_celery_task_duration_seconds',
+    documentation='Celery task runtime, per task and final state.',
+    labelnames=('task', 'state'),
+)
+
+DB_QUERIES_PER_TASK = Histogram(
+    name='djshop_db_queries_per_task',
+    documentation=(
+        'Number of database queries per Celery task, the stored result included.'
+    ),
+    labelnames=('task',),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500, float('inf')),
+)
+
+CELERY_TASK_QUEUE_LAG = Histogram(
+    name='djshop_celery_task_queue_lag_seconds',
+    documentation='Time between the publication and the start of a Celery task.',
+    labelnames=('task',),
+)
+
+IMAGE_PROCESSING_DURATION = Histogram(
+    name='djshop_image_processing_duration_seconds',
+    documentation='Image processing duration, per operation.',
+    labelnames=('operation',),
+)
+
+
+def get_metrics_registry() -> CollectorRegistry:
+
+    """
+    Return the registry to be exposed by the metrics endpoint.
+
+    :return: CollectorRegistry: The registry aggregating every worker process
+        in multiprocess mode, otherwise the default in-process registry.
+    """
+
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+
+    return registry
+
+
+def observe_http_request(
+    *, method: str, url_name: str, status: int, duration: float, query_count: int
+) -> None:
+
+    """
+    Record the latency and the query count of an HTTP request.
+
+    :param method: The HTTP method of the request.
+    :param url_name: The name of the resolved URL pattern.
+    :param status: The status code of the response.
+    :param duration: The request latency, in seconds.
+    :param query_count: The number of database queries of the request.
+    """
+
+    HTTP_REQUEST_DURATION.labels(
+        method=method, url_name=url_name, status=str(status)
+    ).observe(duration)
+    DB_QUERIES_PER_REQUEST.labels(url_name=url_name).observe(query_count)
+
+
+@contextmanager
+def image_processing_timer(operation: str) -> Generator[None, None, None]:
+
+    """
+    Context manager recording the duration of an image processing operation,
+    e.g. `with image_processing_timer('hash'):`.
+
+    :param operation: The name of the image processing operation.
+    """
+
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        IMAGE_PROCESSING_DURATION.labels(operation=operation).observe(
+            time.perf_counter() - start
+        )
@@ -0,0 +1,82 @@
+import time
+from contextlib import ExitStack
+from typing import Any, Dict, Optional, Tuple
+
+from celery import Task
+from celery.signals import before_task_publish, task_postrun, task_prerun
+
+from src.djshop.core.instrumentation import (
+    RequestMetrics, collect_request_metrics, install_query_recorders,
+)
+from src.djshop.metrics.registry import (
+    CELERY_TASK_DURATION, CELERY_TASK_QUEUE_LAG, DB_QUERIES_PER_TASK,
+)
+
+
+PUBLISHED_AT_HEADER = 'published_at'
+
+# Start time and metrics of the tasks running in this worker process,
+# per task id.
+_task_runs: Dict[str, Tuple[float, RequestMetrics, ExitStack]] = {}
+
+
+@before_task_publish.connect
+def stamp_task_published_at(
+    headers: Optional[Dict[str, Any]] = None, **kwargs: Any
+) -> None:
+
+    """
+    Stamp the publication time on the message, to measure the queue lag.
+    """
+
+    if headers is not None:
+        headers[PUBLISHED_AT_HEADER] = time.time()
+
+
+@task_prerun.connect
+def record_task_start(task_id: str, task: Task, **kwargs: Any) -> None:
+
+    """
+    Record the start time and the queue lag of a task, and start counting
+    its database queries.
+    """
+
+    install_query_recorders()
+
+    metrics_stack = ExitStack()
+    task_metrics = metrics_stack.enter_context(collect_request_metrics())
+    _task_runs[task_id] = (time.perf_counter(), task_metrics, metrics_stack)
+
+    published_at = getattr(task.request, PUBLISHED_AT_HEADER, None) or \
+        (task.request.headers or {}).get(PUBLISHED_AT_HEADER)
+
+    if published_at is not None:
+        CELERY_TASK_QUEUE_LAG.labels(task=task.name).observe(
+            max(time.time() - float(published_at), 0)
+        )
+
+
+@task_postrun.connect
+def record_task_duration(
+    task_id: str, task: Task, state: Optional[str] = None, **kwargs: Any
+) -> None:
+
+    """
+    Record the runtime and the query count of a task.
+
+    The signal is sent once the result of the task is stored, so the
+    queries of a database result backend are counted too.
+    """
+
+    task_run = _task_runs.pop(task_id, None)
+
+    if task_run is None:
+        return
+
+    start_time, task_metrics, metrics_stack = task_run
+    metrics_stack.close()
+
+    CELERY_TASK_DURATION.labels(
+        task=task.name, state=state or 'UNKNOWN'
+    ).observe(time.perf_counter() - start_time)
+    DB_QUERIES_PER_TASK.labels(task=task.name).observe(task_metrics.query_count)
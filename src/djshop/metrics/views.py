@@ -0,0 +1,42 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from src.djshop.metrics.registry import get_metrics_registry
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+
+    """
+    Expose the metrics in the Prometheus text format.
+
+    This endpoint is internal: it is only served to the addresses in
+    `METRICS_ALLOWED_IPS`, or to scrapers sending the `METRICS_AUTH_TOKEN`
+    as a bearer token. Everyone else gets a 404. The addresses are matched
+    against `REMOTE_ADDR`, so behind a proxy the token has to be used.
+
+    :param request: The request object.
+    :return: HttpResponse: The metrics of every worker process.
+
+    :raises Http404: If the client is not allowed to scrape the metrics.
+    """
+
+    auth_token = settings.METRICS_AUTH_TOKEN
+    # The token is compared in constant time, and as bytes, as a header
+    # may hold non-ASCII characters.
+    is_allowed = request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS or (
+        bool(auth_token) and hmac.compare_digest(
+            request.headers.get('Authorization', '').encode(),
+            f'Bearer {auth_token}'.encode()
+        )
+    )
+
+    if not is_allowed:
+        raise Http404
+
+    return HttpResponse(
+        content=generate_latest(get_metrics_registry()),
+        content_type=CONTENT_TYPE_LATEST
+    )
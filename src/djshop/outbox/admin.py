@@ -0,0 +1,35 @@
+from typing import TYPE_CHECKING, Optional
+
+import django_stubs_ext
+from django.contrib import admin
+
+from src.djshop.outbox.models import OutboxEvent
+
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+
+django_stubs_ext.monkeypatch()
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin[OutboxEvent]):
+
+    """
+    Read-only admin of the outbox events, to follow their delivery.
+    """
+
+    list_display = (
+        'id', 'topic', 'created_at', 'published_at', 'attempts',
+        'next_attempt_at', 'last_error',
+    )
+    list_filter = ('topic', ('published_at', admin.EmptyFieldListFilter))
+
+    def has_add_permission(self, request: 'HttpRequest') -> bool:
+        return False
+
+    def has_change_permission(
+        self, request: 'HttpRequest', obj: Optional[OutboxEvent] = None
+    ) -> bool:
+        return False
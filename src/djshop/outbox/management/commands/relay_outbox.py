@@ -0,0 +1,76 @@
+"""
+Django command to run the outbox relay process.
+"""
+
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+
+from src.djshop.outbox.services import relay_outbox_events
+
+
+class Command(BaseCommand):
+    """
+    Django's management command that publishes the pending outbox events,
+    in batches, until it is stopped.
+
+    Several relays can run concurrently, each one locks its own batch.
+
+    Example:
+        python -m src.manage relay_outbox
+    """
+
+    help = 'Publish the pending outbox events.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+
+        """
+        Add the command's arguments.
+
+        :param parser: The command's argument parser.
+        :return: None
+        """
+
+        parser.add_argument(
+            '--batch-size', type=int, default=settings.OUTBOX_RELAY_BATCH_SIZE,
+            help='Maximum number of events published per batch.'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Drain the outbox once, and exit.'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+
+        """
+        Command's entry point.
+
+        :param args: Additional command-line arguments
+        :param options: Additional options
+        :return: None
+        """
+
+        batch_size = options['batch_size']
+        published_count = 0
+
+        self.stdout.write('Relaying the outbox events...')
+
+        while True:
+            # The process is long-lived, like a worker.
+            close_old_connections()
+
+            batch_published_count = relay_outbox_events(batch_size=batch_size)
+            published_count += batch_published_count
+
+            if batch_published_count == batch_size:
+                continue
+
+            if options['once']:
+                break
+
+            time.sleep(settings.OUTBOX_RELAY_POLL_INTERVAL)
+
+        self.stdout.write(self.style.SUCCESS(f'{published_count} events published.'))
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-19 14:49
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outbox', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='outboxevent',
+            name='outbox_event_pending_idx',
+        ),
+        migrations.AddField(
+            model_name='outboxevent',
+            name='next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name='outboxevent',
+            index=models.Index(condition=models.Q(('published_at__isnull', True)), fields=['next_attempt_at', 'id'], name='outbox_event_pending_idx'),
+        ),
+    ]
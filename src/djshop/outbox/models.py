@@ -0,0 +1,58 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class OutboxEvent(models.Model):
+
+    """
+    Model representing an event to be published to the downstream consumers
+    (the edge cache, the image processing...).
+
+    The events are written in the same transaction as the change they
+    describe, so an event exists if and only if its change is committed,
+    and they are published by the outbox relay, see
+    `src.djshop.outbox.services.relay_outbox_events`.
+
+    Attributes:
+        topic (str): The topic of the event, a key of `OUTBOX_TOPICS`.
+        identifiers (list): The identifiers of the objects of the event.
+        created_at (datetime): The creation timestamp.
+        published_at (Optional[datetime]): The publication timestamp, None
+            while the event is pending.
+        attempts (int): The number of failed publication attempts, the
+            event is given up after `OUTBOX_MAX_ATTEMPTS`.
+        last_error (str): The error of the last failed attempt.
+        next_attempt_at (datetime): When the event may be published, pushed
+            back after every failed attempt.
+    """
+
+    topic = models.CharField(max_length=128)
+    identifiers = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+    published_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "Outbox Event"
+        verbose_name_plural = "Outbox Events"
+        indexes = [
+            # The relay only scans the pending events, in attempt order.
+            models.Index(
+                fields=['next_attempt_at', 'id'],
+                condition=Q(published_at__isnull=True),
+                name='outbox_event_pending_idx'
+            ),
+        ]
+
+    def __str__(self) -> str:
+
+        """
+        Returns a human-readable string representation of the event.
+
+        :returns: str: The topic and the ID of the event.
+        """
+
+        return f'{self.topic} #{self.pk}'
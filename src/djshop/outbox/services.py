@@ -0,0 +1,201 @@
+import hashlib
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+from celery import Task
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import Now
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from src.djshop.outbox.models import OutboxEvent
+from src.djshop.utils.tasks import enqueue_on_commit, send_batches
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_topic_task(topic: str) -> Task:
+
+    """
+    Return the Celery task publishing the events of a topic.
+
+    :param topic: The topic, a key of `OUTBOX_TOPICS`.
+    :return: Task: The task, its first argument is the list of identifiers.
+
+    :raises KeyError: If the topic is unknown.
+    """
+
+    return import_string(settings.OUTBOX_TOPICS[topic])
+
+
+def publish_event(
+    *, topic: str, identifiers: Iterable[Any]
+) -> Optional[OutboxEvent]:
+
+    """
+    Write an event to the outbox, in the current transaction.
+
+    The event is published by the relay process once the transaction
+    commits, and never if it is rolled back.
+
+    :param topic: The topic of the event, a key of `OUTBOX_TOPICS`.
+    :param identifiers: The identifiers of the objects of the event.
+    :return: Optional[OutboxEvent]: The event, None without identifiers.
+
+    :raises KeyError: If the topic is unknown.
+    """
+
+    identifiers = sorted(set(identifiers))
+    if not identifiers:
+        return None
+
+    # An unknown topic is rejected along with the change, not by the relay.
+    get_topic_task(topic)
+
+    event = OutboxEvent.objects.create(topic=topic, identifiers=identifiers)
+
+    if settings.OUTBOX_RELAY_ON_COMMIT:
+        # The tasks module imports this one.
+        from src.djshop.outbox.tasks import relay_outbox_events_task
+
+        enqueue_on_commit(task=relay_outbox_events_task, identifiers=[event.pk])
+
+    return event
+
+
+def publish_topic_events(*, topic: str, events: List[OutboxEvent]) -> None:
+
+    """
+    Publish the events of a topic, their identifiers coalesced into
+    batched messages.
+
+    The keys of the messages are derived from the events (their creation
+    time included, in case the IDs are ever reused), so a batch published
+    again (e.g. the relay failed to commit after publishing it) is skipped
+    by the idempotent tasks.
+
+    :param topic: The topic of the events.
+    :param events: The events to be published.
+    """
+
+    events_key = ','.join(
+        f'{event.pk}@{event.created_at.isoformat()}' for event in events
+    )
+
+    send_batches(
+        task=get_topic_task(topic),
+        identifiers=[
+            identifier for event in events for identifier in event.identifiers
+        ],
+        idempotency_key=(
+            f'outbox:{topic}:{hashlib.sha1(events_key.encode()).hexdigest()}'
+        ),
+    )
+
+
+def get_outbox_retry_delay(*, attempts: int) -> timedelta:
+
+    """
+    Return the delay before the next attempt to publish an event, doubled
+    after every failed attempt.
+
+    :param attempts: The number of failed attempts of the event.
+    :return: timedelta: The delay before the next attempt.
+    """
+
+    delay = settings.OUTBOX_RETRY_DELAY * 2 ** max(attempts - 1, 0)
+
+    return timedelta(seconds=min(delay, settings.OUTBOX_RETRY_MAX_DELAY))
+
+
+def relay_outbox_events(
+    *, batch_size: int, event_ids: Optional[List[int]] = None
+) -> int:
+
+    """
+    Publish a batch of the pending outbox events.
+
+    The events are locked with `SELECT ... FOR UPDATE SKIP LOCKED`, so the
+    relays running concurrently publish different events, and marked as
+    published in the same transaction. The events of a topic which fails
+    to be published stay pending, with the error recorded, and are retried
+    after a growing delay, until they are given up after
+    `OUTBOX_MAX_ATTEMPTS` attempts.
+
+    :param batch_size: The maximum number of events to be published.
+    :param event_ids: The IDs of the events to be published, None for the
+        pending ones due for an attempt, the oldest first.
+    :return: int: The number of published events.
+    """
+
+    with transaction.atomic():
+        events_queryset = OutboxEvent.objects.select_for_update(
+            skip_locked=True
+        ).filter(
+            published_at__isnull=True,
+            attempts__lt=settings.OUTBOX_MAX_ATTEMPTS,
+            next_attempt_at__lte=Now(),
+        )
+
+        if event_ids is not None:
+            events_queryset = events_queryset.filter(pk__in=event_ids)
+
+        events = list(
+            events_queryset.order_by('next_attempt_at', 'pk')[:batch_size]
+        )
+
+        topic_events: Dict[str, List[OutboxEvent]] = defaultdict(list)
+        for event in events:
+            topic_events[event.topic].append(event)
+
+        published_event_ids: List[int] = []
+        failed_events: List[OutboxEvent] = []
+
+        for topic, events_of_topic in topic_events.items():
+            try:
+                publish_topic_events(topic=topic, events=events_of_topic)
+            except Exception as exc:
+                logger.exception('Failed to publish the %s outbox events.', topic)
+                for event in events_of_topic:
+                    event.attempts += 1
+                    event.last_error = repr(exc)
+                    event.next_attempt_at = timezone.now() + \
+                        get_outbox_retry_delay(attempts=event.attempts)
+
+                    if event.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                        logger.error('Gave up publishing the event %s.', event)
+
+                failed_events.extend(events_of_topic)
+            else:
+                published_event_ids.extend(event.pk for event in events_of_topic)
+
+        OutboxEvent.objects.bulk_update(
+            failed_events, fields=['attempts', 'last_error', 'next_attempt_at']
+        )
+        OutboxEvent.objects.filter(pk__in=published_event_ids).update(
+            published_at=Now()
+        )
+
+    return len(published_event_ids)
+
+
+def delete_published_outbox_events() -> int:
+
+    """
+    Delete the events published for longer than `OUTBOX_RETENTION`.
+
+    :return: int: The number of deleted events.
+    """
+
+    published_before = timezone.now() - timedelta(seconds=settings.OUTBOX_RETENTION)
+    deleted_count, _ = OutboxEvent.objects.filter(
+        published_at__lt=published_before
+    ).delete()
+
+    return deleted_count
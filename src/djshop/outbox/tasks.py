@@ -0,0 +1,32 @@
+from typing import List
+
+from celery import shared_task
+
+from src.djshop.outbox.services import (
+    delete_published_outbox_events, relay_outbox_events,
+)
+from src.djshop.utils.tasks import IdempotentTask
+
+
+@shared_task(base=IdempotentTask, ignore_result=True)
+def relay_outbox_events_task(event_ids: List[int]) -> None:
+
+    """
+    Publish the given outbox events, right after their transaction commits
+    (see `OUTBOX_RELAY_ON_COMMIT`). The events already published by the
+    relay process are skipped.
+
+    :param event_ids: The IDs of the events to be published.
+    """
+
+    relay_outbox_events(batch_size=len(event_ids), event_ids=event_ids)
+
+
+@shared_task(ignore_result=True)
+def delete_published_outbox_events_task() -> None:
+
+    """
+    Delete the events published for longer than `OUTBOX_RETENTION`.
+    """
+
+    delete_published_outbox_events()
@@ -0,0 +1,9 @@
+class InvalidPosition(Exception): ...
+
+class InvalidMoveToDescendant(Exception): ...
+
+class NodeAlreadySaved(Exception): ...
+
+class MissingNodeOrderBy(Exception): ...
+
+class PathOverflow(Exception): ...
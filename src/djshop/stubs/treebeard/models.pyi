@@ -39,7 +39,7 @@ class Node(models.Model):
     def get_last_root_node(cls: Type[T]) -> 'T': ...
 
     @classmethod
-    def find_problems(cls) -> list[str]: ...
+    def find_problems(cls) -> Any: ...
 
     @classmethod
     def fix_tree(cls) -> None: ...
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from django.db import models
 from treebeard.models import Node as Node
@@ -136,7 +136,9 @@ class MP_Node(Node):
     # Example return type: List of dictionaries with string keys and values.
 
     @classmethod
-    def find_problems(cls) -> List[str]: ...
+    def find_problems(
+        cls
+    ) -> Tuple[List[int], List[int], List[int], List[int], List[int]]: ...
 
     @classmethod
     def fix_tree(cls, destructive: bool = ..., fix_paths: bool = ...) -> None: ...
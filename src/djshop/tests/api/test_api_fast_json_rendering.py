@@ -0,0 +1,96 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.renderers import JSONRenderer
+
+from src.djshop.api.extractors import ValuesExtractor, get_values_extractor
+from src.djshop.api.renderers import ORJSONRenderer
+from src.djshop.catalog.models import Category
+from src.djshop.catalog.serializers.admin.category import (
+    CategoryTreeOutPutModelSerializer,
+)
+from src.djshop.catalog.serializers.front.category import (
+    CategoryOutPutModelSerializer,
+)
+
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_values_extractor_matches_serializer_output_return_success(
+        five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that the values extractor produces the same output as the
+    serializer it is compiled from.
+
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    extractor = get_values_extractor(CategoryOutPutModelSerializer)
+    assert extractor.value_fields == ('id', 'title', 'description', 'is_public')
+
+    category_queryset = cast('QuerySet[Category]', Category.objects.order_by('path'))
+    extracted_data = extractor.extract_many(
+        category_queryset.values(*extractor.value_fields)
+    )
+    serializer_data = CategoryOutPutModelSerializer(
+        category_queryset, many=True
+    ).data
+
+    assert extracted_data == list(serializer_data)
+
+
+def test_values_extractor_is_cached_per_serializer_return_success() -> None:
+
+    """
+    Test that the values extractor is compiled only once per serializer class.
+    """
+
+    first_extractor = get_values_extractor(CategoryOutPutModelSerializer)
+    second_extractor = get_values_extractor(CategoryOutPutModelSerializer)
+
+    assert first_extractor is second_extractor
+
+
+def test_values_extractor_with_method_field_return_error() -> None:
+
+    """
+    Test that compiling a serializer with fields that can't be computed
+    from a values row raises an error.
+    """
+
+    with pytest.raises(ImproperlyConfigured):
+        ValuesExtractor(serializer_class=CategoryTreeOutPutModelSerializer)
+
+
+def test_orjson_renderer_matches_json_renderer_return_success() -> None:
+
+    """
+    Test that the orjson renderer produces the same document as
+    the default DRF JSON renderer, including the types orjson
+    doesn't handle natively.
+    """
+
+    test_data = {
+        'title': 'test category',
+        'price': Decimal('10.50'),
+        'created_at': datetime(2024, 1, 1, tzinfo=timezone.utc),
+        'results': [1, 2, 3],
+    }
+
+    orjson_rendered_data = ORJSONRenderer().render(test_data)
+    json_rendered_data = JSONRenderer().render(test_data)
+
+    assert json.loads(orjson_rendered_data) == json.loads(json_rendered_data)
+    assert ORJSONRenderer().render(None) == b''
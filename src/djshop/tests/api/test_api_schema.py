@@ -0,0 +1,93 @@
+import json
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Generator
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from src.djshop.api.schema import load_schema_document
+
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+    from rest_framework.test import APIClient
+
+
+@pytest.fixture(autouse=True)
+def static_root(
+    tmp_path: Path, settings: 'SettingsWrapper'
+) -> Generator[Path, None, None]:
+
+    """
+    Use a temporary `STATIC_ROOT`, and forget the schema loaded by the
+    previous tests.
+
+    :param tmp_path: A fixture providing a temporary directory.
+    :param settings: A fixture to override the Django settings.
+    :return: Generator[Path, None, None]: The temporary `STATIC_ROOT`.
+    """
+
+    settings.STATIC_ROOT = str(tmp_path)
+    load_schema_document.cache_clear()
+
+    yield tmp_path
+
+    load_schema_document.cache_clear()
+
+
+def test_build_schema_and_get_schema_return_success(
+    api_client: 'APIClient', static_root: Path
+) -> None:
+
+    """
+    Test that the schema built by the release step is served from its file,
+    with an ETag, and that a revalidation gets a `304 Not Modified`.
+
+    :param api_client: An instance of the Django REST Framework's test client.
+    :param static_root: A fixture providing the temporary `STATIC_ROOT`.
+    """
+
+    call_command('build_schema', stdout=StringIO())
+
+    schema_file = static_root / 'schema' / 'openapi-1.0.0.json'
+    schema_file.write_bytes(
+        json.dumps({**json.loads(schema_file.read_bytes()), 'pre': True}).encode()
+    )
+
+    url = reverse('schema')
+    response = api_client.get(url)
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/vnd.oai.openapi+json'
+    assert response.json()['pre'] is True
+    assert '/api/' in str(response.json()['paths'])
+    assert 'public' in response['Cache-Control']
+
+    revalidation_response = api_client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    assert revalidation_response.status_code == 304
+    assert revalidation_response['ETag'] == response['ETag']
+
+
+def test_get_schema_without_schema_file_return_success(
+    api_client: 'APIClient'
+) -> None:
+
+    """
+    Test that the schema is generated in memory, once, when its file is
+    missing.
+
+    :param api_client: An instance of the Django REST Framework's test client.
+    """
+
+    url = reverse('schema')
+    response = api_client.get(url)
+
+    assert response.status_code == 200
+    assert response.json()['info']['title'] == 'djshop API'
+    assert api_client.get(url)['ETag'] == response['ETag']
+    assert load_schema_document.cache_info().misses == 1
+
+    assert api_client.post(url).status_code == 405
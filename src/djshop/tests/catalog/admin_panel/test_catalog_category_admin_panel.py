@@ -1,14 +1,18 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import pytest
 from django.urls import reverse
 from rest_framework import status
 
+from src.djshop.catalog.admin import CategoryAdmin
+from src.djshop.catalog.forms import CategoryAdminForm
+from src.djshop.catalog.models import Category
+from src.djshop.outbox.models import OutboxEvent
+
 
 if TYPE_CHECKING:
     from django.test import Client
 
-    from src.djshop.catalog.models import Category
     from src.djshop.users.models import BaseUser
 
 
@@ -23,6 +27,24 @@ ADMIN_PANEL_CATEGORY_OBJECT_ADD_URL = reverse(
     viewname='admin:catalog_category_add'
 )
 
+ADMIN_PANEL_CATEGORY_PARENT_AUTOCOMPLETE_URL = reverse(
+    viewname='admin:catalog_category_parent_autocomplete'
+)
+
+
+def admin_panel_category_children_url(category_id: int) -> str:
+
+    """
+    Generate URL for listing the children of a category in the admin panel.
+
+    :param category_id: The ID of the parent category object.
+    :return: The URL for listing the children of the category object.
+    """
+
+    return reverse(
+        viewname='admin:catalog_category_children', args=[category_id]
+    )
+
 
 def admin_panel_category_object_update_url(category_id: int) -> str:
 
@@ -146,6 +168,37 @@ def test_category_admin_panel_update_object_view(
     assert response.status_code == status.HTTP_200_OK
 
 
+def test_category_admin_panel_update_object_view_bumps_version(
+        client: 'Client', first_test_superuser: 'BaseUser',
+        first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that saving a category in the Category admin panel increments its
+    version, so the API clients holding the previous version get a 412.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    :param first_test_root_category: Category instance to be updated.
+    """
+
+    client.force_login(first_test_superuser)
+    url = admin_panel_category_object_update_url(
+        category_id=first_test_root_category.pk
+    )
+    response = client.post(path=url, data={
+        'title': 'updated test category',
+        'slug': first_test_root_category.slug,
+        'description': first_test_root_category.description,
+        'is_public': 'on',
+    })
+    assert response.status_code == status.HTTP_302_FOUND
+
+    updated_category = Category.objects.get(pk=first_test_root_category.pk)
+    assert updated_category.title == 'updated test category'
+    assert updated_category.version == first_test_root_category.version + 1
+
+
 def test_category_admin_panel_delete_object_view(
         client: 'Client', first_test_superuser: 'BaseUser',
         first_test_root_category: 'Category'
@@ -165,3 +218,228 @@ def test_category_admin_panel_delete_object_view(
     )
     response = client.get(path=url)
     assert response.status_code == status.HTTP_200_OK
+
+
+def test_category_admin_panel_list_display_view_lists_root_nodes(
+        client: 'Client', first_test_superuser: 'BaseUser',
+        first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that the list display view of the Category admin panel only lists
+    the root categories, with a button expanding the nodes with children,
+    and lists the matching children when searching.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    :param first_test_root_category: Root category instance with a child.
+    """
+
+    test_child_category = cast('Category', first_test_root_category.add_child(
+        title='test child category', slug='test-child-category'
+    ))
+
+    client.force_login(user=first_test_superuser)
+    response = client.get(path=ADMIN_PANEL_CATEGORY_OBJECT_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content = response.content.decode()
+    assert first_test_root_category.title in response_content
+    assert test_child_category.title not in response_content
+    assert admin_panel_category_children_url(
+        category_id=first_test_root_category.pk
+    ) in response_content
+
+    response = client.get(
+        path=ADMIN_PANEL_CATEGORY_OBJECT_LIST_URL, data={'q': '"test child"'}
+    )
+    assert test_child_category.title in response.content.decode()
+
+
+def test_category_admin_panel_children_view(
+        client: 'Client', first_test_superuser: 'BaseUser',
+        first_test_root_category: 'Category', monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    """
+    Test that the children view of the Category admin panel returns
+    the direct children of a category, page by page.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    :param first_test_root_category: Root category instance with children.
+    :param monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    monkeypatch.setattr(CategoryAdmin, 'children_page_size', 2)
+
+    test_child_categories = [
+        cast('Category', first_test_root_category.add_child(
+            title=f'test child category {index}', slug=f'test-child-category-{index}'
+        ))
+        for index in range(3)
+    ]
+    test_child_categories[0].add_child(
+        title='test grandchild category', slug='test-grandchild-category'
+    )
+
+    client.force_login(user=first_test_superuser)
+    url = admin_panel_category_children_url(category_id=first_test_root_category.pk)
+
+    response = client.get(path=url)
+    assert response.status_code == status.HTTP_200_OK
+
+    response_data = response.json()
+    assert [child['title'] for child in response_data['results']] == [
+        'test child category 0', 'test child category 1'
+    ]
+    assert response_data['results'][0]['numchild'] == 1
+    assert response_data['results'][0]['children_url'] is not None
+    assert response_data['next'] is not None
+
+    response = client.get(path=url, data={'after': response_data['next']})
+    response_data = response.json()
+    assert [child['title'] for child in response_data['results']] == [
+        'test child category 2'
+    ]
+    assert response_data['next'] is None
+
+
+def test_category_admin_panel_parent_autocomplete_view(
+        client: 'Client', first_test_superuser: 'BaseUser',
+        first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that the parent autocomplete view of the Category admin panel
+    searches the categories by title.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    :param first_test_root_category: Category instance to be searched.
+    """
+
+    client.force_login(user=first_test_superuser)
+    response = client.get(
+        path=ADMIN_PANEL_CATEGORY_PARENT_AUTOCOMPLETE_URL,
+        data={'term': first_test_root_category.title[:5]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        'results': [
+            {
+                'id': str(first_test_root_category.pk),
+                'text': first_test_root_category.title
+            }
+        ],
+        'pagination': {'more': False},
+    }
+
+
+def test_category_admin_form_renders_selected_parent(
+        first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that the parent autocomplete of the Category admin form renders
+    the current parent of a category as the selected option only.
+
+    :param first_test_root_category: Root category instance with a child.
+    """
+
+    test_child_category = cast('Category', first_test_root_category.add_child(
+        title='test child category', slug='test-child-category'
+    ))
+
+    parent_html = str(CategoryAdminForm(instance=test_child_category)['parent'])
+    assert f'<option value="{first_test_root_category.pk}" selected>' in parent_html
+    assert parent_html.count('<option') == 2
+
+
+def test_category_admin_panel_move_object_view(
+        client: 'Client', first_test_superuser: 'BaseUser',
+        first_test_root_category: 'Category', second_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that changing the parent of a category in the Category admin panel
+    moves it under the new parent, and that a category can't be moved
+    under its own descendants.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    :param first_test_root_category: Root category instance to be moved.
+    :param second_test_root_category: Root category instance, the new parent.
+    """
+
+    client.force_login(first_test_superuser)
+    url = admin_panel_category_object_update_url(
+        category_id=first_test_root_category.pk
+    )
+    category_form_data = {
+        'title': first_test_root_category.title,
+        'slug': first_test_root_category.slug,
+        'description': first_test_root_category.description,
+        'is_public': 'on',
+    }
+
+    response = client.post(
+        path=url, data={**category_form_data, 'parent': second_test_root_category.pk}
+    )
+    assert response.status_code == status.HTTP_302_FOUND
+
+    first_test_root_category.refresh_from_db()
+    assert first_test_root_category.get_parent() == second_test_root_category
+
+    url = admin_panel_category_object_update_url(
+        category_id=second_test_root_category.pk
+    )
+    response = client.post(
+        path=url, data={
+            'title': second_test_root_category.title,
+            'slug': second_test_root_category.slug,
+            'parent': first_test_root_category.pk
+        }
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert 'parent' in response.context['adminform'].form.errors
+    assert Category.find_problems() == ([], [], [], [], [])
+
+
+def test_category_admin_panel_delete_action_publishes_purge_event(
+        client: 'Client', first_test_superuser: 'BaseUser',
+        first_test_root_category: 'Category', second_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that deleting categories with the admin action deletes their
+    descendants, and writes the purge of their edge cached pages to the
+    outbox, in the same transaction.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    :param first_test_root_category: Root category instance to be deleted.
+    :param second_test_root_category: Root category instance to be kept.
+    """
+
+    child_category = cast(
+        'Category', first_test_root_category.add_child(title='deleted child')
+    )
+
+    client.force_login(first_test_superuser)
+    response = client.post(path=ADMIN_PANEL_CATEGORY_OBJECT_LIST_URL, data={
+        'action': 'delete_selected',
+        '_selected_action': [first_test_root_category.pk],
+        'post': 'yes',
+    })
+    assert response.status_code == status.HTTP_302_FOUND
+
+    assert list(Category.objects.all()) == [second_test_root_category]
+
+    outbox_event = OutboxEvent.objects.get()
+    assert outbox_event.topic == 'cdn.purge'
+    assert outbox_event.identifiers == sorted([
+        'category:list',
+        f'category:{first_test_root_category.pk}',
+        f'category:{child_category.pk}',
+    ])
@@ -0,0 +1,138 @@
+from typing import TYPE_CHECKING, List, cast
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from src.djshop.catalog.models import AttributeValue, Recommendations
+from src.djshop.tests.factories.category_factories import CategoryFactory
+from src.djshop.tests.factories.product_class_factories import AttributeFactory
+from src.djshop.tests.factories.product_factories import ProductFactory
+
+
+if TYPE_CHECKING:
+    from django.test import Client
+
+    from src.djshop.catalog.models import Attribute, Category, Product
+    from src.djshop.users.models import BaseUser
+
+
+pytestmark = pytest.mark.django_db
+
+
+ADMIN_PANEL_PRODUCT_OBJECT_LIST_URL = reverse(
+    viewname='admin:catalog_product_changelist'
+)
+
+
+def admin_panel_product_object_update_url(product_id: int) -> str:
+
+    """
+    Generate URL for updating a product object in the admin panel.
+
+    :param product_id: The ID of the product object.
+    :return: The URL for updating the product object.
+    """
+
+    return reverse(viewname='admin:catalog_product_change', args=[product_id])
+
+
+def test_product_admin_panel_list_display_view_constant_queries(
+        client: 'Client', first_test_superuser: 'BaseUser'
+) -> None:
+
+    """
+    Test that the list display view of the Product admin panel runs
+    the same number of queries for one and for many products, and doesn't
+    count the full result set when searching.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    """
+
+    client.force_login(user=first_test_superuser)
+    first_test_product = cast('Product', ProductFactory())
+
+    # Warm the per-process caches (content types, permissions...) up.
+    client.get(path=ADMIN_PANEL_PRODUCT_OBJECT_LIST_URL)
+
+    with CaptureQueriesContext(connection) as one_product_queries:
+        response = client.get(path=ADMIN_PANEL_PRODUCT_OBJECT_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+    assert first_test_product.title in response.content.decode()
+
+    ProductFactory.create_batch(size=10)
+
+    with CaptureQueriesContext(connection) as many_products_queries:
+        response = client.get(path=ADMIN_PANEL_PRODUCT_OBJECT_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    assert len(many_products_queries) == len(one_product_queries)
+
+    with CaptureQueriesContext(connection) as search_queries:
+        response = client.get(
+            path=ADMIN_PANEL_PRODUCT_OBJECT_LIST_URL,
+            data={'q': first_test_product.title}
+        )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.context['cl'].full_result_count is None
+    assert len(search_queries) == len(one_product_queries)
+
+
+def test_product_admin_panel_update_object_view_bounded_inlines(
+        client: 'Client', first_test_superuser: 'BaseUser',
+        first_test_product: 'Product', second_test_product: 'Product'
+) -> None:
+
+    """
+    Test that the inlines of the Product admin change view don't list every
+    attribute, product and category, so the page doesn't grow with
+    the catalog.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    :param first_test_product: Product instance to be updated.
+    :param second_test_product: Product instance recommended with the first.
+    """
+
+    client.force_login(user=first_test_superuser)
+    test_attribute = cast('Attribute', AttributeFactory())
+    AttributeValue.objects.create(
+        product=first_test_product, attribute=test_attribute, value_text='test'
+    )
+    Recommendations.objects.create(
+        primary=first_test_product, normal=second_test_product
+    )
+    url = admin_panel_product_object_update_url(product_id=first_test_product.id)
+
+    # Warm the per-process caches (content types, permissions...) up.
+    client.get(path=url)
+
+    with CaptureQueriesContext(connection) as small_catalog_queries:
+        response = client.get(path=url)
+    assert response.status_code == status.HTTP_200_OK
+    assert test_attribute.title in response.content.decode()
+
+    unrelated_products = cast(List['Product'], ProductFactory.create_batch(size=5))
+    unrelated_attributes = cast(
+        List['Attribute'], AttributeFactory.create_batch(size=5)
+    )
+    unrelated_categories = cast(
+        List['Category'], CategoryFactory.create_batch(size=5)
+    )
+
+    with CaptureQueriesContext(connection) as large_catalog_queries:
+        response = client.get(path=url)
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content = response.content.decode()
+    for unrelated_title in [
+        *(product.title for product in unrelated_products),
+        *(attribute.title for attribute in unrelated_attributes),
+        *(category.title for category in unrelated_categories),
+    ]:
+        assert unrelated_title not in response_content
+
+    assert len(large_catalog_queries) == len(small_catalog_queries)
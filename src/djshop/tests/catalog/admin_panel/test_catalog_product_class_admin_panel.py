@@ -1,14 +1,22 @@
 from typing import TYPE_CHECKING
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
+from src.djshop.catalog.models import ProductClass
+from src.djshop.tests.factories.product_class_factories import (
+    AttributeFactory, ProductClassFactory,
+)
+from src.djshop.utils.db.paginators import EstimatedCountPaginator
+
 
 if TYPE_CHECKING:
     from django.test import Client
 
-    from src.djshop.catalog.models import Attribute, ProductClass
+    from src.djshop.catalog.models import Attribute
     from src.djshop.users.models import BaseUser
 
 
@@ -204,3 +212,81 @@ def test_product_class_admin_panel_delete_object_view(
     )
     response = client.get(path=url)
     assert response.status_code == status.HTTP_200_OK
+
+
+def test_product_class_admin_panel_list_display_view_constant_queries(
+        client: 'Client', first_test_superuser: 'BaseUser'
+) -> None:
+
+    """
+    Test that the list display view of the Product Class admin panel
+    runs the same number of queries for one and for many product classes,
+    and for the attributes count filter.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    """
+
+    client.force_login(user=first_test_superuser)
+    AttributeFactory.create_batch(size=2, product_class=ProductClassFactory())
+
+    # Warm the per-process caches (content types, permissions...) up.
+    client.get(path=ADMIN_PANEL_PRODUCT_CLASS_OBJECT_LIST_URL)
+
+    with CaptureQueriesContext(connection) as one_product_class_queries:
+        response = client.get(path=ADMIN_PANEL_PRODUCT_CLASS_OBJECT_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    for product_class in ProductClassFactory.create_batch(size=5):
+        AttributeFactory.create_batch(size=3, product_class=product_class)
+
+    with CaptureQueriesContext(connection) as many_product_classes_queries:
+        response = client.get(path=ADMIN_PANEL_PRODUCT_CLASS_OBJECT_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    assert len(many_product_classes_queries) == len(one_product_class_queries)
+
+    with CaptureQueriesContext(connection) as filtered_queries:
+        response = client.get(
+            path=ADMIN_PANEL_PRODUCT_CLASS_OBJECT_LIST_URL,
+            data={'attributes_count': '< 5'}
+        )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.context['cl'].result_list) == 6
+
+    # No full (unfiltered) result count when filtering.
+    assert len(filtered_queries) == len(one_product_class_queries)
+
+
+def test_estimated_count_paginator_return_success(
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    """
+    Test that the paginator uses the estimated row count for large tables,
+    and counts small tables and filtered querysets exactly.
+
+    :param monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    ProductClassFactory.create_batch(size=3)
+    product_class_queryset = ProductClass.objects.order_by('pk')
+
+    paginator = EstimatedCountPaginator(product_class_queryset, per_page=2)
+    assert paginator.get_estimated_count() is None
+    assert paginator.count == 3
+
+    monkeypatch.setattr(
+        EstimatedCountPaginator, 'get_estimated_count', lambda self: 50_000
+    )
+
+    paginator = EstimatedCountPaginator(product_class_queryset, per_page=2)
+    assert paginator.count == 50_000
+    assert paginator.num_pages == 25_000
+
+    monkeypatch.setattr(
+        EstimatedCountPaginator, 'get_estimated_count', lambda self: 100
+    )
+
+    paginator = EstimatedCountPaginator(product_class_queryset, per_page=2)
+    assert paginator.count == 3
@@ -0,0 +1,167 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from src.djshop.catalog.models import Category
+from src.djshop.catalog.services.category import update_category_node
+from src.djshop.common.services import model_update
+from src.djshop.core.exceptions import ConcurrentUpdateError
+
+
+if TYPE_CHECKING:
+    from rest_framework.test import APIClient
+
+
+pytestmark = pytest.mark.django_db
+
+
+def category_admin_node_url(category_slug: str) -> str:
+
+    """
+    Generate the URL for the category admin node API endpoint based on
+    the category slug.
+
+    :param category_slug: The slug of the category.
+    :return: The URL for the category admin 'node API' endpoint.
+    """
+
+    return reverse(
+        viewname='api:catalog:admin-category-node', args=[category_slug]
+    )
+
+
+def test_update_admin_category_node_with_if_match_api_return_success(
+    api_client: 'APIClient', first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that updating a category node with the ETag of its current version
+    in the `If-Match` header is successful and returns the ETag of the new
+    version, and that updating it again with the stale ETag returns
+    `412 Precondition Failed` without overwriting the category.
+
+    :param api_client: A fixture providing the Django test client for
+    API requests.
+    :param first_test_root_category: A fixture providing the first test
+    root category object.
+    """
+
+    url = category_admin_node_url(category_slug=first_test_root_category.slug)
+
+    response = api_client.get(path=url)
+    first_etag = response['ETag']
+
+    response = api_client.patch(
+        path=url, data={'title': 'first updated title'},
+        HTTP_IF_MATCH=first_etag
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    second_etag = response['ETag']
+    assert second_etag != first_etag
+
+    response = api_client.get(path=url, HTTP_IF_NONE_MATCH=second_etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = api_client.patch(
+        path=url, data={'title': 'second updated title'},
+        HTTP_IF_MATCH=first_etag
+    )
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    first_test_root_category.refresh_from_db()
+    assert first_test_root_category.title == 'first updated title'
+    assert first_test_root_category.version == 2
+
+
+def test_update_category_node_with_stale_version_return_error(
+    first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that updating a category read before a concurrent update raises
+    a `ConcurrentUpdateError` instead of overwriting the concurrent update,
+    and that the stale version is rejected through the service as well.
+
+    :param first_test_root_category: A fixture providing the first test
+    root category object.
+    """
+
+    stale_category = Category.objects.get(pk=first_test_root_category.pk)
+
+    update_category_node(
+        category_slug=first_test_root_category.slug,
+        category_node_data={'description': 'first updated description'}
+    )
+
+    with pytest.raises(ConcurrentUpdateError):
+        model_update(
+            instance=stale_category, fields=['description'],
+            data={'description': 'second updated description'}
+        )
+
+    with pytest.raises(ConcurrentUpdateError):
+        update_category_node(
+            category_slug=first_test_root_category.slug,
+            category_node_data={'description': 'second updated description'},
+            expected_version=stale_category.version
+        )
+
+    first_test_root_category.refresh_from_db()
+    assert first_test_root_category.description == 'first updated description'
+
+
+def test_save_stale_category_after_model_update_return_success(
+    first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that saving a category read before a `model_update` increments
+    the version of the row, not the stale version of the instance, so the
+    saved content never gets a version already published.
+
+    :param first_test_root_category: A fixture providing the first test
+    root category object.
+    """
+
+    stale_category = Category.objects.get(pk=first_test_root_category.pk)
+
+    updated_category, _ = model_update(
+        instance=first_test_root_category, fields=['description'],
+        data={'description': 'first updated description'}
+    )
+    assert updated_category.version == 2
+
+    stale_category.description = 'second updated description'
+    stale_category.save()
+
+    assert stale_category.version == 3
+    assert Category.objects.get(pk=first_test_root_category.pk).version == 3
+
+
+def test_update_category_node_without_unique_queries_return_success(
+    first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that updating a category doesn't query for duplicated titles
+    and slugs, and leaves the uniqueness to the database constraints.
+
+    :param first_test_root_category: A fixture providing the first test
+    root category object.
+    """
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        update_category_node(
+            category_slug=first_test_root_category.slug,
+            category_node_data={'title': 'updated test category title'}
+        )
+
+    select_queries = [
+        query['sql'] for query in captured_queries
+        if query['sql'].startswith('SELECT')
+    ]
+    assert len(select_queries) == 1
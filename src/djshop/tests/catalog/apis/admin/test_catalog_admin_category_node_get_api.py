@@ -113,6 +113,41 @@ def test_get_admin_category_child_node_get_api_return_success(
     assert response.data['numchild'] == 0
 
 
+def test_get_admin_category_node_with_if_modified_since_api_return_success(
+    api_client: 'APIClient', first_test_root_category: 'Category',
+    first_test_category_payload: Dict[str, str]
+) -> None:
+
+    """
+    Test that the category node is validated with its ETag only, so a
+    client revalidating with `If-Modified-Since` after a child is added,
+    which doesn't touch the `updated_at` of the parent, gets the new
+    `numchild` instead of `304 Not Modified`.
+
+    :param api_client: A fixture providing the Django test client for API requests.
+    :param first_test_root_category: A fixture providing the first test
+    root category object.
+    :param first_test_category_payload: Payload for creating the first
+    test child category.
+    :return: None
+    """
+
+    url = category_admin_node_url(category_slug=first_test_root_category.slug)
+
+    response = api_client.get(path=url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['numchild'] == 0
+    assert not response.has_header('Last-Modified')
+
+    first_test_root_category.add_child(**first_test_category_payload)
+
+    response = api_client.get(
+        path=url, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT'
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['numchild'] == 1
+
+
 def test_get_admin_nonexistent_category_node_get_api_return_error(
     api_client: 'APIClient'
 ) -> None:
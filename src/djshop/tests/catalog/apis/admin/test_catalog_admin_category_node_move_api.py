@@ -0,0 +1,242 @@
+from typing import TYPE_CHECKING, Any, Generator, Optional, cast
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from src.djshop.catalog.models import Category
+from src.djshop.catalog.services import category as category_services
+from src.djshop.cdn.backends import LocalPurgeBackend
+
+
+if TYPE_CHECKING:
+    from rest_framework.test import APIClient
+
+
+pytestmark = pytest.mark.django_db
+
+
+def category_admin_move_node_url(category_slug: str) -> str:
+
+    """
+    Generate the URL for the category admin node move API endpoint based on
+    the category slug.
+
+    :param category_slug: The slug of the category.
+    :return: The URL for the category admin 'node move API' endpoint.
+    """
+
+    return reverse(
+        viewname='api:catalog:admin-move-category-node', args=[category_slug]
+    )
+
+
+@pytest.fixture(autouse=True)
+def local_purge_backend() -> Generator[None, None, None]:
+
+    """
+    Fixture which clears the surrogate keys recorded by the local
+    purge backend before and after each test.
+    """
+
+    LocalPurgeBackend.reset()
+    yield
+    LocalPurgeBackend.reset()
+
+
+def add_test_child_category(parent: 'Category', title: str) -> 'Category':
+
+    """
+    Add a child category to the given parent category.
+
+    :param parent: The parent category.
+    :param title: The title of the child category.
+    :return: The created child category.
+    """
+
+    return cast(
+        'Category', parent.add_child(title=title, slug=title.replace(' ', '-'))
+    )
+
+
+def test_move_admin_category_node_under_category_return_success(
+    api_client: 'APIClient', django_capture_on_commit_callbacks: Any,
+    first_test_root_category: 'Category', second_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that moving a category node with its subtree under another category
+    rewrites the paths and depths of the whole subtree with a constant number
+    of queries, updates the number of children and the modification time
+    of the old and new parents, and purges the affected surrogate keys.
+
+    :param api_client: A fixture providing the Django test client for
+    API requests.
+    :param django_capture_on_commit_callbacks: pytest-django fixture
+        capturing the `transaction.on_commit` callbacks.
+    :param first_test_root_category: A fixture providing the first test
+    root category object, the old parent.
+    :param second_test_root_category: A fixture providing the second test
+    root category object, the new parent.
+    """
+
+    add_test_child_category(second_test_root_category, 'existing child category')
+    moved_category = add_test_child_category(
+        first_test_root_category, 'moved category'
+    )
+    moved_child_categories = [
+        add_test_child_category(moved_category, f'moved child category {index}')
+        for index in range(5)
+    ]
+    add_test_child_category(moved_child_categories[0], 'moved grandchild category')
+
+    first_test_root_category.refresh_from_db()
+    second_test_root_category.refresh_from_db()
+    old_parent_updated_at = first_test_root_category.updated_at
+    new_parent_updated_at = second_test_root_category.updated_at
+
+    url = category_admin_move_node_url(category_slug=moved_category.slug)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with CaptureQueriesContext(connection) as captured_queries:
+            response = api_client.post(
+                path=url, data={'parent_node': second_test_root_category.slug},
+                format='json'
+            )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['path'] == second_test_root_category.path + '0002'
+    assert response.data['depth'] == 2
+    # Transaction, locks, last child lookup, subtree and parents updates,
+    # outbox event and reload, whatever the size of the subtree.
+    assert len(captured_queries) <= 11
+
+    moved_category = Category.objects.get(pk=moved_category.pk)
+    assert moved_category.get_parent() == second_test_root_category
+    assert moved_category.get_descendant_count() == 6
+    assert Category.objects.get(
+        slug='moved-grandchild-category'
+    ).get_ancestors()[0] == second_test_root_category
+
+    first_test_root_category.refresh_from_db()
+    second_test_root_category.refresh_from_db()
+    assert first_test_root_category.numchild == 0
+    assert second_test_root_category.numchild == 2
+    assert first_test_root_category.updated_at > old_parent_updated_at
+    assert second_test_root_category.updated_at > new_parent_updated_at
+    assert Category.find_problems() == ([], [], [], [], [])
+
+    assert sorted(LocalPurgeBackend.purged_keys) == sorted([
+        'category:list', f'category:{moved_category.pk}'
+    ])
+
+
+@pytest.mark.parametrize('parent_node', (None, 'moved-category'))
+def test_move_admin_category_node_to_root_return_success(
+    api_client: 'APIClient', first_test_root_category: 'Category',
+    second_test_root_category: 'Category', parent_node: Optional[str]
+) -> None:
+
+    """
+    Test that moving a category node to the root categories appends it after
+    the last root category, and that moving it under its current parent
+    leaves the tree unchanged.
+
+    :param api_client: A fixture providing the Django test client for
+    API requests.
+    :param first_test_root_category: A fixture providing the first test
+    root category object, the old parent.
+    :param second_test_root_category: A fixture providing the second test
+    root category object, the last root category.
+    :param parent_node: The slug of the new parent node.
+    """
+
+    moved_category = add_test_child_category(
+        first_test_root_category, 'moved category'
+    )
+    add_test_child_category(moved_category, 'moved child category')
+
+    url = category_admin_move_node_url(category_slug='moved-child-category')
+    response = api_client.post(
+        path=url, data={'parent_node': parent_node}, format='json'
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    if parent_node is None:
+        assert response.data['depth'] == 1
+        assert Category.get_last_root_node().slug == 'moved-child-category'
+    else:
+        assert response.data['depth'] == 3
+
+    assert Category.find_problems() == ([], [], [], [], [])
+
+
+def test_move_admin_category_node_under_descendant_return_error(
+    api_client: 'APIClient', first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that moving a category node under itself or one of its descendants,
+    or under a category that doesn't exist, is rejected.
+
+    :param api_client: A fixture providing the Django test client for
+    API requests.
+    :param first_test_root_category: A fixture providing the first test
+    root category object.
+    """
+
+    add_test_child_category(first_test_root_category, 'test child category')
+
+    url = category_admin_move_node_url(category_slug=first_test_root_category.slug)
+
+    for parent_node in (first_test_root_category.slug, 'test-child-category'):
+        response = api_client.post(
+            path=url, data={'parent_node': parent_node}, format='json'
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = api_client.post(
+        path=url, data={'parent_node': 'not-existing-category'}, format='json'
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    first_test_root_category.refresh_from_db()
+    assert first_test_root_category.depth == 1
+    assert Category.find_problems() == ([], [], [], [], [])
+
+
+def test_move_admin_category_node_to_taken_path_return_error(
+    api_client: 'APIClient', first_test_root_category: 'Category',
+    second_test_root_category: 'Category', monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    """
+    Test that a move colliding with a category added concurrently under
+    the new parent returns a conflict and leaves the tree unchanged.
+
+    :param api_client: A fixture providing the Django test client for
+    API requests.
+    :param first_test_root_category: A fixture providing the first test
+    root category object, the old parent.
+    :param second_test_root_category: A fixture providing the second test
+    root category object, added "concurrently" at the new path.
+    :param monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    moved_category = add_test_child_category(
+        first_test_root_category, 'moved category'
+    )
+    monkeypatch.setattr(
+        category_services, 'get_category_child_path',
+        lambda **kwargs: second_test_root_category.path
+    )
+
+    url = category_admin_move_node_url(category_slug=moved_category.slug)
+    response = api_client.post(path=url, data={'parent_node': None}, format='json')
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    moved_category.refresh_from_db()
+    assert moved_category.get_parent() == first_test_root_category
+    assert Category.find_problems() == ([], [], [], [], [])
@@ -0,0 +1,173 @@
+from typing import TYPE_CHECKING, Any, Optional, cast
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from src.djshop.catalog.apis.front.category import AsyncCategoryTreeAPIView
+from src.djshop.catalog.models import Category
+
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from django.test import Client
+    from django.test.client import _MonkeyPatchedASGIResponse
+    from rest_framework.test import APIClient
+
+
+pytestmark = pytest.mark.django_db
+
+
+CATEGORY_FRONT_LIST_URL = reverse('api:catalog:front-category-list')
+CATEGORY_FRONT_ASYNC_LIST_URL = reverse('api:catalog:front-category-list-async')
+
+
+def category_front_async_detail_url(category_slug: str) -> str:
+
+    """
+    Generate the URL for the async category front detail API endpoint.
+
+    :param category_slug: The slug of the category.
+    :return: The URL for the async category front 'detail API' endpoint.
+    """
+
+    return reverse(
+        viewname='api:catalog:front-category-node-async', args=[category_slug]
+    )
+
+
+@async_to_sync
+async def async_client_get(
+    path: str, **kwargs: Any
+) -> '_MonkeyPatchedASGIResponse':
+
+    """
+    Send a GET request through the ASGI handler, as an ASGI server would.
+
+    :param path: The requested path.
+    :param kwargs: The extra arguments of the request.
+    :return: The response object.
+    """
+
+    return await AsyncClient().get(path, **kwargs)
+
+
+def test_get_front_category_tree_async_api_return_success(
+    api_client: 'APIClient', five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that the async category list, served through the ASGI handler,
+    returns the same page, ETag and caching headers as the sync one.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    assert AsyncCategoryTreeAPIView.view_is_async
+
+    sync_response = api_client.get(
+        path=CATEGORY_FRONT_LIST_URL, data={'limit': 2, 'offset': 1}
+    )
+    async_response = async_client_get(
+        path=CATEGORY_FRONT_ASYNC_LIST_URL, data={'limit': 2, 'offset': 1}
+    )
+
+    assert async_response.status_code == status.HTTP_200_OK
+    assert async_response['Content-Type'] == 'application/json'
+
+    async_data = async_response.json()
+    sync_data = sync_response.json()
+    assert async_data['results'] == sync_data['results']
+    assert async_data['count'] == sync_data['count'] == 5
+    assert async_data['next'].endswith('/async/categories/?limit=2&offset=3')
+
+    assert async_response['Cache-Control'] == sync_response['Cache-Control']
+    assert async_response['Surrogate-Key'] == sync_response['Surrogate-Key']
+    assert async_response['ETag'] != sync_response['ETag']
+
+
+def test_get_front_category_tree_async_with_cached_page_return_success(
+    client: 'Client', five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that a rendered page of the async category list is cached by ETag,
+    so it is served again after the version aggregate query only, that a
+    fresh ETag returns `304 Not Modified`, and that a changed category
+    changes the page.
+
+    :param client: The Django test client.
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    cache.clear()
+
+    response = client.get(path=CATEGORY_FRONT_ASYNC_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        cached_response = client.get(path=CATEGORY_FRONT_ASYNC_LIST_URL)
+
+    assert len(captured_queries) == 1
+    assert cached_response.content == response.content
+    assert cached_response['Surrogate-Key'] == response['Surrogate-Key']
+
+    not_modified_response = client.get(
+        path=CATEGORY_FRONT_ASYNC_LIST_URL, HTTP_IF_NONE_MATCH=response['ETag']
+    )
+    assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified_response.content == b''
+
+    first_category = cast(
+        Optional[Category], Category.objects.order_by('path').first()
+    )
+    assert first_category is not None
+    first_category.title = 'updated test category title'
+    first_category.save()
+
+    updated_response = client.get(path=CATEGORY_FRONT_ASYNC_LIST_URL)
+    assert updated_response['ETag'] != response['ETag']
+    assert updated_response.json()['results'][0]['title'] == \
+        'updated test category title'
+
+
+def test_get_front_category_node_async_api_return_success(
+    api_client: 'APIClient', first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that the async category node returns the same representation
+    as the sync one, and that a missing category returns the same
+    `404 Not Found` error.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param first_test_root_category: A fixture providing the first test
+                                    root category object.
+    """
+
+    sync_response = api_client.get(path=reverse(
+        viewname='api:catalog:front-category-node',
+        args=[first_test_root_category.slug]
+    ))
+    async_response = async_client_get(
+        path=category_front_async_detail_url(first_test_root_category.slug)
+    )
+
+    assert async_response.status_code == status.HTTP_200_OK
+    assert async_response.json() == sync_response.json()
+    assert async_response['Surrogate-Key'] == sync_response['Surrogate-Key']
+
+    not_found_response = async_client_get(
+        path=category_front_async_detail_url('missing-category')
+    )
+
+    assert not_found_response.status_code == status.HTTP_404_NOT_FOUND
+    assert not_found_response.json()['message'].startswith('Not Found')
@@ -0,0 +1,146 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from rest_framework.test import APIClient
+
+    from src.djshop.catalog.models import Category
+
+
+pytestmark = pytest.mark.django_db
+
+
+CATEGORY_FRONT_LIST_URL = reverse('api:catalog:front-category-list')
+
+
+def category_front_detail_url(category_slug: str) -> str:
+
+    """
+    Generate the URL for the category front detail API endpoint.
+
+    :param category_slug: The slug of the category.
+    :return: The URL for the category front 'detail API' endpoint.
+    """
+
+    return reverse(viewname='api:catalog:front-category-node', args=[category_slug])
+
+
+def test_get_front_category_tree_with_fresh_etag_return_not_modified(
+    api_client: 'APIClient', five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that requesting the category list with a fresh ETag returns
+    `304 Not Modified` with a single query and an empty body.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    response = api_client.get(path=CATEGORY_FRONT_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.has_header('ETag')
+    # A collection is validated with its ETag only.
+    assert not response.has_header('Last-Modified')
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        response = api_client.get(
+            path=CATEGORY_FRONT_LIST_URL, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b''
+    assert len(captured_queries) == 1
+
+
+def test_get_front_category_tree_with_stale_etag_return_success(
+    api_client: 'APIClient', five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that the ETag of the category list changes when a category changes,
+    when a category is hidden or deleted, and between pages of the list.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    response = api_client.get(path=CATEGORY_FRONT_LIST_URL)
+    first_etag = response['ETag']
+
+    paginated_response = api_client.get(
+        path=CATEGORY_FRONT_LIST_URL, data={'limit': 2, 'offset': 2},
+        HTTP_IF_NONE_MATCH=first_etag
+    )
+    assert paginated_response.status_code == status.HTTP_200_OK
+
+    first_test_category = five_test_root_categories[0]
+    first_test_category.title = 'updated test category title'
+    first_test_category.save()
+
+    response = api_client.get(
+        path=CATEGORY_FRONT_LIST_URL, HTTP_IF_NONE_MATCH=first_etag
+    )
+    assert response.status_code == status.HTTP_200_OK
+    second_etag = response['ETag']
+    assert second_etag != first_etag
+
+    second_test_category = five_test_root_categories[1]
+    second_test_category.is_public = False
+    second_test_category.save()
+
+    response = api_client.get(
+        path=CATEGORY_FRONT_LIST_URL, HTTP_IF_NONE_MATCH=second_etag
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == 4
+    third_etag = response['ETag']
+
+    # The deleted category isn't the latest modified one.
+    five_test_root_categories[2].delete()
+
+    response = api_client.get(
+        path=CATEGORY_FRONT_LIST_URL, HTTP_IF_NONE_MATCH=third_etag,
+        HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT'
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == 3
+
+
+def test_get_front_category_node_with_fresh_etag_return_not_modified(
+    api_client: 'APIClient', first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that requesting a category node with a fresh ETag returns
+    `304 Not Modified`, and a fresh response once the category changes.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param first_test_root_category: A fixture providing the first test
+                                    root category object.
+    """
+
+    url = category_front_detail_url(category_slug=first_test_root_category.slug)
+
+    response = api_client.get(path=url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response['ETag']
+
+    response = api_client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    first_test_root_category.description = 'updated test category description'
+    first_test_root_category.save()
+
+    response = api_client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['description'] == 'updated test category description'
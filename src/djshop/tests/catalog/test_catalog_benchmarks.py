@@ -0,0 +1,86 @@
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from src.djshop.catalog.benchmarks.generator import CatalogShape, generate_catalog
+from src.djshop.catalog.benchmarks.scenarios import SCENARIOS
+from src.djshop.catalog.models import (
+    AttributeValue, Category, Image as ProductImage, Product,
+)
+
+
+pytestmark = pytest.mark.django_db
+
+
+TEST_CATALOG_SHAPE = CatalogShape(
+    categories=25, root_categories=3, category_branching=4, product_classes=2,
+    attributes_per_class=6, products=30, attribute_values_per_product=4,
+    image_products=2, images_per_product=3, batch_size=7
+)
+
+
+def test_generate_catalog_return_success(
+    first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that the generator creates a catalog of the requested shape,
+    with a valid category tree next to the existing categories.
+
+    :param first_test_root_category: A fixture providing the first test
+                                    root category object.
+    """
+
+    dataset = generate_catalog(shape=TEST_CATALOG_SHAPE)
+
+    assert len(dataset.category_ids) == 25
+    assert Category.get_root_nodes().count() == 4
+    assert Category.find_problems() == ([], [], [], [], [])
+    first_generated_root = Category.objects.get(pk=dataset.category_ids[0])
+    assert first_generated_root.get_children_count() == 4
+
+    assert Product.objects.filter(pk__in=dataset.product_ids).count() == 30
+    assert AttributeValue.objects.count() == 30 * 4
+    assert ProductImage.objects.filter(
+        product_id__in=dataset.image_product_ids
+    ).count() == 2 * 3
+
+
+def test_benchmark_catalog_command_return_success(tmp_path: Path) -> None:
+
+    """
+    Test that the benchmark command runs every scenario, writes the results
+    as JSON, compares them with a baseline and rolls the synthetic catalog
+    back.
+
+    :param tmp_path: A fixture providing a temporary directory.
+    """
+
+    output_path = tmp_path / 'results.json'
+    shape_options = TEST_CATALOG_SHAPE._asdict()
+
+    call_command(
+        'benchmark_catalog', repeat=2, output=output_path, force=True,
+        stdout=StringIO(), **shape_options
+    )
+
+    results = json.loads(output_path.read_text())
+    assert set(results['scenarios']) == set(SCENARIOS)
+    assert results['shape']['products'] == 30
+    assert Product.objects.count() == 0
+
+    baseline = {'scenarios': {
+        name: {**result, 'median': result['median'] / 100}
+        for name, result in results['scenarios'].items()
+    }}
+    baseline_path = tmp_path / 'baseline.json'
+    baseline_path.write_text(json.dumps(baseline))
+
+    with pytest.raises(CommandError, match='Regressed scenarios'):
+        call_command(
+            'benchmark_catalog', repeat=2, baseline=baseline_path, force=True,
+            scenario=['category_tree_front'], stdout=StringIO(), **shape_options
+        )
@@ -0,0 +1,155 @@
+from typing import TYPE_CHECKING, Any, Dict, Generator
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from src.djshop.catalog.services.category import (
+    create_category_node, delete_category_node, update_category_node,
+)
+from src.djshop.cdn.backends import LocalPurgeBackend
+
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from rest_framework.test import APIClient
+
+    from src.djshop.catalog.models import Category
+
+
+pytestmark = pytest.mark.django_db
+
+
+CATEGORY_FRONT_LIST_URL = reverse('api:catalog:front-category-list')
+
+
+@pytest.fixture(autouse=True)
+def local_purge_backend() -> Generator[None, None, None]:
+
+    """
+    Fixture which clears the surrogate keys recorded by the local
+    purge backend before and after each test.
+    """
+
+    LocalPurgeBackend.reset()
+    yield
+    LocalPurgeBackend.reset()
+
+
+def test_get_front_category_tree_cache_headers_return_success(
+    api_client: 'APIClient', five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that the front category list is cacheable by shared caches
+    and tagged with the surrogate keys of the listed categories.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    response = api_client.get(path=CATEGORY_FRONT_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    cache_control = response['Cache-Control']
+    assert 'public' in cache_control
+    assert 'max-age=60' in cache_control
+    assert 's-maxage=600' in cache_control
+    assert 'stale-while-revalidate=60' in cache_control
+
+    surrogate_keys = response['Surrogate-Key'].split()
+    assert 'category:list' in surrogate_keys
+    for test_category in five_test_root_categories:
+        assert f'category:{test_category.pk}' in surrogate_keys
+
+
+def test_get_front_category_node_cache_headers_return_success(
+    api_client: 'APIClient', first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that a front category node is tagged with its surrogate key,
+    and that error responses are not cacheable.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param first_test_root_category: A fixture providing the first test
+                                    root category object.
+    """
+
+    url = reverse(
+        viewname='api:catalog:front-category-node',
+        args=[first_test_root_category.slug]
+    )
+    response = api_client.get(path=url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Surrogate-Key'] == f'category:{first_test_root_category.pk}'
+
+    url = reverse(
+        viewname='api:catalog:front-category-node', args=['nonexistent-slug']
+    )
+    response = api_client.get(path=url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert not response.has_header('Surrogate-Key')
+
+
+def test_category_services_purge_surrogate_keys_on_commit_return_success(
+    django_capture_on_commit_callbacks: Any,
+    first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that the category services purge the affected surrogate keys
+    only once the transaction is committed.
+
+    :param django_capture_on_commit_callbacks: pytest-django fixture
+        capturing the `transaction.on_commit` callbacks.
+    :param first_test_root_category: A fixture providing the first test
+                                    root category object.
+    """
+
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        update_category_node(
+            category_slug=first_test_root_category.slug,
+            category_node_data={'title': 'updated test category title'}
+        )
+
+    assert len(callbacks) == 1
+    assert LocalPurgeBackend.purged_keys == []
+
+
+def test_category_services_purge_surrogate_keys_after_commit_return_success(
+    django_capture_on_commit_callbacks: Any,
+    first_test_root_category: 'Category',
+    first_test_category_payload: Dict[str, Any]
+) -> None:
+
+    """
+    Test that the category services purge the affected surrogate keys
+    once the transaction is committed.
+
+    :param django_capture_on_commit_callbacks: pytest-django fixture
+        capturing the `transaction.on_commit` callbacks.
+    :param first_test_root_category: A fixture providing the first test
+                                    root category object.
+    :param first_test_category_payload: Payload for creating the first
+                                    test child category.
+    """
+
+    with django_capture_on_commit_callbacks(execute=True):
+        child_category = create_category_node(category_node_data={
+            **first_test_category_payload,
+            'parent_node': first_test_root_category.slug
+        })
+
+    assert LocalPurgeBackend.purged_keys == ['category:list']
+    LocalPurgeBackend.reset()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        delete_category_node(category_slug=first_test_root_category.slug)
+
+    assert sorted(LocalPurgeBackend.purged_keys) == sorted([
+        'category:list',
+        f'category:{first_test_root_category.pk}',
+        f'category:{child_category.pk}',
+    ])
@@ -1,6 +1,7 @@
 """
 Test custom Django management commands.
 """
+from io import StringIO
 from unittest.mock import MagicMock, patch
 
 from django.core.management import call_command
@@ -56,3 +57,25 @@ class TestWaitForDBCommand:
 
         assert patched_check.call_count == 6
         patched_check.assert_called_with(databases=['default'])
+
+    def test_wait_for_db_command_with_stats(
+            self, patched_check: MagicMock
+    ) -> None:
+
+        """
+        Test that the wait_for_db command prints the connection settings
+        of the default database when the `--stats` option is given.
+
+        :param patched_check: Mocked check function
+        :return: None
+        """
+
+        patched_check.return_value = True
+        stdout = StringIO()
+        call_command('wait_for_db', '--stats', stdout=stdout)
+
+        command_output = stdout.getvalue()
+        assert 'alias: default' in command_output
+        assert 'conn_max_age: ' in command_output
+        assert 'conn_health_checks: ' in command_output
+        assert 'server_side_cursors: ' in command_output
@@ -0,0 +1,161 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, cast
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.djshop.catalog.models import Category
+from src.djshop.common.services import model_bulk_update, model_update
+from src.djshop.core.exceptions import ConcurrentUpdateError
+
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_model_bulk_update_groups_changed_fields_return_success(
+    five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that the bulk update saves the changed instances with one `UPDATE`
+    per set of changed fields, skips the unchanged instances, and increments
+    the versions of the updated rows only.
+
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    categories = cast(List[Category], list(Category.objects.order_by('path')))
+    updates: List[Tuple[Category, Dict[str, Any]]] = [
+        (categories[0], {'title': 'first updated title'}),
+        (categories[1], {'title': 'second updated title'}),
+        (categories[2], {'is_public': False}),
+        (categories[3], {'is_public': False, 'slug': 'not-updatable-slug'}),
+        (categories[4], {'title': categories[4].title}),
+    ]
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        updated_categories = model_bulk_update(
+            updates=updates, fields=['title', 'description', 'is_public']
+        )
+
+    update_queries = [
+        query['sql'] for query in captured_queries
+        if query['sql'].startswith('UPDATE')
+    ]
+    assert len(update_queries) == 2
+    assert updated_categories == categories[:4]
+
+    categories_after_update = cast(
+        List[Category], list(Category.objects.order_by('path'))
+    )
+    assert [
+        category.title for category in categories_after_update[:2]
+    ] == ['first updated title', 'second updated title']
+    assert [
+        category.is_public for category in categories_after_update[2:4]
+    ] == [False, False]
+    assert categories_after_update[3].slug == categories[3].slug
+    assert [category.version for category in categories_after_update] == [
+        2, 2, 2, 2, 1
+    ]
+    assert [category.version for category in categories] == [2, 2, 2, 2, 1]
+
+
+def test_model_bulk_update_with_stale_instance_return_error(
+    five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that the bulk update fails as a whole when one of the rows was
+    changed since its instance was read.
+
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    categories = cast(List[Category], list(Category.objects.order_by('path')))
+    descriptions = [category.description for category in categories]
+
+    model_update(
+        instance=Category.objects.get(pk=categories[2].pk),
+        fields=['description'], data={'description': 'concurrent description'}
+    )
+
+    with pytest.raises(ConcurrentUpdateError):
+        model_bulk_update(
+            updates=[
+                (category, {'description': 'bulk updated description'})
+                for category in categories
+            ],
+            fields=['description']
+        )
+
+    assert not Category.objects.filter(
+        description='bulk updated description'
+    ).exists()
+    # The instances are left as they were read.
+    assert [category.description for category in categories] == descriptions
+    assert [category.version for category in categories] == [1, 1, 1, 1, 1]
+
+
+def test_model_bulk_update_with_invalid_data_return_error(
+    five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that the bulk update validates the changed fields before running
+    any query.
+
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    categories = cast(List[Category], list(Category.objects.order_by('path')))
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        with pytest.raises(ValidationError):
+            model_bulk_update(
+                updates=[
+                    (categories[0], {'title': 'valid updated title'}),
+                    (categories[1], {'title': 'x' * 256}),
+                ],
+                fields=['title']
+            )
+
+    assert len(captured_queries) == 0
+    assert not Category.objects.filter(title='valid updated title').exists()
+
+
+def test_model_bulk_update_with_duplicate_instance_return_error(
+    five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that the bulk update rejects the updates of the same row made
+    through several instances, before running any query.
+
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    category = cast(Category, Category.objects.order_by('path').first())
+    duplicate_category = Category.objects.get(pk=category.pk)
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        with pytest.raises(ValueError):
+            model_bulk_update(
+                updates=[
+                    (category, {'title': 'first updated title'}),
+                    (duplicate_category, {'description': 'updated description'}),
+                ],
+                fields=['title', 'description']
+            )
+
+    assert len(captured_queries) == 0
+    assert category.title != 'first updated title'
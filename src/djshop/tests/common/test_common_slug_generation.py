@@ -0,0 +1,102 @@
+from typing import Any, List
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.djshop.catalog.models import Category, OptionGroup
+from src.djshop.common import slugs
+from src.djshop.common.slugs import assign_unique_slugs, generate_unique_slugs
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_generate_unique_slugs_with_duplicates_return_success(
+    first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that the slugs of a batch are disambiguated, against the existing
+    slugs and within the batch, with a single query.
+
+    :param first_test_root_category: A fixture providing the first test
+                                    root category object.
+    """
+
+    first_test_root_category.slug = 'test-category'
+    first_test_root_category.save()
+    Category.add_root(title='Test Category 2', slug='test-category-2')
+
+    with CaptureQueriesContext(connection) as captured_queries:
+        unique_slugs = generate_unique_slugs(
+            model=Category,
+            titles=['Test Category', 'test category!', 'Other Category', 'x' * 255]
+        )
+
+    assert len(captured_queries) == 1
+    assert unique_slugs[:3] == [
+        'test-category-3', 'test-category-4', 'other-category'
+    ]
+    assert len(unique_slugs[3]) <= (Category._meta.get_field('slug').max_length or 0)
+
+
+def test_generate_unique_slugs_with_unicode_titles_return_success() -> None:
+
+    """
+    Test that the non ASCII letters are kept in the slugs of the
+    `allow_unicode` slug fields only, and that the titles without any
+    ASCII letter fall back to the model name for the other fields.
+    """
+
+    assert generate_unique_slugs(
+        model=OptionGroup, titles=['رنگ بندی', 'رنگ بندی']
+    ) == ['رنگ-بندی', 'رنگ-بندی-2']
+
+    assert generate_unique_slugs(
+        model=Category, titles=['پوشاک', 'کفش']
+    ) == ['category', 'category-2']
+
+
+def test_save_with_colliding_slug_return_success() -> None:
+
+    """
+    Test that saving a category whose title slugifies to an existing slug
+    disambiguates the slug instead of failing, and that slugs are assigned
+    to the instances of a bulk create.
+    """
+
+    assert Category.add_root(title='Test Shoes').slug == 'test-shoes'
+    assert Category.add_root(title='TEST SHOES!').slug == 'test-shoes-2'
+
+    option_groups = [OptionGroup(title='Size'), OptionGroup(title='size')]
+    assign_unique_slugs(instances=option_groups)
+    OptionGroup.objects.bulk_create(option_groups)
+
+    assert list(
+        OptionGroup.objects.order_by('slug').values_list('slug', flat=True)
+    ) == ['size', 'size-2']
+
+
+def test_save_with_slug_taken_concurrently_return_success(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    """
+    Test that a save whose generated slug is taken by a concurrent save
+    before its insert is retried with the next suffix.
+
+    :param monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    Category.add_root(title='Test Shoes')
+    stale_slugs = [['test-shoes']]
+
+    def generate_stale_unique_slugs(**kwargs: Any) -> List[str]:
+        # The first slug is generated before the concurrent save committed.
+        return stale_slugs.pop() if stale_slugs else generate_unique_slugs(**kwargs)
+
+    monkeypatch.setattr(slugs, 'generate_unique_slugs', generate_stale_unique_slugs)
+
+    assert Category.add_root(title='Test Shoes!').slug == 'test-shoes-2'
+    assert not stale_slugs
@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+
+if TYPE_CHECKING:
+    from django.test import Client
+
+    from src.djshop.users.models import BaseUser
+
+
+pytestmark = pytest.mark.django_db
+
+
+ADMIN_DATABASE_CONNECTIONS_URL = reverse(viewname='admin-database-connections')
+
+
+def test_database_connections_admin_view_return_success(
+        client: 'Client', first_test_superuser: 'BaseUser'
+) -> None:
+
+    """
+    Test that the database connections admin page shows the connection
+    settings of the configured databases.
+
+    :param client: Django test client.
+    :param first_test_superuser: Superuser instance for authentication.
+    """
+
+    client.force_login(user=first_test_superuser)
+    response = client.get(path=ADMIN_DATABASE_CONNECTIONS_URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content = response.content.decode()
+    assert 'Database connections' in response_content
+    assert 'CONN_MAX_AGE' in response_content
+
+
+def test_database_connections_admin_view_anonymous_return_redirect(
+        client: 'Client'
+) -> None:
+
+    """
+    Test that the database connections admin page requires a staff user.
+
+    :param client: Django test client.
+    """
+
+    response = client.get(path=ADMIN_DATABASE_CONNECTIONS_URL)
+    assert response.status_code == status.HTTP_302_FOUND
@@ -0,0 +1,156 @@
+import time
+from typing import TYPE_CHECKING, Callable, List, cast
+from unittest.mock import patch
+
+import pytest
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from src.djshop.catalog.models import Category
+from src.djshop.catalog.selectors.front.category import get_category_tree
+from src.djshop.core.middleware import (
+    PRIMARY_PINNED_UNTIL_COOKIE, PRIMARY_PINNED_UNTIL_HEADER,
+    PrimaryStickinessMiddleware,
+)
+from src.djshop.utils.db.routers import get_read_database_alias, pin_primary
+
+
+if TYPE_CHECKING:
+    from rest_framework.test import APIClient
+
+
+CATEGORY_FRONT_LIST_URL = reverse('api:catalog:front-category-list')
+
+
+def get_read_alias_middleware() -> Callable[[HttpRequest], HttpResponse]:
+
+    """
+    Build the stickiness middleware around a view which writes the alias
+    the read-only selectors would use in the response body.
+    """
+
+    def read_alias_view(request: HttpRequest) -> HttpResponse:
+        return HttpResponse(content=get_read_database_alias())
+
+    # The view is sync, so the middleware returns its response directly.
+    return cast(
+        Callable[[HttpRequest], HttpResponse],
+        PrimaryStickinessMiddleware(get_response=read_alias_view)
+    )
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+def test_front_selectors_read_from_replica_return_success() -> None:
+
+    """
+    Test that front selectors read from the replica, unless the reads
+    are pinned to the primary.
+    """
+
+    assert get_category_tree().db == 'replica'
+
+    with pin_primary():
+        assert get_category_tree().db == 'default'
+
+
+def test_front_selectors_without_replica_read_from_primary_return_success() -> None:
+
+    """
+    Test that front selectors read from the primary when no replica
+    is configured.
+    """
+
+    assert get_category_tree().db == 'default'
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+def test_primary_stickiness_middleware_after_write_return_success() -> None:
+
+    """
+    Test that a write pins the following reads of the client to the primary,
+    either with the cookie or with the header, until the window is over.
+    """
+
+    middleware = get_read_alias_middleware()
+    request_factory = RequestFactory()
+
+    response = middleware(request_factory.get(path='/'))
+    assert response.content == b'replica'
+    assert PRIMARY_PINNED_UNTIL_COOKIE not in response.cookies
+
+    response = middleware(request_factory.post(path='/'))
+    assert PRIMARY_PINNED_UNTIL_COOKIE in response.cookies
+    pinned_until = response[PRIMARY_PINNED_UNTIL_HEADER]
+    assert int(pinned_until) > time.time()
+
+    cookie_request = request_factory.get(path='/')
+    cookie_request.COOKIES[PRIMARY_PINNED_UNTIL_COOKIE] = pinned_until
+    assert middleware(cookie_request).content == b'default'
+
+    header_request = request_factory.get(
+        path='/', HTTP_X_PRIMARY_PINNED_UNTIL=pinned_until
+    )
+    assert middleware(header_request).content == b'default'
+
+    expired_request = request_factory.get(
+        path='/', HTTP_X_PRIMARY_PINNED_UNTIL=str(int(time.time()) - 1)
+    )
+    assert middleware(expired_request).content == b'replica'
+
+    # The pin never leaks out of the request.
+    assert get_read_database_alias() == 'replica'
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+@pytest.mark.django_db(transaction=True, databases=['default', 'replica'])
+def test_get_front_category_tree_from_replica_return_success(
+    api_client: 'APIClient'
+) -> None:
+
+    """
+    Test that the front category list is served from the replica alias,
+    and that categories are always written to the primary.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    """
+
+    category_titles: List[str] = []
+    for title in ('first replica category', 'second replica category'):
+        category = Category.add_root(title=title, description=title)
+        assert category._state.db == 'default'
+        category_titles.append(category.title)
+
+    response = api_client.get(path=CATEGORY_FRONT_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    assert [
+        category['title'] for category in response.data['results']
+    ] == category_titles
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_get_front_category_tree_picks_one_alias_return_success(
+    api_client: 'APIClient'
+) -> None:
+
+    """
+    Test that the front category list picks the read alias once, so its
+    version and its page are read from the same database.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    """
+
+    with patch(
+        'src.djshop.catalog.apis.front.category.get_read_database_alias',
+        return_value='default'
+    ) as view_alias_mock, patch(
+        'src.djshop.catalog.selectors.front.category.get_read_database_alias'
+    ) as selector_alias_mock:
+        response = api_client.get(path=CATEGORY_FRONT_LIST_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    view_alias_mock.assert_called_once_with()
+    selector_alias_mock.assert_not_called()
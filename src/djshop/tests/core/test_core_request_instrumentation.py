@@ -0,0 +1,112 @@
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from src.djshop.catalog.apis.front.category import CategoryTreeAPIView
+from src.djshop.core.exceptions import QueryBudgetExceeded
+from src.djshop.core.instrumentation import get_query_fingerprint
+
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from rest_framework.test import APIClient
+
+    from src.djshop.catalog.models import Category
+
+
+pytestmark = pytest.mark.django_db
+
+
+CATEGORY_FRONT_LIST_URL = reverse('api:catalog:front-category-list')
+
+
+def test_query_fingerprint_normalization_return_success() -> None:
+
+    """
+    Test that queries differing only by whitespace or by the length of their
+    `IN` lists share the same fingerprint.
+    """
+
+    first_fingerprint = get_query_fingerprint(
+        'SELECT *  FROM "catalog_category"\n WHERE "id" IN (%s, %s, %s)'
+    )
+    second_fingerprint = get_query_fingerprint(
+        'SELECT * FROM "catalog_category" WHERE "id" IN (%s)'
+    )
+
+    assert first_fingerprint == second_fingerprint
+    assert first_fingerprint == (
+        'SELECT * FROM "catalog_category" WHERE "id" IN (...)'
+    )
+
+
+@pytest.mark.usefixtures('five_test_root_categories')
+def test_get_front_category_tree_server_timing_return_success(
+    api_client: 'APIClient'
+) -> None:
+
+    """
+    Test that the response carries the query count, the SQL time and
+    the serializer time in the `Server-Timing` header.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    """
+
+    response = api_client.get(path=CATEGORY_FRONT_LIST_URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    server_timing = response['Server-Timing']
+    assert 'db;dur=' in server_timing
+    assert 'desc="3 queries"' in server_timing
+    assert 'serializer;dur=' in server_timing
+    assert 'total;dur=' in server_timing
+
+
+def test_get_front_category_tree_over_query_budget_return_error(
+    api_client: 'APIClient', five_test_root_categories: 'QuerySet[Category]',
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    """
+    Test that exceeding the query budget of a view fails in strict mode.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    :param monkeypatch: Pytest fixture for patching the view budget.
+    """
+
+    monkeypatch.setattr(CategoryTreeAPIView, 'query_budget', 1)
+
+    with pytest.raises(QueryBudgetExceeded, match='3 queries'):
+        api_client.get(path=CATEGORY_FRONT_LIST_URL)
+
+
+@override_settings(QUERY_BUDGET_STRICT=False)
+def test_get_front_category_tree_over_query_budget_return_warning(
+    api_client: 'APIClient', five_test_root_categories: 'QuerySet[Category]',
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+
+    """
+    Test that exceeding the query budget of a view only logs a warning
+    outside strict mode.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    :param monkeypatch: Pytest fixture for patching the view budget.
+    :param caplog: Pytest fixture capturing the log records.
+    """
+
+    monkeypatch.setattr(CategoryTreeAPIView, 'query_budget', 1)
+
+    with caplog.at_level(logging.WARNING):
+        response = api_client.get(path=CATEGORY_FRONT_LIST_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'CategoryTreeAPIView exceeded its query budget' in caplog.text
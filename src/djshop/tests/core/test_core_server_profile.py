@@ -0,0 +1,82 @@
+import os
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from django.urls import clear_url_caches, get_resolver
+
+from src.config import gunicorn
+from src.djshop.core.warmup import warm_up
+
+
+def test_get_worker_count_return_success() -> None:
+
+    """
+    Test that the workers are sized from the CPUs, unless they don't fit
+    in memory, and that there is always at least one worker.
+    """
+
+    worker_memory_bytes = 256 * 2**20
+
+    assert gunicorn.get_worker_count(
+        cpu_count=2, memory_bytes=8 * 2**30, worker_memory_bytes=worker_memory_bytes
+    ) == 5
+    assert gunicorn.get_worker_count(
+        cpu_count=8, memory_bytes=2**30, worker_memory_bytes=worker_memory_bytes
+    ) == 4
+    assert gunicorn.get_worker_count(
+        cpu_count=1, memory_bytes=2**20, worker_memory_bytes=worker_memory_bytes
+    ) == 1
+
+    assert gunicorn.get_thread_count(
+        cpu_count=8, workers=4, concurrency_per_cpu=4
+    ) == 8
+    assert gunicorn.get_thread_count(
+        cpu_count=2, workers=5, concurrency_per_cpu=1
+    ) == 1
+
+
+def test_get_cpu_count_with_cgroup_quota_return_success(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    """
+    Test that the CPU count is capped by the CPU quota of the cgroup,
+    and that the memory is capped by its memory limit.
+
+    :param tmp_path: A fixture providing a temporary directory.
+    :param monkeypatch: A fixture to patch the cgroup root.
+    """
+
+    monkeypatch.setattr(gunicorn, 'CGROUP_ROOT', tmp_path)
+    monkeypatch.setattr(os, 'sched_getaffinity', lambda pid: set(range(8)))
+
+    assert gunicorn.get_cpu_count() == 8
+
+    (tmp_path / 'cpu.max').write_text('150000 100000\n')
+    (tmp_path / 'memory.max').write_text(f'{2**20}\n')
+
+    assert gunicorn.get_cpu_count() == 2
+    assert gunicorn.get_memory_bytes() == 2**20
+
+    (tmp_path / 'cpu.max').write_text('max 100000\n')
+    (tmp_path / 'memory.max').write_text('max\n')
+
+    assert gunicorn.get_cpu_count() == 8
+    assert gunicorn.get_memory_bytes() > 2**20
+
+
+def test_warm_up_return_success() -> None:
+
+    """
+    Test that the warm-up populates the URL resolvers, so the first
+    request doesn't.
+    """
+
+    clear_url_caches()
+    # `_populated` is private, the stubs don't declare it.
+    assert not cast(Any, get_resolver())._populated
+
+    warm_up()
+
+    assert cast(Any, get_resolver())._populated
@@ -0,0 +1,49 @@
+from django.test import Client
+from django.urls import reverse
+
+from src.djshop.core.startup import get_package_import_times, parse_import_times
+
+
+IMPORT_TIME_OUTPUT = '''\
+import time: self [us] | cumulative | imported package
+import time:       150 |        150 |     django.utils.version
+import time:      1200 |       1350 |   django
+import time:       300 |        300 |   rest_framework.settings
+import time:       500 |       2150 | rest_framework
+Traceback line, not an import time
+'''
+
+
+def test_parse_import_times_return_success() -> None:
+
+    """
+    Test that the `python -X importtime` report is parsed into the import
+    times of the modules, in milliseconds, and summed per package.
+    """
+
+    imports = parse_import_times(IMPORT_TIME_OUTPUT)
+
+    assert [import_timing.module for import_timing in imports] == [
+        'django.utils.version', 'django', 'rest_framework.settings', 'rest_framework'
+    ]
+    assert [import_timing.depth for import_timing in imports] == [2, 1, 1, 0]
+    assert imports[1].self_time == 1.2
+    assert imports[-1].cumulative_time == 2.15
+
+    assert get_package_import_times(imports) == {
+        'django': 1.35, 'rest_framework': 0.8
+    }
+
+
+def test_lazy_redoc_view_return_success(api_client: Client) -> None:
+
+    """
+    Test that the Redoc view, imported on its first request, is served.
+
+    :param api_client: An instance of the Django REST Framework's test client.
+    """
+
+    response = api_client.get(reverse('redoc'))
+
+    assert response.status_code == 200
+    assert reverse('schema').encode() in response.content
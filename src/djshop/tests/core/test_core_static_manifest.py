@@ -0,0 +1,88 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+
+from src.djshop.core.checks import check_static_manifest
+from src.djshop.core.warmup import warm_up
+
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.fixture
+def manifest_static_root(tmp_path: Path, settings: 'SettingsWrapper') -> Path:
+
+    """
+    Use the production static files storage, with an empty `STATIC_ROOT`.
+
+    :param tmp_path: A fixture providing a temporary directory.
+    :param settings: A fixture to override the Django settings.
+    :return: Path: The temporary `STATIC_ROOT`.
+    """
+
+    settings.STATIC_ROOT = str(tmp_path)
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'staticfiles': {
+            'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+        },
+    }
+
+    return tmp_path
+
+
+def test_check_static_manifest_return_success(manifest_static_root: Path) -> None:
+
+    """
+    Test that the system check reports a missing static files manifest,
+    and that the web processes don't start without it.
+
+    :param manifest_static_root: A fixture providing an empty `STATIC_ROOT`
+        of the production static files storage.
+    """
+
+    errors = check_static_manifest(None)
+
+    assert [error.id for error in errors] == ['core.E001']
+
+    with pytest.raises(ImproperlyConfigured):
+        warm_up()
+
+    (manifest_static_root / 'staticfiles.json').write_text(
+        '{"paths": {}, "version": "1.1", "hash": ""}'
+    )
+
+    assert check_static_manifest(None) == []
+
+
+def test_check_static_manifest_is_deployment_check_return_success(
+    manifest_static_root: Path
+) -> None:
+
+    """
+    Test that a missing static files manifest is only reported by the
+    deployment checks, so the workers and the management commands like
+    `migrate` run without the static files.
+
+    :param manifest_static_root: A fixture providing an empty `STATIC_ROOT`
+        of the production static files storage.
+    """
+
+    errors = checks.run_checks(include_deployment_checks=False)
+    deployment_errors = checks.run_checks(include_deployment_checks=True)
+
+    assert 'core.E001' not in [error.id for error in errors]
+    assert 'core.E001' in [error.id for error in deployment_errors]
+
+
+def test_check_static_manifest_without_manifest_storage_return_success() -> None:
+
+    """
+    Test that the system check ignores the storages without a manifest.
+    """
+
+    assert check_static_manifest(None) == []
@@ -0,0 +1,102 @@
+from typing import TYPE_CHECKING, Any, Generator
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+
+from src.djshop.cdn.backends import LocalPurgeBackend
+from src.djshop.cdn.services import purge_surrogate_keys
+from src.djshop.cdn.tasks import purge_surrogate_keys_task
+from src.djshop.utils.tasks import get_batches
+
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def local_purge_backend() -> Generator[None, None, None]:
+
+    """
+    Fixture which clears the surrogate keys recorded by the local
+    purge backend before and after each test.
+    """
+
+    LocalPurgeBackend.reset()
+    yield
+    LocalPurgeBackend.reset()
+
+
+def test_get_batches_return_success() -> None:
+
+    """
+    Test that the identifiers are deduplicated, sorted and split into
+    batches.
+    """
+
+    assert get_batches(identifiers=[3, 1, 2, 3, 5, 4], batch_size=2) == [
+        [1, 2], [3, 4], [5]
+    ]
+    assert get_batches(identifiers=[], batch_size=2) == []
+
+
+def test_enqueue_on_commit_coalesces_transaction_return_success(
+    django_capture_on_commit_callbacks: Any, settings: 'SettingsWrapper'
+) -> None:
+
+    """
+    Test that the identifiers enqueued for a task during a transaction are
+    sent in batched messages once it commits, and that the ones enqueued in
+    a rolled back savepoint aren't sent.
+
+    :param django_capture_on_commit_callbacks: pytest-django fixture
+        capturing the `transaction.on_commit` callbacks.
+    :param settings: A fixture to override the Django settings.
+    """
+
+    settings.CELERY_TASK_BATCH_SIZE = 2
+
+    with patch.object(
+        purge_surrogate_keys_task, 'apply_async',
+        wraps=purge_surrogate_keys_task.apply_async
+    ) as apply_async:
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    purge_surrogate_keys(surrogate_keys=['category:9'])
+                    raise ValueError
+            except ValueError:
+                pass
+
+            purge_surrogate_keys(surrogate_keys=['category:1', 'category:list'])
+            purge_surrogate_keys(surrogate_keys=['category:2', 'category:1'])
+
+            assert LocalPurgeBackend.purged_keys == []
+
+    assert len(callbacks) == 1
+    assert apply_async.call_count == 2
+    assert LocalPurgeBackend.purged_keys == [
+        'category:1', 'category:2', 'category:list'
+    ]
+
+
+def test_idempotent_task_runs_message_once_return_success() -> None:
+
+    """
+    Test that a message delivered twice only runs once, and that the
+    messages without an idempotency key always run.
+    """
+
+    for _ in range(2):
+        purge_surrogate_keys_task.apply(
+            args=(['category:list'],), kwargs={'idempotency_key': 'purge-1'}
+        )
+
+    assert LocalPurgeBackend.purged_keys == ['category:list']
+
+    purge_surrogate_keys_task.apply(args=(['category:list'],))
+
+    assert LocalPurgeBackend.purged_keys == ['category:list', 'category:list']
@@ -0,0 +1,84 @@
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from celery import states
+from django.utils import timezone
+from django_celery_results.models import GroupResult, TaskResult
+from prometheus_client import REGISTRY
+
+from src.djshop.core.tasks import delete_expired_task_results_task
+
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_tasks_ignore_results_by_default_return_success(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    """
+    Test that a task declared without `ignore_result` doesn't store its
+    result in the result backend, and that running it records its query
+    count.
+
+    :param monkeypatch: A fixture to store the results of the eager tasks,
+        as a worker does.
+    """
+
+    assert delete_expired_task_results_task.ignore_result is True
+
+    monkeypatch.setattr(delete_expired_task_results_task, 'store_eager_result', True)
+
+    labels = {'task': delete_expired_task_results_task.name}
+    task_count = REGISTRY.get_sample_value(
+        'djshop_db_queries_per_task_count', labels
+    ) or 0
+
+    result = delete_expired_task_results_task.delay()
+
+    assert REGISTRY.get_sample_value(
+        'djshop_db_queries_per_task_count', labels
+    ) == task_count + 1
+    assert (REGISTRY.get_sample_value(
+        'djshop_db_queries_per_task_sum', labels
+    ) or 0) >= 2
+    assert result.successful()
+    assert delete_expired_task_results_task.backend.get_state(result.id) == \
+        states.PENDING
+
+
+def test_delete_expired_task_results_return_success(
+    settings: 'SettingsWrapper'
+) -> None:
+
+    """
+    Test that the task and group results stored for longer than
+    `CELERY_RESULT_EXPIRES` are deleted in batches, and the recent ones
+    are kept.
+
+    :param settings: A fixture to override the Django settings.
+    """
+
+    settings.CELERY_RESULT_EXPIRES = 60
+    settings.CELERY_RESULT_PURGE_BATCH_SIZE = 2
+
+    for index in range(5):
+        TaskResult.objects.create(task_id=f'test-expired-task-{index}')
+    GroupResult.objects.create(group_id='test-expired-group')
+
+    TaskResult.objects.update(date_done=timezone.now() - timedelta(seconds=120))
+    GroupResult.objects.update(date_done=timezone.now() - timedelta(seconds=120))
+
+    recent_result = TaskResult.objects.create(task_id='test-recent-task')
+
+    delete_expired_task_results_task.delay()
+
+    assert list(TaskResult.objects.values_list('pk', flat=True)) == [
+        recent_result.pk
+    ]
+    assert not GroupResult.objects.exists()
@@ -0,0 +1,51 @@
+from pathlib import Path
+from typing import cast
+
+import pytest
+from django.apps import apps
+from django.db import connection, connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+from src.djshop.tests.databases import get_migrations_fingerprint
+
+
+pytestmark = pytest.mark.django_db(databases=['default', 'replica'])
+
+
+def test_test_database_is_in_memory_template_copy() -> None:
+
+    """
+    Test that the test database is a private in-memory copy of the migrated
+    template, shared by the replica alias.
+    """
+
+    assert cast(DatabaseWrapper, connection).is_in_memory_db()
+    assert connections['replica'].settings_dict['NAME'] == \
+        connection.settings_dict['NAME']
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT COUNT(*) FROM django_migrations')
+        assert cursor.fetchone()[0] > 0
+
+
+def test_migrations_fingerprint_changes_with_migrations(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    """
+    Test that the migrations fingerprint is stable, and changes when
+    a migration file changes.
+
+    :param tmp_path: A fixture providing a temporary directory.
+    :param monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    fingerprint = get_migrations_fingerprint()
+    assert get_migrations_fingerprint() == fingerprint
+
+    app_config = apps.get_app_config('catalog')
+    (tmp_path / 'migrations').mkdir()
+    (tmp_path / 'migrations' / '0001_initial.py').write_text('operations = []')
+    monkeypatch.setattr(app_config, 'path', str(tmp_path))
+
+    assert get_migrations_fingerprint() != fingerprint
@@ -0,0 +1,291 @@
+"""
+Template test databases, shared by the pytest-xdist workers.
+
+The test databases are migrated once, into a template database, and every
+worker gets its own copy of the template instead of running the migrations
+again:
+
+- SQLite: the template is a file in the pytest cache, copied into a private
+  in-memory database of the worker with the SQLite backup API.
+- PostgreSQL: the template is a database, cloned for each worker with
+  `CREATE DATABASE ... TEMPLATE`.
+
+The template name includes a fingerprint of the migration files, so it is
+rebuilt when a migration changes, and reused by the next test runs otherwise.
+"""
+
+import fcntl
+import hashlib
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator, List, Tuple
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.base.creation import TEST_DATABASE_PREFIX
+from django.test.utils import get_unique_databases_and_mirrors
+
+
+# (connection, original database name, whether to destroy the database),
+# the format expected by `django.test.utils.teardown_databases`.
+DatabasesConfig = List[Tuple[BaseDatabaseWrapper, str, bool]]
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Generator[None, None, None]:
+
+    """
+    Hold an exclusive lock on a file, shared by the processes of the test run.
+
+    :param lock_path: The path of the lock file.
+    """
+
+    with open(lock_path, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def get_migrations_fingerprint() -> str:
+
+    """
+    Hash the migration files of the installed apps and the Django version.
+
+    :return: str: The fingerprint of the database schema.
+    """
+
+    hasher = hashlib.sha1(django.get_version().encode())
+
+    for app_config in apps.get_app_configs():
+        for migration_path in sorted(Path(app_config.path).glob('migrations/*.py')):
+            hasher.update(migration_path.name.encode())
+            hasher.update(migration_path.read_bytes())
+
+    return hasher.hexdigest()[:12]
+
+
+def set_database_name(*, connection: BaseDatabaseWrapper, name: str) -> None:
+
+    """
+    Point a connection, and the settings, to another database.
+
+    :param connection: The database connection.
+    :param name: The name of the database.
+    """
+
+    connection.close()
+    connection.settings_dict['NAME'] = name
+    settings.DATABASES[connection.alias]['NAME'] = name
+
+
+def build_template_database(
+    *, connection: BaseDatabaseWrapper, template_name: str, verbosity: int
+) -> None:
+
+    """
+    Create and migrate a template database, with Django's test database
+    creation.
+
+    :param connection: The database connection.
+    :param template_name: The name (or the SQLite path) of the template.
+    :param verbosity: The verbosity of the migrations.
+    """
+
+    test_settings = connection.settings_dict['TEST']
+    original_name = connection.settings_dict['NAME']
+    original_test_name = test_settings.get('NAME')
+
+    test_settings['NAME'] = template_name
+
+    try:
+        connection.creation.create_test_db(
+            verbosity=verbosity, autoclobber=True, serialize=False
+        )
+    finally:
+        test_settings['NAME'] = original_test_name
+        set_database_name(connection=connection, name=original_name)
+
+
+def setup_sqlite_database(
+    *, connection: BaseDatabaseWrapper, cache_dir: Path, fingerprint: str,
+    worker_id: str, rebuild: bool, verbosity: int
+) -> None:
+
+    """
+    Copy the SQLite template into a private in-memory database of the worker.
+
+    :param connection: The database connection.
+    :param cache_dir: The directory of the template files.
+    :param fingerprint: The fingerprint of the database schema.
+    :param worker_id: The id of the xdist worker.
+    :param rebuild: Whether to rebuild the template.
+    :param verbosity: The verbosity of the migrations.
+    """
+
+    template_path = cache_dir / f'{connection.alias}-{fingerprint}.sqlite3'
+
+    if rebuild or not template_path.exists():
+        building_path = template_path.with_suffix('.building')
+        build_template_database(
+            connection=connection, template_name=str(building_path),
+            verbosity=verbosity
+        )
+        building_path.replace(template_path)
+
+    # The shared cache in-memory database lives as long as the connection,
+    # which Django's SQLite backend never closes for in-memory databases.
+    set_database_name(
+        connection=connection,
+        name=f'file:memorydb_{connection.alias}_{worker_id}?mode=memory&cache=shared'
+    )
+    connection.ensure_connection()
+
+    template_database = sqlite3.connect(template_path)
+    try:
+        template_database.backup(connection.connection)
+    finally:
+        template_database.close()
+
+
+def setup_postgresql_database(
+    *, connection: BaseDatabaseWrapper, fingerprint: str, rebuild: bool,
+    verbosity: int
+) -> None:
+
+    """
+    Clone the PostgreSQL template into the test database of the worker.
+
+    :param connection: The database connection.
+    :param fingerprint: The fingerprint of the database schema.
+    :param rebuild: Whether to rebuild the template.
+    :param verbosity: The verbosity of the migrations.
+    """
+
+    quote_name = connection.ops.quote_name
+    test_database_name = connection.settings_dict['TEST']['NAME'] or (
+        TEST_DATABASE_PREFIX + connection.settings_dict['NAME']
+    )
+    template_name = f'test_{connection.settings_dict["NAME"]}_template_{fingerprint}'
+
+    with connection._nodb_cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_database WHERE datname = %s', [template_name]
+        )
+        template_exists = cursor.fetchone() is not None
+
+        if rebuild and template_exists:
+            cursor.execute(f'DROP DATABASE {quote_name(template_name)}')
+            template_exists = False
+
+    if not template_exists:
+        building_name = f'{template_name}_building'
+        build_template_database(
+            connection=connection, template_name=building_name, verbosity=verbosity
+        )
+
+        with connection._nodb_cursor() as cursor:
+            cursor.execute(
+                f'ALTER DATABASE {quote_name(building_name)} '
+                f'RENAME TO {quote_name(template_name)}'
+            )
+
+    with connection._nodb_cursor() as cursor:
+        cursor.execute(f'DROP DATABASE IF EXISTS {quote_name(test_database_name)}')
+        cursor.execute(
+            f'CREATE DATABASE {quote_name(test_database_name)} '
+            f'TEMPLATE {quote_name(template_name)}'
+        )
+
+    set_database_name(connection=connection, name=test_database_name)
+
+
+def get_rebuilt_marker_path(*, cache_dir: Path, run_id: str) -> Path:
+
+    """
+    Return the path of the file marking the templates as rebuilt during
+    a test run, so the other workers of the run don't rebuild them again.
+
+    :param cache_dir: The directory of the lock and the SQLite templates.
+    :param run_id: The id of the test run, shared by its workers.
+    :return: Path: The path of the marker file.
+    """
+
+    return cache_dir / f'template_databases_{run_id}.rebuilt'
+
+
+def setup_template_databases(
+    *, cache_dir: Path, worker_id: str, run_id: str, rebuild: bool, verbosity: int
+) -> DatabasesConfig:
+
+    """
+    Set up the test databases of a worker from the template databases,
+    building the templates first if needed.
+
+    The templates are built and cloned under a lock shared by the workers,
+    so only the first worker migrates them, and a rebuild is done once per
+    test run. The other database engines fall back to Django's regular test
+    database creation.
+
+    :param cache_dir: The directory of the lock and the SQLite templates.
+    :param worker_id: The id of the xdist worker.
+    :param run_id: The id of the test run, shared by its workers.
+    :param rebuild: Whether to rebuild the templates (pytest `--create-db`).
+    :param verbosity: The verbosity of the migrations.
+    :return: DatabasesConfig: The databases to pass to
+        `django.test.utils.teardown_databases`.
+    """
+
+    test_databases, mirrored_aliases = get_unique_databases_and_mirrors()
+    fingerprint = get_migrations_fingerprint()
+    databases_config: DatabasesConfig = []
+
+    with file_lock(cache_dir / 'template_databases.lock'):
+        rebuilt_path = get_rebuilt_marker_path(cache_dir=cache_dir, run_id=run_id)
+        rebuild = rebuild and not rebuilt_path.exists()
+
+        for _, aliases in test_databases.values():
+            first_alias, *other_aliases = aliases
+            connection = connections[first_alias]
+            databases_config.append(
+                (connection, connection.settings_dict['NAME'], True)
+            )
+
+            if connection.vendor == 'sqlite':
+                setup_sqlite_database(
+                    connection=connection, cache_dir=cache_dir,
+                    fingerprint=fingerprint, worker_id=worker_id,
+                    rebuild=rebuild, verbosity=verbosity
+                )
+            elif connection.vendor == 'postgresql':
+                setup_postgresql_database(
+                    connection=connection, fingerprint=fingerprint,
+                    rebuild=rebuild, verbosity=verbosity
+                )
+            else:
+                connection.creation.create_test_db(
+                    verbosity=verbosity, autoclobber=True, serialize=False
+                )
+
+            for alias in other_aliases:
+                mirror = connections[alias]
+                databases_config.append(
+                    (mirror, mirror.settings_dict['NAME'], False)
+                )
+                mirror.creation.set_as_test_mirror(connection.settings_dict)
+
+        if rebuild:
+            rebuilt_path.touch()
+
+    for alias, mirror_alias in mirrored_aliases.items():
+        connections[alias].creation.set_as_test_mirror(
+            connections[mirror_alias].settings_dict
+        )
+
+    return databases_config
@@ -0,0 +1,220 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+from unittest.mock import patch
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from django.core.management import call_command
+
+from src.config.celery import celery
+from src.djshop.catalog.models import Category, Image as ProductImage
+from src.djshop.maintenance.models import JobCheckpoint
+from src.djshop.maintenance.services import (
+    CATEGORY_TREE_JOB, IMAGE_HASHES_JOB, IMAGE_REHASH_DISPATCH_JOB,
+    dispatch_image_rehash, iterate_id_chunks, repair_category_tree,
+)
+from src.djshop.maintenance.tasks import repair_category_tree_task
+from src.djshop.media.models import Image
+from src.djshop.outbox.models import OutboxEvent
+from src.djshop.tests.factories.media_factories import sample_test_image_file
+
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+    from src.djshop.catalog.models import Product
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_repair_category_tree_return_success(
+    first_test_root_category: 'Category', settings: 'SettingsWrapper'
+) -> None:
+
+    """
+    Test that the drifted `depth` and `numchild` of the category nodes are
+    repaired from their paths, their edge cached pages purged, and that
+    the checkpoint is deleted once the run completes.
+
+    :param first_test_root_category: A fixture providing a root category.
+    :param settings: A fixture to override the Django settings.
+    """
+
+    settings.OUTBOX_RELAY_ON_COMMIT = False
+
+    first_child = cast('Category', first_test_root_category.add_child(
+        title='test first child', slug='test-first-child'
+    ))
+    second_child = cast('Category', first_test_root_category.add_child(
+        title='test second child', slug='test-second-child'
+    ))
+    grandchild = cast('Category', first_child.add_child(
+        title='test grandchild', slug='test-grandchild'
+    ))
+
+    Category.objects.filter(pk=first_test_root_category.pk).update(numchild=5)
+    Category.objects.filter(pk=first_child.pk).update(numchild=0)
+    Category.objects.filter(pk=grandchild.pk).update(depth=7)
+    OutboxEvent.objects.all().delete()
+
+    assert repair_category_tree(chunk_size=2) == 3
+
+    assert dict(Category.objects.values_list('pk', 'numchild')) == {
+        first_test_root_category.pk: 2, first_child.pk: 1,
+        second_child.pk: 0, grandchild.pk: 0,
+    }
+    assert Category.objects.get(pk=grandchild.pk).depth == 3
+    assert OutboxEvent.objects.filter(topic='cdn.purge').count() == 2
+    assert not JobCheckpoint.objects.exists()
+
+    assert repair_category_tree(chunk_size=2) == 0
+
+
+def test_iterate_id_chunks_resumes_from_checkpoint_return_success(
+    first_test_root_category: 'Category'
+) -> None:
+
+    """
+    Test that an interrupted job resumes after its last processed chunk.
+
+    :param first_test_root_category: A fixture providing a root category.
+    """
+
+    for index in range(4):
+        first_test_root_category.add_child(
+            title=f'test child {index}', slug=f'test-child-{index}'
+        )
+
+    category_ids = list(Category.objects.order_by('pk').values_list('pk', flat=True))
+
+    with pytest.raises(RuntimeError):
+        for chunk_index, chunk in enumerate(iterate_id_chunks(
+            job=CATEGORY_TREE_JOB, queryset=Category.objects.all(), chunk_size=2
+        )):
+            if chunk_index == 1:
+                raise RuntimeError('interrupted')
+
+    assert JobCheckpoint.objects.get(job=CATEGORY_TREE_JOB).last_id == \
+        category_ids[1]
+
+    assert list(iterate_id_chunks(
+        job=CATEGORY_TREE_JOB, queryset=Category.objects.all(), chunk_size=2
+    )) == [category_ids[2:4], category_ids[4:]]
+    assert not JobCheckpoint.objects.exists()
+
+
+def test_repair_category_tree_task_with_soft_time_limit_return_success(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    """
+    Test that a maintenance task stopped by its soft time limit is sent
+    again, to resume its job, and gives up after its maximum number of
+    resumes.
+
+    :param monkeypatch: A fixture to run the retries of the eager tasks,
+        which propagate their `Retry` otherwise.
+    """
+
+    monkeypatch.setitem(celery.conf, 'CELERY_TASK_EAGER_PROPAGATES', False)
+
+    with patch(
+        'src.djshop.maintenance.tasks.repair_category_tree',
+        side_effect=[SoftTimeLimitExceeded(), 0]
+    ) as repair_category_tree_mock:
+        result = repair_category_tree_task.delay()
+
+    assert result.successful()
+    assert repair_category_tree_mock.call_count == 2
+
+    with patch(
+        'src.djshop.maintenance.tasks.repair_category_tree',
+        side_effect=SoftTimeLimitExceeded()
+    ) as repair_category_tree_mock:
+        result = repair_category_tree_task.delay()
+
+    assert isinstance(result.result, SoftTimeLimitExceeded)
+    assert repair_category_tree_mock.call_count == \
+        repair_category_tree_task.max_retries + 1
+
+
+def test_dispatch_image_rehash_return_success(
+    settings: 'SettingsWrapper', tmp_path: Path
+) -> None:
+
+    """
+    Test that the images are sent to the rehash task under a checkpoint of
+    their own, so the checkpoint of the rehash job doesn't skip them.
+
+    :param settings: A fixture to override the Django settings.
+    :param tmp_path: A fixture providing a temporary directory.
+    """
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.IMAGE_RENDITION_WIDTHS = []
+
+    images = [
+        Image.objects.create(
+            title=f'test image {index}',
+            image=sample_test_image_file(width=10 + index, height=10)
+        )
+        for index in range(3)
+    ]
+    JobCheckpoint.objects.create(job=IMAGE_HASHES_JOB, last_id=images[-1].pk)
+
+    with patch(
+        'src.djshop.maintenance.services.send_batches'
+    ) as send_batches_mock:
+        assert dispatch_image_rehash(chunk_size=2) == 3
+
+    assert [
+        call.kwargs['identifiers'] for call in send_batches_mock.call_args_list
+    ] == [[images[0].pk, images[1].pk], [images[2].pk]]
+    assert JobCheckpoint.objects.get(job=IMAGE_HASHES_JOB).last_id == \
+        images[-1].pk
+    assert not JobCheckpoint.objects.filter(job=IMAGE_REHASH_DISPATCH_JOB).exists()
+
+
+def test_repair_catalog_command_images_return_success(
+    first_test_product: 'Product', settings: 'SettingsWrapper', tmp_path: Path,
+    capsys: pytest.CaptureFixture[str]
+) -> None:
+
+    """
+    Test that the command reports the images no product references, and
+    updates the stale file hashes, hashing the files in worker processes.
+
+    :param first_test_product: A fixture providing a product.
+    :param settings: A fixture to override the Django settings.
+    :param tmp_path: A fixture providing a temporary directory.
+    :param capsys: A fixture capturing the output of the command.
+    """
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.IMAGE_RENDITION_WIDTHS = []
+
+    images = [
+        Image.objects.create(
+            title=f'test image {index}',
+            image=sample_test_image_file(width=10 + index, height=10)
+        )
+        for index in range(3)
+    ]
+    ProductImage.objects.create(product=first_test_product, image=images[0])
+
+    file_hash, file_size = images[1].file_hash, images[1].file_size
+    Image.objects.filter(pk=images[1].pk).update(file_hash='stale', file_size=1)
+
+    call_command(
+        'repair_catalog', 'orphaned-images', 'image-hashes',
+        '--chunk-size', '2', '--processes', '2'
+    )
+
+    output = capsys.readouterr().out
+    assert '2 orphaned images found.' in output
+    assert '1 image hashes updated.' in output
+
+    images[1].refresh_from_db()
+    assert (images[1].file_hash, images[1].file_size) == (file_hash, file_size)
+    assert not JobCheckpoint.objects.exists()
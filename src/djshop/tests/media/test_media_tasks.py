@@ -0,0 +1,53 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from PIL import Image as PILImage  # type: ignore
+
+from src.djshop.media.models import Image
+from src.djshop.media.services import create_image_renditions
+from src.djshop.tests.factories.media_factories import sample_test_image_file
+
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_create_image_renditions_on_commit_return_success(
+    django_capture_on_commit_callbacks: Any, settings: 'SettingsWrapper',
+    tmp_path: Path
+) -> None:
+
+    """
+    Test that the renditions narrower than a saved image are created by
+    a task once the transaction commits, and that creating them again
+    is a no-op.
+
+    :param django_capture_on_commit_callbacks: pytest-django fixture
+        capturing the `transaction.on_commit` callbacks.
+    :param settings: A fixture to override the Django settings.
+    :param tmp_path: A fixture providing a temporary directory.
+    """
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.IMAGE_RENDITION_WIDTHS = [20, 50, 200]
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        image = Image.objects.create(
+            title='test image', image=sample_test_image_file(width=100, height=60)
+        )
+
+        assert not (tmp_path / 'renditions').exists()
+
+    assert len(callbacks) == 1
+
+    rendition_sizes = {
+        rendition_file.parent.name: PILImage.open(rendition_file).size
+        for rendition_file in (tmp_path / 'renditions').glob('*/*')
+    }
+    assert rendition_sizes == {'20': (20, 12), '50': (50, 30)}
+
+    assert create_image_renditions(image=image) == []
@@ -0,0 +1,145 @@
+from typing import TYPE_CHECKING, Optional
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework import status
+
+from src.djshop.cdn.tasks import purge_surrogate_keys_task
+
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from rest_framework.test import APIClient
+
+    from src.djshop.catalog.models import Category
+
+
+pytestmark = pytest.mark.django_db
+
+
+METRICS_URL = reverse('metrics')
+CATEGORY_FRONT_LIST_URL = reverse('api:catalog:front-category-list')
+
+
+def get_sample_value(name: str, **labels: str) -> float:
+
+    """
+    Return the current value of a metric sample, or zero if it was
+    never observed.
+
+    :param name: The name of the sample.
+    :param labels: The labels of the sample.
+    :return: float: The value of the sample.
+    """
+
+    value: Optional[float] = REGISTRY.get_sample_value(name, labels)
+    return value or 0
+
+
+@override_settings(METRICS_ALLOWED_IPS=['127.0.0.1'])
+def test_get_metrics_from_allowed_address_return_success(
+    api_client: 'APIClient', five_test_root_categories: 'QuerySet[Category]'
+) -> None:
+
+    """
+    Test that the metrics endpoint exposes the request latency and
+    the query count, labelled with the URL name.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    :param five_test_root_categories: A fixture providing five test root
+                                    category objects.
+    """
+
+    labels = {'method': 'GET', 'url_name': 'front-category-list', 'status': '200'}
+    request_count = get_sample_value(
+        'djshop_http_request_duration_seconds_count', **labels
+    )
+
+    api_client.get(path=CATEGORY_FRONT_LIST_URL)
+
+    assert get_sample_value(
+        'djshop_http_request_duration_seconds_count', **labels
+    ) == request_count + 1
+    assert get_sample_value(
+        'djshop_db_queries_per_request_count', url_name='front-category-list'
+    ) >= 1
+
+    response = api_client.get(path=METRICS_URL)
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'].startswith('text/plain')
+    assert b'djshop_http_request_duration_seconds_bucket' in response.content
+    assert b'url_name="front-category-list"' in response.content
+
+
+@override_settings(METRICS_ALLOWED_IPS=[], METRICS_AUTH_TOKEN='test-token')
+def test_get_metrics_from_unknown_address_return_error(
+    api_client: 'APIClient'
+) -> None:
+
+    """
+    Test that the metrics endpoint is hidden from clients that are neither
+    in the allowed addresses nor send the scrape token, including the
+    clients sending a wrong, non-ASCII token.
+
+    :param api_client (APIClient): The Django REST framework API client.
+    """
+
+    response = api_client.get(path=METRICS_URL)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = api_client.get(
+        path=METRICS_URL, HTTP_AUTHORIZATION='Bearer tést-token'
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = api_client.get(
+        path=METRICS_URL, HTTP_AUTHORIZATION='Bearer test-token'
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_cache_lookups_count_hits_and_misses_return_success() -> None:
+
+    """
+    Test that the cache backend counts the hits and the misses, and still
+    returns the default value on a miss.
+    """
+
+    hits = get_sample_value(
+        'djshop_cache_requests_total', cache='default', result='hit'
+    )
+    misses = get_sample_value(
+        'djshop_cache_requests_total', cache='default', result='miss'
+    )
+
+    assert cache.get('test-metrics-key', 'test-default') == 'test-default'
+    cache.set('test-metrics-key', None)
+    assert cache.get('test-metrics-key', 'test-default') is None
+
+    assert get_sample_value(
+        'djshop_cache_requests_total', cache='default', result='hit'
+    ) == hits + 1
+    assert get_sample_value(
+        'djshop_cache_requests_total', cache='default', result='miss'
+    ) == misses + 1
+
+
+def test_celery_task_runtime_is_recorded_return_success() -> None:
+
+    """
+    Test that the runtime of a Celery task is recorded with its final state.
+    """
+
+    labels = {'task': purge_surrogate_keys_task.name, 'state': 'SUCCESS'}
+    task_count = get_sample_value(
+        'djshop_celery_task_duration_seconds_count', **labels
+    )
+
+    purge_surrogate_keys_task.delay(surrogate_keys=['category:list'])
+
+    assert get_sample_value(
+        'djshop_celery_task_duration_seconds_count', **labels
+    ) == task_count + 1
@@ -0,0 +1,212 @@
+from datetime import timedelta
+from io import StringIO
+from typing import TYPE_CHECKING, Generator, cast
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+from kombu.exceptions import OperationalError
+
+from src.djshop.cdn.backends import LocalPurgeBackend
+from src.djshop.cdn.tasks import purge_surrogate_keys_task
+from src.djshop.outbox.models import OutboxEvent
+from src.djshop.outbox.services import (
+    delete_published_outbox_events, get_outbox_retry_delay, publish_event,
+    relay_outbox_events,
+)
+
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def outbox_relay_process(settings: 'SettingsWrapper') -> Generator[None, None, None]:
+
+    """
+    Leave the outbox events to the relay, as in production, and clear the
+    surrogate keys recorded by the local purge backend.
+
+    :param settings: A fixture to override the Django settings.
+    """
+
+    settings.OUTBOX_RELAY_ON_COMMIT = False
+    LocalPurgeBackend.reset()
+    yield
+    LocalPurgeBackend.reset()
+
+
+def test_relay_outbox_events_return_success() -> None:
+
+    """
+    Test that the events of the rolled back transactions are never written,
+    and that the pending events of a topic are published once, in a single
+    batched message.
+    """
+
+    try:
+        with transaction.atomic():
+            publish_event(topic='cdn.purge', identifiers=['category:9'])
+            raise ValueError
+    except ValueError:
+        pass
+
+    publish_event(topic='cdn.purge', identifiers=['category:1', 'category:list'])
+    publish_event(topic='cdn.purge', identifiers=['category:2', 'category:1'])
+    assert publish_event(topic='cdn.purge', identifiers=[]) is None
+
+    assert LocalPurgeBackend.purged_keys == []
+
+    with patch.object(
+        purge_surrogate_keys_task, 'apply_async',
+        wraps=purge_surrogate_keys_task.apply_async
+    ) as apply_async:
+        assert relay_outbox_events(batch_size=10) == 2
+
+    assert apply_async.call_count == 1
+    assert LocalPurgeBackend.purged_keys == [
+        'category:1', 'category:2', 'category:list'
+    ]
+    assert not OutboxEvent.objects.filter(published_at__isnull=True).exists()
+
+    assert relay_outbox_events(batch_size=10) == 0
+    assert len(LocalPurgeBackend.purged_keys) == 3
+
+
+def test_relay_outbox_events_with_broker_error_return_error() -> None:
+
+    """
+    Test that the events failing to be published stay pending, with the
+    error recorded, and are published by the first relay after their
+    retry delay.
+    """
+
+    event = cast(
+        OutboxEvent, publish_event(topic='cdn.purge', identifiers=['category:list'])
+    )
+
+    with patch.object(
+        purge_surrogate_keys_task, 'apply_async',
+        side_effect=OperationalError('broker unreachable')
+    ):
+        assert relay_outbox_events(batch_size=10) == 0
+
+    event.refresh_from_db()
+    assert event.published_at is None
+    assert event.attempts == 1
+    assert 'broker unreachable' in event.last_error
+    assert event.next_attempt_at > timezone.now()
+
+    assert relay_outbox_events(batch_size=10) == 0
+
+    OutboxEvent.objects.filter(pk=event.pk).update(next_attempt_at=timezone.now())
+    call_command('relay_outbox', once=True, stdout=StringIO())
+
+    event.refresh_from_db()
+    assert event.published_at is not None
+    assert LocalPurgeBackend.purged_keys == ['category:list']
+
+
+def test_relay_outbox_events_with_exhausted_events_return_success(
+    settings: 'SettingsWrapper'
+) -> None:
+
+    """
+    Test that the retry delay of an event doubles after every failed
+    attempt, that the events due first are published first, and that the
+    events out of attempts are given up.
+
+    :param settings: A fixture to override the Django settings.
+    """
+
+    settings.OUTBOX_MAX_ATTEMPTS = 3
+
+    assert [
+        get_outbox_retry_delay(attempts=attempts).total_seconds()
+        for attempts in (1, 2, 3)
+    ] == [
+        settings.OUTBOX_RETRY_DELAY,
+        settings.OUTBOX_RETRY_DELAY * 2,
+        settings.OUTBOX_RETRY_DELAY * 4,
+    ]
+    assert get_outbox_retry_delay(attempts=100).total_seconds() == \
+        settings.OUTBOX_RETRY_MAX_DELAY
+
+    exhausted_event = cast(
+        OutboxEvent, publish_event(topic='cdn.purge', identifiers=['category:1'])
+    )
+    late_event = cast(
+        OutboxEvent, publish_event(topic='cdn.purge', identifiers=['category:2'])
+    )
+    early_event = cast(
+        OutboxEvent, publish_event(topic='cdn.purge', identifiers=['category:3'])
+    )
+
+    OutboxEvent.objects.filter(pk=exhausted_event.pk).update(attempts=3)
+    OutboxEvent.objects.filter(pk=early_event.pk).update(
+        next_attempt_at=timezone.now() - timedelta(seconds=60)
+    )
+
+    assert relay_outbox_events(batch_size=1) == 1
+    assert LocalPurgeBackend.purged_keys == ['category:3']
+
+    assert relay_outbox_events(batch_size=10) == 1
+    assert LocalPurgeBackend.purged_keys == ['category:3', 'category:2']
+
+    exhausted_event.refresh_from_db()
+    late_event.refresh_from_db()
+    assert exhausted_event.published_at is None
+    assert late_event.published_at is not None
+
+
+def test_publish_event_with_unknown_topic_return_error() -> None:
+
+    """
+    Test that an event of an unknown topic is rejected when it is written.
+    """
+
+    with pytest.raises(KeyError):
+        publish_event(topic='unknown', identifiers=[1])
+
+    assert not OutboxEvent.objects.exists()
+
+
+def test_delete_published_outbox_events_return_success(
+    settings: 'SettingsWrapper'
+) -> None:
+
+    """
+    Test that only the events published before the retention period are
+    deleted.
+
+    :param settings: A fixture to override the Django settings.
+    """
+
+    settings.OUTBOX_RETENTION = 60
+
+    old_event = cast(
+        OutboxEvent, publish_event(topic='cdn.purge', identifiers=['category:1'])
+    )
+    recent_event = cast(
+        OutboxEvent, publish_event(topic='cdn.purge', identifiers=['category:2'])
+    )
+    pending_event = cast(
+        OutboxEvent, publish_event(topic='cdn.purge', identifiers=['category:3'])
+    )
+
+    OutboxEvent.objects.filter(pk=old_event.pk).update(
+        published_at=timezone.now() - timedelta(seconds=120)
+    )
+    OutboxEvent.objects.filter(pk=recent_event.pk).update(
+        published_at=timezone.now()
+    )
+
+    assert delete_published_outbox_events() == 1
+    assert set(OutboxEvent.objects.values_list('pk', flat=True)) == {
+        recent_event.pk, pending_event.pk
+    }
@@ -0,0 +1,56 @@
+from typing import Any, Dict
+
+from django.db import connections
+
+
+# Connection counts per state, for the current database only.
+POSTGRES_CONNECTION_STATES_SQL = """
+    SELECT COALESCE(state, 'unknown'), COUNT(*)
+    FROM pg_stat_activity
+    WHERE datname = current_database()
+    GROUP BY state
+"""
+
+
+def get_connection_stats(*, alias: str = 'default') -> Dict[str, Any]:
+
+    """
+    Collect the connection management settings and the pool usage
+    of a database.
+
+    On PostgreSQL, the server side connection counts per state
+    (`active`, `idle`, `idle in transaction`...) are read from
+    `pg_stat_activity`, alongside `max_connections`. Behind PgBouncer
+    these are the server connections opened by the pooler.
+
+    :param alias: The alias of the database in `DATABASES`.
+
+    :return: Dict[str, Any]: The connection settings and usage of the database.
+    """
+
+    connection = connections[alias]
+    settings_dict = connection.settings_dict
+
+    connection_stats: Dict[str, Any] = {
+        'alias': alias,
+        'vendor': connection.vendor,
+        'conn_max_age': settings_dict['CONN_MAX_AGE'],
+        'conn_health_checks': settings_dict['CONN_HEALTH_CHECKS'],
+        'server_side_cursors': not settings_dict.get(
+            'DISABLE_SERVER_SIDE_CURSORS', False
+        ),
+        'connection_states': {},
+        'max_connections': None,
+    }
+
+    if connection.vendor != 'postgresql':
+        return connection_stats
+
+    with connection.cursor() as cursor:
+        cursor.execute(POSTGRES_CONNECTION_STATES_SQL)
+        connection_stats['connection_states'] = dict(cursor.fetchall())
+
+        cursor.execute('SHOW max_connections')
+        connection_stats['max_connections'] = int(cursor.fetchone()[0])
+
+    return connection_stats
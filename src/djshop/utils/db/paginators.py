@@ -0,0 +1,81 @@
+from typing import Any, Optional, cast
+
+import django_stubs_ext
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+django_stubs_ext.monkeypatch()
+
+
+# Planner estimate of the number of rows of a table, kept up to date by
+# autovacuum/ANALYZE. -1 means the table was never analyzed.
+POSTGRES_ESTIMATED_COUNT_SQL = """
+    SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass
+"""
+
+
+class EstimatedCountPaginator(Paginator[Any]):
+
+    """
+    Paginator which doesn't count the rows of large unfiltered tables.
+
+    `COUNT(*)` scans the whole table on PostgreSQL. When the queryset isn't
+    filtered, the row count estimated by the planner (`pg_class.reltuples`)
+    is used instead, as soon as it exceeds `estimate_threshold`. Smaller
+    tables, filtered querysets and other databases are counted exactly.
+
+    Meant for the admin changelists (`ModelAdmin.paginator`), together with
+    `show_full_result_count = False`.
+    """
+
+    estimate_threshold = 10_000
+
+    @cached_property
+    def count(self) -> int:
+
+        """
+        Return the total number of objects, estimated for large tables.
+
+        :return: int: The (estimated) number of objects.
+        """
+
+        estimated_count = self.get_estimated_count()
+
+        if estimated_count is not None and estimated_count > self.estimate_threshold:
+            return estimated_count
+
+        return super().count
+
+    def get_estimated_count(self) -> Optional[int]:
+
+        """
+        Read the planner estimate of the row count of an unfiltered queryset.
+
+        :return: Optional[int]: The estimated row count, None if it can't be
+            estimated.
+        """
+
+        # Only the querysets can be estimated, the lists are counted.
+        if not hasattr(self.object_list, 'query'):
+            return None
+
+        object_list = cast('QuerySet[Any]', self.object_list)
+        if object_list.query.where or object_list.query.is_sliced or \
+                object_list.query.distinct:
+            return None
+
+        connection = connections[object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                POSTGRES_ESTIMATED_COUNT_SQL,
+                [connection.ops.quote_name(object_list.model._meta.db_table)]
+            )
+            row = cursor.fetchone()
+
+        return int(row[0]) if row and row[0] >= 0 else None
@@ -0,0 +1,114 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generator, Optional, Type
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+
+# Whether the reads of the current request (or task) must go to the primary,
+# e.g. because the client has just written and the replicas may lag behind.
+_primary_pinned: ContextVar[bool] = ContextVar('primary_pinned', default=False)
+
+
+def is_primary_pinned() -> bool:
+
+    """
+    Check whether the reads of the current context are pinned to the primary.
+
+    :return: bool: True if the reads must go to the primary database.
+    """
+
+    return _primary_pinned.get()
+
+
+@contextmanager
+def pin_primary(pinned: bool = True) -> Generator[None, None, None]:
+
+    """
+    Context manager pinning (or unpinning) the reads of the current
+    context to the primary database.
+
+    :param pinned: Whether the reads must go to the primary database.
+    """
+
+    token = _primary_pinned.set(pinned)
+
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+def get_read_database_alias() -> str:
+
+    """
+    Return the database alias that read-only selectors should query.
+
+    A random replica from `DATABASE_REPLICAS` is picked, unless there is
+    none configured or the current context is pinned to the primary.
+
+    :return: str: The database alias to read from.
+    """
+
+    database_replicas = settings.DATABASE_REPLICAS
+
+    if not database_replicas or is_primary_pinned():
+        return DEFAULT_DB_ALIAS
+
+    return random.choice(database_replicas)
+
+
+class PrimaryReplicaRouter:
+
+    """
+    Database router for a primary database with read replicas.
+
+    Every query goes to the primary, except for the read-only selectors
+    which explicitly read from `get_read_database_alias()`. Objects loaded
+    from a replica keep reading their relations from the same replica,
+    and replicas are never written to nor migrated.
+    """
+
+    def db_for_read(self, model: Type[Model], **hints: Any) -> str:
+
+        """
+        Route reads to the database the related instance was loaded from,
+        or to the primary.
+        """
+
+        instance: Optional[Model] = hints.get('instance')
+
+        if instance is not None and instance._state.db is not None:
+            return instance._state.db
+
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: Type[Model], **hints: Any) -> str:
+
+        """
+        Route all writes to the primary.
+        """
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool:
+
+        """
+        Allow relations between objects of the primary and its replicas,
+        as they hold the same data.
+        """
+
+        database_aliases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        return obj1._state.db in database_aliases and \
+            obj2._state.db in database_aliases
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool:
+
+        """
+        Only migrate the primary, the replicas get the schema by replication.
+        """
+
+        return db not in settings.DATABASE_REPLICAS
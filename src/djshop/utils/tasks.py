@@ -0,0 +1,186 @@
+"""
+Dispatching of the background side effects to Celery.
+
+The side effects of a write (cache purges, image renditions...) are sent
+once the transaction commits, so a task never reads uncommitted data, and
+the identifiers sent to a task during a transaction are coalesced into
+a few batched messages, instead of one message per write.
+
+Every message carries an idempotency key, so a message delivered twice
+(the tasks are acknowledged late, so a message is redelivered when a
+worker is lost) only runs once.
+"""
+
+import uuid
+from typing import Any, Iterable, List, Optional, Set
+
+from celery import Task
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+
+class IdempotentTask(Task):  # type: ignore[misc]
+
+    """
+    Base class of the tasks which skip the messages they already ran.
+
+    The `idempotency_key` keyword argument of a message is recorded in the
+    cache once the task succeeds, and a message with a recorded key isn't
+    run again. A failed run isn't recorded, so it can be retried.
+    """
+
+    # The arguments are not checked against the signature of `run`, which
+    # doesn't take the `idempotency_key`.
+    typing = False
+
+    def __call__(
+        self, *args: Any, idempotency_key: Optional[str] = None, **kwargs: Any
+    ) -> Any:
+
+        """
+        Run the task, unless its message already ran.
+
+        :param args: The positional arguments of the task.
+        :param idempotency_key: The key of the message, None to always run.
+        :param kwargs: The keyword arguments of the task.
+        :return: Any: The result of the task, None if it is skipped.
+        """
+
+        if idempotency_key is None:
+            return super().__call__(*args, **kwargs)
+
+        cache_key = f'task:done:{self.name}:{idempotency_key}'
+        if cache.get(cache_key) is not None:
+            return None
+
+        result = super().__call__(*args, **kwargs)
+        cache.set(cache_key, 1, timeout=settings.CELERY_TASK_IDEMPOTENCY_TTL)
+
+        return result
+
+
+def get_batches(
+    *, identifiers: Iterable[Any], batch_size: int
+) -> List[List[Any]]:
+
+    """
+    Split the sorted, unique identifiers into batches.
+
+    :param identifiers: The identifiers, possibly duplicated.
+    :param batch_size: The maximum number of identifiers of a batch.
+    :return: List[List[Any]]: The batches.
+    """
+
+    unique_identifiers = sorted(set(identifiers))
+
+    return [
+        unique_identifiers[index:index + batch_size]
+        for index in range(0, len(unique_identifiers), batch_size)
+    ]
+
+
+def send_batches(
+    *, task: Task, identifiers: Iterable[Any], idempotency_key: Optional[str] = None
+) -> None:
+
+    """
+    Send the identifiers to a task, in batched messages with their own
+    idempotency key.
+
+    :param task: The task, its first argument is the list of identifiers.
+    :param identifiers: The identifiers to be sent.
+    :param idempotency_key: The key the keys of the messages are derived
+        from, so sending the same identifiers again is a no-op. None for
+        random keys.
+    """
+
+    for index, batch in enumerate(get_batches(
+        identifiers=identifiers, batch_size=settings.CELERY_TASK_BATCH_SIZE
+    )):
+        task.apply_async(args=(batch,), kwargs={
+            'idempotency_key': (
+                f'{idempotency_key}:{index}' if idempotency_key is not None
+                else uuid.uuid4().hex
+            )
+        })
+
+
+class PendingBatch:
+
+    """
+    The identifiers enqueued for a task during a transaction, sent by its
+    `on_commit` callback.
+
+    Attributes:
+        task (Task): The task, its first argument is the list of identifiers.
+        identifiers (Set[Any]): The enqueued identifiers.
+        is_sent (bool): Whether the identifiers are sent.
+    """
+
+    def __init__(self, *, task: Task) -> None:
+        self.task = task
+        self.identifiers: Set[Any] = set()
+        self.is_sent = False
+
+    def __call__(self) -> None:
+        self.is_sent = True
+        send_batches(task=self.task, identifiers=self.identifiers)
+
+
+def get_pending_batch(*, task: Task, using: str) -> Optional[PendingBatch]:
+
+    """
+    Return the batch of a task pending on the current transaction.
+
+    The batch is looked up in the `on_commit` callbacks of the connection,
+    which Django discards along with a rolled back transaction or savepoint.
+
+    :param task: The task.
+    :param using: The alias of the database of the transaction.
+    :return: Optional[PendingBatch]: The pending batch, None if there's none.
+    """
+
+    for on_commit_callback in reversed(connections[using].run_on_commit):
+        callback = on_commit_callback[1]
+        if (
+            isinstance(callback, PendingBatch) and callback.task is task and
+            not callback.is_sent
+        ):
+            return callback
+
+    return None
+
+
+def enqueue_on_commit(
+    *, task: Task, identifiers: Iterable[Any], using: str = DEFAULT_DB_ALIAS
+) -> None:
+
+    """
+    Send the identifiers to a task once the current transaction commits,
+    coalesced with the identifiers enqueued for it during the transaction.
+
+    Outside a transaction, they are sent right away.
+
+    The identifiers enqueued in a rolled back savepoint are still sent, if
+    the task had a batch pending before the savepoint, which only repeats
+    a side effect.
+
+    :param task: The task, its first argument is the list of identifiers.
+    :param identifiers: The identifiers to be sent.
+    :param using: The alias of the database of the transaction.
+    """
+
+    identifiers = list(identifiers)
+    if not identifiers:
+        return
+
+    pending_batch = get_pending_batch(task=task, using=using)
+
+    if pending_batch is not None:
+        pending_batch.identifiers.update(identifiers)
+        return
+
+    pending_batch = PendingBatch(task=task)
+    pending_batch.identifiers.update(identifiers)
+    transaction.on_commit(pending_batch, using=using)
@@ -0,0 +1,31 @@
+from functools import lru_cache
+from typing import Any, Callable, cast
+
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.module_loading import import_string
+
+
+def lazy_view(view_path: str, **initkwargs: Any) -> Callable[..., HttpResponseBase]:
+
+    """
+    Return a view which imports a class-based view on its first request,
+    for the rarely used views whose modules are slow to import (e.g. the
+    OpenAPI schema views), so they don't slow the URLconf loading down.
+
+    :param view_path: The dotted path of the class-based view.
+    :param initkwargs: The keyword arguments of its `as_view`.
+    :return: Callable[..., HttpResponseBase]: The view function.
+    """
+
+    @lru_cache(maxsize=None)
+    def get_view() -> Callable[..., HttpResponseBase]:
+        return cast(
+            Callable[..., HttpResponseBase],
+            import_string(view_path).as_view(**initkwargs)
+        )
+
+    def view(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        return get_view()(request, *args, **kwargs)
+
+    return view